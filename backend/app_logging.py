@@ -0,0 +1,263 @@
+"""
+구조화된 비동기 로깅
+로그 레코드를 크기가 제한된 큐에 넣고 별도 스레드(QueueListener)가 JSON 한 줄로 출력합니다.
+요청 처리 경로에서는 stdout/stderr에 직접 쓰지 않으며, 큐가 가득 차면 기다리지 않고 버립니다.
+
+- 모든 레코드에 요청 id(`X-Request-ID`), 메서드, 라우트 템플릿을 붙입니다.
+- 필드는 호출한 스레드에서 정리한 뒤 큐에 넣습니다. 비밀번호, 토큰, 이미지 같은 키는 값 대신
+  길이만 남기고, 긴 문자열은 잘라 원본 페이로드가 큐에 남지 않게 합니다.
+- 잘못된 토큰처럼 자주 반복되는 경로는 이벤트별로 일정 시간 동안 일정 개수만 기록하고,
+  생략한 개수는 다음 레코드의 `suppressed` 필드로 알려 줍니다.
+
+| 환경 변수 | 기본값 |
+|-----------|--------|
+| LOG_LEVEL | INFO |
+| LOG_QUEUE_SIZE | 10000 |
+| LOG_SAMPLE_LIMIT / LOG_SAMPLE_WINDOW_SECONDS | 10 / 60 (이벤트별 창마다 최대 기록 수 / 창 길이) |
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import threading
+import time
+import traceback
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import metrics
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_SAMPLE_LIMIT = int(os.getenv("LOG_SAMPLE_LIMIT", "10"))
+LOG_SAMPLE_WINDOW_SECONDS = float(os.getenv("LOG_SAMPLE_WINDOW_SECONDS", "60"))
+
+LOGGER_NAME = "mentor_mentee"
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# 값을 기록하지 않는 키 (소문자 비교, 부분 일치)
+REDACTED_KEYS = ("password", "token", "authorization", "secret", "image", "cookie")
+MAX_FIELD_LENGTH = 256
+MAX_COLLECTION_ITEMS = 20
+MAX_DEPTH = 3
+MAX_TRACEBACK_LENGTH = 4000
+
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+# ---- 필드 정리 ----
+
+def _truncate(text: str, limit: int = MAX_FIELD_LENGTH) -> str:
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}…(+{len(text) - limit} chars)"
+
+def _redacted(value: Any) -> str:
+    size = len(value) if isinstance(value, (str, bytes, bytearray)) else None
+    return f"[redacted {size} chars]" if size is not None else "[redacted]"
+
+def _is_secret(key: str) -> bool:
+    lowered = key.lower()
+    return any(name in lowered for name in REDACTED_KEYS)
+
+def sanitize(value: Any, depth: int = 0) -> Any:
+    """JSON으로 쓸 수 있고 크기가 제한된 값으로 변환 (비밀 키는 가림)"""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return _truncate(value)
+    if isinstance(value, (bytes, bytearray)):
+        return f"[{len(value)} bytes]"
+    if depth >= MAX_DEPTH:
+        return _truncate(repr(value))
+    if isinstance(value, dict):
+        items = list(value.items())
+        result = {
+            str(key): _redacted(item) if _is_secret(str(key)) else sanitize(item, depth + 1)
+            for key, item in items[:MAX_COLLECTION_ITEMS]
+        }
+        if len(items) > MAX_COLLECTION_ITEMS:
+            result["…"] = f"+{len(items) - MAX_COLLECTION_ITEMS} keys"
+        return result
+    if isinstance(value, (list, tuple, set)):
+        items = list(value)
+        result = [sanitize(item, depth + 1) for item in items[:MAX_COLLECTION_ITEMS]]
+        if len(items) > MAX_COLLECTION_ITEMS:
+            result.append(f"…(+{len(items) - MAX_COLLECTION_ITEMS} items)")
+        return result
+    if isinstance(value, BaseException):
+        return _truncate(f"{type(value).__name__}: {value}")
+    return _truncate(str(value))
+
+# ---- 요청 컨텍스트 ----
+
+_request_context: ContextVar[Optional[dict]] = ContextVar("log_request_context", default=None)
+
+def current_request_id() -> Optional[str]:
+    context = _request_context.get()
+    return context["request_id"] if context else None
+
+class RequestContextMiddleware:
+    """요청 id를 정하고(클라이언트 값이 유효하면 재사용) 응답 헤더와 로그 컨텍스트에 넣는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                candidate = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.match(candidate):
+                    request_id = candidate
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex
+        encoded = request_id.encode("ascii")
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", ()), (b"x-request-id", encoded)]}
+            await send(message)
+
+        token = _request_context.set({"request_id": request_id, "scope": scope})
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            _request_context.reset(token)
+
+# ---- 샘플링 ----
+
+class Sampler:
+    """이벤트별로 창(window)마다 limit개까지만 허용"""
+
+    def __init__(self, limit: int, window_seconds: float):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._windows: Dict[str, list] = {}  # 이벤트 -> [창 시작, 허용 수, 생략 수]
+        self._lock = threading.Lock()
+        self.suppressed_total = 0
+
+    def allow(self, key: str) -> Optional[int]:
+        """기록해도 되면 그동안 생략한 개수를, 생략해야 하면 None을 반환"""
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.window_seconds:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                return suppressed
+            if window[1] < self.limit:
+                window[1] += 1
+                suppressed, window[2] = window[2], 0
+                return suppressed
+            window[2] += 1
+            self.suppressed_total += 1
+            return None
+
+sampler = Sampler(LOG_SAMPLE_LIMIT, LOG_SAMPLE_WINDOW_SECONDS)
+
+def log_event(logger: logging.Logger, level: int, event: str, *, sample: bool = False,
+              exc_info: Optional[BaseException] = None, **fields):
+    """구조화된 이벤트 기록 (sample=True면 이벤트별 샘플링)"""
+    if not logger.isEnabledFor(level):
+        return
+    if sample:
+        suppressed = sampler.allow(event)
+        if suppressed is None:
+            return
+        if suppressed:
+            fields["suppressed"] = suppressed
+    logger.log(level, event, extra={"fields": fields}, exc_info=exc_info)
+
+# ---- 핸들러 ----
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """호출한 스레드에서 레코드를 정리하여 큐에 넣고, 큐가 가득 차면 버림"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": _truncate(record.getMessage()),
+        }
+        context = _request_context.get()
+        if context is not None:
+            scope = context["scope"]
+            payload["request_id"] = context["request_id"]
+            payload["method"] = scope.get("method")
+            payload["route"] = getattr(scope.get("route"), "path", None)
+        fields = getattr(record, "fields", None)
+        if fields:
+            payload.update(sanitize(fields))
+        if record.exc_info:
+            payload["exc"] = _truncate(
+                "".join(traceback.format_exception(*record.exc_info)), MAX_TRACEBACK_LENGTH
+            )
+        # 원본 인자/예외를 큐에 남기지 않도록 정리된 페이로드만 전달
+        prepared = logging.makeLogRecord({"name": record.name, "levelno": record.levelno,
+                                          "levelname": record.levelname, "msg": record.msg})
+        prepared.payload = payload
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = getattr(record, "payload", None)
+        if payload is None:
+            payload = {"level": record.levelname, "logger": record.name, "event": record.getMessage()}
+        return json.dumps(payload, ensure_ascii=False, default=str, separators=(",", ":"))
+
+_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def configure(stream=None) -> DroppingQueueHandler:
+    """mentor_mentee 로거에 큐 핸들러를 연결하고 출력 스레드를 시작 (여러 번 호출해도 한 번만 설정)"""
+    global _handler, _listener
+    if _handler is not None:
+        return _handler
+    log_queue: queue.Queue = queue.Queue(LOG_QUEUE_SIZE)
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter())
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=False)
+    _listener.start()
+    atexit.register(_listener.stop)  # 종료 시 남은 레코드 출력
+
+    _handler = DroppingQueueHandler(log_queue)
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(LOG_LEVEL)
+    logger.addHandler(_handler)
+    logger.propagate = False
+
+    metrics.registry.add_collector(
+        "log_records_dropped_total", "counter", "Log records dropped because the log queue was full.",
+        lambda: [({}, _handler.dropped)],
+    )
+    metrics.registry.add_collector(
+        "log_records_suppressed_total", "counter", "Log records skipped by per-event sampling.",
+        lambda: [({}, sampler.suppressed_total)],
+    )
+    return _handler
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+동시 접속 처리량 벤치마크
+여러 클라이언트가 동시에 인증이 필요한 조회 API(/api/me, /api/mentors,
+/api/match-requests/outgoing)를 반복 호출할 때의 초당 요청 수와 지연 시간을 측정합니다.
+
+- async: 현재 앱 (AsyncSession, aiosqlite)
+- sync: 비동기 세션 도입 전 구조를 재현한 앱. 동기 Session 의존성과 인증은 스레드 풀에서,
+  async 엔드포인트 안의 쿼리는 이벤트 루프에서 블로킹으로 실행되며 기본 커넥션 풀을 사용합니다.
+  풀이 바닥나면 이벤트 루프가 커넥션 대기(기본 30초) 동안 멈추므로 측정 시간보다 훨씬 오래 걸립니다
+  (50 클라이언트 기준 약 5분). --pool-timeout을 줄이면 빨리 끝나지만 500 응답이 늘어납니다.
+
+사용법:
+    python -m benchmarks.bench_concurrency [--clients 50] [--duration 10] [--mentors 200] [--mode both] [--pool-timeout 30]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from jose import JWTError, jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.common import use_temp_storage, asgi_client, timed, summarize, format_summary, create_user, auth_headers
+
+use_temp_storage()
+
+import main
+
+ENDPOINTS = ["/api/me", "/api/mentors?limit=20", "/api/match-requests/outgoing"]
+
+def build_sync_app(pool_timeout: float = 30) -> FastAPI:
+    """비동기 세션 도입 전의 동기 세션 핸들러로 같은 엔드포인트를 제공하는 앱"""
+    engine = create_engine(main.SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False},
+                           pool_timeout=pool_timeout)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def internal_error(request: Request, call_next):
+        # 당시 엔드포인트처럼 커넥션 풀 타임아웃 등은 500으로 응답
+        try:
+            return await call_next(request)
+        except Exception:
+            return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def get_current_user(request: Request, db: Session = Depends(get_db)) -> main.Principal:
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        cache_key = main.token_key(token)
+        principal = main.token_cache.get(cache_key)
+        if principal is not None:
+            return principal
+        try:
+            payload = jwt.decode(token, main.SECRET_KEY, algorithms=[main.ALGORITHM], options={"verify_aud": False})
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Could not validate credentials")
+        user = db.query(main.User.id, main.User.role, main.User.email, main.User.name).filter(
+            main.User.id == int(payload["sub"])
+        ).first()
+        if user is None:
+            raise HTTPException(status_code=401, detail="Could not validate credentials")
+        principal = main.Principal(id=user.id, role=user.role, email=user.email, name=user.name)
+        main.token_cache.put(cache_key, principal, expires_at=payload["exp"])
+        return principal
+
+    @app.get("/api/me")
+    async def get_me(principal: main.Principal = Depends(get_current_user), db: Session = Depends(get_db)):
+        user = db.query(main.User).filter(main.User.id == principal.id).first()
+        return {"id": user.id, "email": user.email, "role": user.role,
+                "profile": {"name": user.name or "", "bio": user.bio or "", "imageUrl": main.profile_image_url(user)}}
+
+    @app.get("/api/mentors")
+    async def get_mentors(limit: int = 20, principal: main.Principal = Depends(get_current_user),
+                          db: Session = Depends(get_db)):
+        mentors = db.query(main.User).filter(main.User.role == "mentor").order_by(main.User.id).limit(limit).all()
+        return [
+            {"id": mentor.id, "email": mentor.email, "role": mentor.role,
+             "profile": {"name": mentor.name or "", "bio": mentor.bio or "",
+                         "imageUrl": main.profile_image_url(mentor), "skills": json.loads(mentor.skills or "[]")}}
+            for mentor in mentors
+        ]
+
+    @app.get("/api/match-requests/outgoing")
+    async def get_outgoing(principal: main.Principal = Depends(get_current_user), db: Session = Depends(get_db)):
+        requests = db.query(main.MatchRequest).filter(main.MatchRequest.mentee_id == principal.id).all()
+        return [{"id": req.id, "mentorId": req.mentor_id, "menteeId": req.mentee_id,
+                 "message": req.message, "status": req.status} for req in requests]
+
+    return app
+
+async def client_loop(client, headers, deadline: float, latencies, statuses):
+    i = 0
+    while time.perf_counter() < deadline:
+        response = await timed(lambda: client.get(ENDPOINTS[i % len(ENDPOINTS)], headers=headers), latencies)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        i += 1
+
+async def measure(app, mentees, duration: float) -> dict:
+    main.token_cache.clear()
+    async with asgi_client(app) as client:
+        latencies, statuses = [], {}
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            client_loop(client, auth_headers(main, mentee), deadline, latencies, statuses)
+            for mentee in mentees
+        ])
+        elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed, "latencies": latencies, "statuses": statuses, "rps": len(latencies) / elapsed}
+
+async def run(clients: int, duration: float, mentors: int, mode: str, pool_timeout: float):
+    password_hash = main.get_password_hash("password123")
+    for i in range(mentors):
+        create_user(main, "mentor", f"mentor{i}@example.com", password_hash,
+                    bio="멘토 소개", skills=json.dumps(["Python", "React"]))
+    mentees = [create_user(main, "mentee", f"mentee{i}@example.com", password_hash) for i in range(clients)]
+
+    apps = {"sync": lambda: build_sync_app(pool_timeout), "async": lambda: main.app}
+    modes = ["sync", "async"] if mode == "both" else [mode]
+    print(f"동시 클라이언트 {clients}, 멘토 {mentors}명, 모드별 {duration:.0f}초")
+    results = {}
+    for name in modes:
+        result = results[name] = await measure(apps[name](), mentees, duration)
+        print(f"\n[{name}] {result['elapsed']:.1f}초")
+        print(format_summary("요청 지연 시간", summarize(result["latencies"])))
+        print(f"처리량: {result['rps']:.1f} req/s, 응답 코드: {result['statuses']}")
+
+    if len(results) == 2:
+        before, after = results["sync"]["rps"], results["async"]["rps"]
+        ratio = f" ({after / before:.0f}배)" if before else ""
+        print(f"\n처리량 비교: sync {before:.1f} req/s -> async {after:.1f} req/s{ratio}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50, help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10, help="모드별 측정 시간(초)")
+    parser.add_argument("--mentors", type=int, default=200, help="멘토 수")
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both",
+                        help="sync: 비동기 세션 도입 전 핸들러, async: 현재 앱, both: 둘 다 측정하여 비교")
+    parser.add_argument("--pool-timeout", type=float, default=30,
+                        help="sync 모드의 커넥션 풀 대기 시간(초), 기본값은 당시 설정과 같은 30초")
+    args = parser.parse_args()
+    asyncio.run(run(args.clients, args.duration, args.mentors, args.mode, args.pool_timeout))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+로그인 폭주 중 /api/mentors 지연 시간 벤치마크
+동시에 대량의 로그인 요청(bcrypt 검증)을 보내는 동안 같은 워커에서 처리되는
+/api/mentors의 p50/p95/p99 지연 시간을 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_login_storm [--logins 200] [--probes 300]
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks.common import use_temp_storage, asgi_client, timed, summarize, format_summary, create_user, auth_headers
+
+use_temp_storage()
+
+import main
+
+async def probe_mentors(client, headers, count: int, latencies):
+    for _ in range(count):
+        await timed(lambda: client.get("/api/mentors", headers=headers), latencies)
+        await asyncio.sleep(0.002)
+
+async def run(logins: int, probes: int):
+    password_hash = main.get_password_hash("password123")
+    mentee = create_user(main, "mentee", "probe@example.com", password_hash)
+    for i in range(20):
+        create_user(main, "mentor", f"mentor{i}@example.com", password_hash,
+                    skills=json.dumps(["Python", "React"]))
+    print(f"비밀번호 풀: {main.password_workers.stats()['kind']} x {main.password_workers.max_workers}, "
+          f"대기열 {main.password_workers.max_queue}, 동시 로그인 {logins}")
+    
+    async with asgi_client(main.app) as client:
+        headers = auth_headers(main, mentee)
+        idle = []
+        await probe_mentors(client, headers, probes, idle)
+        print(format_summary("/api/mentors (로그인 없음)", summarize(idle)))
+        
+        login_latencies = []
+        login_tasks = [
+            asyncio.create_task(timed(
+                lambda: client.post("/api/login", json={"email": "probe@example.com", "password": "password123"}),
+                login_latencies,
+            ))
+            for _ in range(logins)
+        ]
+        busy = []
+        await probe_mentors(client, headers, probes, busy)
+        responses = await asyncio.gather(*login_tasks)
+        
+        print(format_summary(f"/api/mentors (로그인 {logins}건 중)", summarize(busy)))
+        print(format_summary("/api/login", summarize(login_latencies)))
+        statuses = {}
+        for response in responses:
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        print(f"로그인 응답 코드: {statuses}")
+        print(f"비밀번호 풀 통계: {main.password_workers.stats()}")
+    await main.shutdown_workers()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200, help="동시 로그인 수")
+    parser.add_argument("--probes", type=int, default=300, help="/api/mentors 측정 요청 수")
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.probes))
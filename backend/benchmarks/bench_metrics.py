@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+메트릭 계측 오버헤드 벤치마크
+아무 일도 하지 않는 ASGI 앱을 MetricsMiddleware로 감쌌을 때와 감싸지 않았을 때의 요청당 시간 차이,
+히스토그램 observe 비용, SQLAlchemy 쿼리 이벤트 비용, /metrics 렌더링 시간을 측정합니다.
+요청당 오버헤드는 수 µs 이내여야 합니다.
+
+사용법:
+    python -m benchmarks.bench_metrics [--requests 200000] [--queries 50000]
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+
+from benchmarks.common import use_temp_storage
+
+use_temp_storage()
+
+import metrics
+
+ROUTE = SimpleNamespace(path="/api/bench")
+
+async def noop_app(scope, receive, send):
+    scope["route"] = ROUTE
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+async def send(message):
+    pass
+
+async def per_request_seconds(app, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app({"type": "http", "method": "GET", "path": "/api/bench"}, receive, send)
+    return (time.perf_counter() - started) / requests
+
+def per_query_seconds(engine, queries: int) -> float:
+    with engine.connect() as conn:
+        statement = text("SELECT 1")
+        started = time.perf_counter()
+        for _ in range(queries):
+            conn.execute(statement).scalar()
+        return (time.perf_counter() - started) / queries
+
+async def run(requests: int, queries: int, repeat: int):
+    wrapped = metrics.MetricsMiddleware(noop_app)
+    # 워밍업 후 여러 번 측정하여 최솟값 사용 (스케줄링 잡음 제거)
+    await per_request_seconds(noop_app, 1000)
+    await per_request_seconds(wrapped, 1000)
+    bare = min([await per_request_seconds(noop_app, requests) for _ in range(repeat)])
+    instrumented = min([await per_request_seconds(wrapped, requests) for _ in range(repeat)])
+    print(f"ASGI 요청 (계측 없음)       {bare * 1e6:8.2f}µs")
+    print(f"ASGI 요청 (MetricsMiddleware) {instrumented * 1e6:8.2f}µs")
+    print(f"  요청당 오버헤드            {(instrumented - bare) * 1e6:8.2f}µs")
+
+    histogram = metrics.Histogram("bench_seconds", "bench", ("route",))
+    child = histogram.labels("/api/bench")
+    started = time.perf_counter()
+    for i in range(requests):
+        child.observe(i * 1e-6)
+    print(f"Histogram.observe          {(time.perf_counter() - started) / requests * 1e9:8.0f}ns")
+    started = time.perf_counter()
+    for i in range(requests):
+        histogram.labels("/api/bench").observe(i * 1e-6)
+    print(f"Histogram.labels().observe {(time.perf_counter() - started) / requests * 1e9:8.0f}ns")
+
+    plain = create_engine("sqlite://")
+    observed = create_engine("sqlite://")
+    metrics.instrument_engine(observed)
+    per_query_seconds(plain, 1000)
+    per_query_seconds(observed, 1000)
+    bare_query = min(per_query_seconds(plain, queries) for _ in range(repeat))
+    observed_query = min(per_query_seconds(observed, queries) for _ in range(repeat))
+    print(f"SELECT 1 (계측 없음)         {bare_query * 1e6:8.2f}µs")
+    print(f"SELECT 1 (쿼리 이벤트)        {observed_query * 1e6:8.2f}µs")
+    print(f"  쿼리당 오버헤드            {(observed_query - bare_query) * 1e6:8.2f}µs")
+
+    started = time.perf_counter()
+    body = metrics.registry.render()
+    print(f"/metrics 렌더링             {(time.perf_counter() - started) * 1000:8.2f}ms ({len(body)} bytes)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.queries, args.repeat))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+멘토 추천 벤치마크
+합성 멘토 데이터(기본 10만 명)로 TF-IDF 추천 색인을 만들고
+`GET /api/mentors/recommended` 지연 시간, 색인 생성 시간, 프로필 수정 반영 시간을 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_recommend [--mentors 100000] [--requests 200] [--k 10]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.common import (
+    use_temp_storage, asgi_client, timed, summarize, format_summary, create_user, auth_headers, seed_mentors,
+    SYNTHETIC_SKILLS, SYNTHETIC_TOPICS,
+)
+
+use_temp_storage()
+
+import main
+from recommender import mentor_index
+
+MENTEE_BIOS = [
+    "머신러닝 엔지니어가 되고 싶어서 python과 pytorch를 공부하고 있습니다",
+    "spring boot로 백엔드 서버를 만들어 보고 싶습니다",
+    "react와 typescript로 프론트엔드 웹 개발을 배우는 중입니다",
+    "kubernetes와 docker 기반 클라우드 인프라 운영에 관심이 많습니다",
+    "모바일 앱 개발을 swift와 kotlin으로 시작했습니다",
+]
+
+async def run(mentors: int, requests: int, k: int):
+    started = time.perf_counter()
+    seed_mentors(main, mentors)
+    print(f"멘토 {mentors}명 생성: {time.perf_counter() - started:.1f}초")
+    
+    mentees = [create_user(main, "mentee", f"mentee{i}@example.com", "x", bio=bio) for i, bio in enumerate(MENTEE_BIOS)]
+    headers = [auth_headers(main, mentee) for mentee in mentees]
+    
+    async with asgi_client(main.app) as client:
+        started = time.perf_counter()
+        await client.get("/api/mentors/recommended", headers=headers[0], params={"k": k})
+        print(f"첫 요청 (색인 생성 포함): {time.perf_counter() - started:.2f}초, 색인 {mentor_index.stats()}")
+        
+        latencies = []
+        for i in range(requests):
+            await timed(lambda: client.get("/api/mentors/recommended", headers=headers[i % len(headers)], params={"k": k}), latencies)
+        print(format_summary(f"API top-{k}", summarize(latencies)))
+    
+    # 행렬-벡터 곱과 top-k 선택만 측정
+    scoring = []
+    for i in range(requests):
+        started = time.perf_counter()
+        mentor_index.top_k(MENTEE_BIOS[i % len(MENTEE_BIOS)], k)
+        scoring.append(time.perf_counter() - started)
+    print(format_summary(f"점수 계산 top-{k}", summarize(scoring)))
+    
+    # 프로필 수정 반영 (변경분 행렬 재구성)
+    rng = random.Random(7)
+    updates = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        mentor_index.upsert(rng.randint(1, mentors), rng.choice(SYNTHETIC_TOPICS), rng.sample(SYNTHETIC_SKILLS, 3))
+        updates.append(time.perf_counter() - started)
+    print(format_summary("프로필 수정 반영", summarize(updates)))
+    print(f"색인 상태: {mentor_index.stats()}")
+    await main.shutdown_workers()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mentors", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.mentors, args.requests, args.k))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+멘토 전문 검색 벤치마크
+합성 멘토 데이터(기본 10만 명)에서 `GET /api/mentors?q=` 검색 지연 시간을 측정하고,
+같은 검색어를 users.bio/name/skills에 대한 LIKE 전체 스캔과 비교합니다.
+
+멘토 목록 캐시가 결과를 재사용하지 않도록 매 요청 전에 캐시 버전을 올립니다.
+
+사용법:
+    python -m benchmarks.bench_search [--mentors 100000] [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from benchmarks.common import (
+    use_temp_storage, asgi_client, timed, summarize, format_summary, create_user, auth_headers, seed_mentors,
+)
+
+use_temp_storage()
+
+import main
+
+QUERIES = ["머신러닝", "spring boot", "kubernetes", "분산 시스템", "typescript react", "데이터", "GraphQL 서버",
+           "haskell", "컴파일러 최적화"]
+
+def like_scan(query: str):
+    """비교용: 검색어마다 users 열에 LIKE 조건을 거는 방식
+    
+    관련도 정렬을 하려면 일치하는 행을 모두 찾아야 하므로 LIMIT 없이 전체 일치 수를 셉니다.
+    """
+    conditions, params = [], {}
+    for n, term in enumerate(query.split()):
+        params[f"t{n}"] = f"%{term}%"
+        conditions.append(f"(name LIKE :t{n} OR bio LIKE :t{n} OR skills LIKE :t{n})")
+    with main.engine.connect() as conn:
+        return conn.execute(text(
+            f"SELECT count(*) FROM users WHERE role = 'mentor' AND {' AND '.join(conditions)}"
+        ), params).scalar()
+
+async def run(mentors: int, repeat: int, limit: int):
+    started = time.perf_counter()
+    seed_mentors(main, mentors)
+    print(f"멘토 {mentors}명 생성 및 색인: {time.perf_counter() - started:.1f}초")
+    mentee = create_user(main, "mentee", "mentee@example.com", "x")
+    headers = auth_headers(main, mentee)
+
+    async with asgi_client(main.app) as client:
+        await client.get("/api/me", headers=headers)  # 토큰 캐시 준비
+        for query in QUERIES:
+            api_latencies, like_latencies = [], []
+            hits = matches = 0
+            for _ in range(repeat):
+                main.directory_cache.bump()
+                response = await timed(
+                    lambda: client.get("/api/mentors", headers=headers, params={"q": query, "limit": limit}),
+                    api_latencies,
+                )
+                hits = len(response.json())
+
+                started = time.perf_counter()
+                matches = like_scan(query)
+                like_latencies.append(time.perf_counter() - started)
+            print(f"[{query}] 전체 일치 {matches}건, 첫 페이지 {hits}건")
+            print(format_summary("  FTS5 (API, bm25)", summarize(api_latencies)))
+            print(format_summary("  LIKE 전체 스캔 (SQL만)", summarize(like_latencies)))
+    await main.shutdown_workers()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mentors", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.mentors, args.repeat, args.limit))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+SQLite 저장소 설정 읽기/쓰기 혼합 벤치마크
+기존 설정(rollback journal, 기본 PRAGMA)과 storage.py의 운영 설정(WAL 등)을
+같은 데이터와 같은 작업 부하로 비교합니다.
+
+각 스레드는 읽기(사용자 조회, 멘토 목록 페이지)와 쓰기(소개글 수정 후 commit)를
+정해진 비율로 반복하며, 처리량과 "database is locked" 오류 수를 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_sqlite [--threads 8] [--duration 5] [--write-ratio 0.2]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from benchmarks.common import use_temp_storage, summarize, format_summary
+
+use_temp_storage()
+
+import main
+import storage
+
+def seed(engine, users: int):
+    main.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM users"))
+        conn.execute(
+            text("INSERT INTO users (id, email, password_hash, name, role, bio) VALUES (:id, :email, 'x', :name, :role, '')"),
+            [
+                {"id": i, "email": f"user{i}@example.com", "name": f"사용자{i:05d}", "role": "mentor" if i % 2 else "mentee"}
+                for i in range(1, users + 1)
+            ],
+        )
+
+def worker(engine, users: int, write_ratio: float, deadline: float, seed_value: int, result: dict):
+    rng = random.Random(seed_value)
+    latencies, locked = [], 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            with engine.connect() as conn:
+                if rng.random() < write_ratio:
+                    conn.execute(
+                        text("UPDATE users SET bio = :bio WHERE id = :id"),
+                        {"bio": f"bio {rng.random()}", "id": rng.randint(1, users)},
+                    )
+                    conn.commit()
+                elif rng.random() < 0.5:
+                    conn.execute(text("SELECT id, name, role FROM users WHERE id = :id"), {"id": rng.randint(1, users)}).first()
+                else:
+                    conn.execute(text(
+                        "SELECT id, name FROM users WHERE role = 'mentor' AND name > :name ORDER BY name, id LIMIT 20"
+                    ), {"name": f"사용자{rng.randint(1, users):05d}"}).all()
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            locked += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+    result["latencies"] = latencies
+    result["locked"] = locked
+
+def run_profile(label: str, engine, args):
+    seed(engine, args.users)
+    deadline = time.perf_counter() + args.duration
+    results = [{} for _ in range(args.threads)]
+    threads = [
+        threading.Thread(target=worker, args=(engine, args.users, args.write_ratio, deadline, i, results[i]))
+        for i in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    
+    latencies = [latency for result in results for latency in result["latencies"]]
+    locked = sum(result["locked"] for result in results)
+    print(format_summary(label, summarize(latencies)))
+    print(f"{'':<32} 처리량={len(latencies) / args.duration:9.1f} ops/s, locked 오류={locked}")
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8, help="동시 스레드 수")
+    parser.add_argument("--duration", type=float, default=5, help="프로필별 측정 시간(초)")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="쓰기 비율")
+    parser.add_argument("--users", type=int, default=5000, help="사용자 수")
+    args = parser.parse_args()
+    
+    directory = tempfile.mkdtemp(prefix="mentor-mentee-sqlite-bench-")
+    print(f"스레드 {args.threads}, 쓰기 비율 {args.write_ratio:.0%}, 사용자 {args.users}명")
+    
+    # 기존 설정: 기본 rollback journal, PRAGMA 없음
+    legacy_url = f"sqlite:///{os.path.join(directory, 'legacy.db')}"
+    run_profile("기존 설정 (DELETE journal)",
+                create_engine(legacy_url, connect_args={"check_same_thread": False}), args)
+    
+    # storage.py 운영 설정
+    tuned = storage.StorageSettings.from_env()
+    tuned = storage.StorageSettings(**{**tuned.__dict__, "database_url": f"sqlite:///{os.path.join(directory, 'tuned.db')}"})
+    run_profile(f"storage.py ({tuned.journal_mode}, {tuned.synchronous})", storage.create_sync_engine(tuned), args)
+
+if __name__ == "__main__":
+    main_cli()
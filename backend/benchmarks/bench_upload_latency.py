@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+이미지 업로드 중 /api/me 지연 시간 벤치마크
+프로필 이미지 업로드가 동시에 진행되는 동안 같은 이벤트 루프에서 처리되는
+/api/me의 p50/p95/p99 지연 시간을 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_upload_latency [--uploads 8] [--probes 300]
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import os
+import random
+
+from benchmarks.common import use_temp_storage, asgi_client, timed, summarize, format_summary, create_user, auth_headers
+
+use_temp_storage()
+
+from PIL import Image
+import main
+
+def make_upload_payload(seed: int) -> str:
+    """검증을 통과하는 최대 크기에 가까운 JPEG (노이즈 이미지라 압축이 잘 안 됨)"""
+    rng = random.Random(seed)
+    image = Image.frombytes("RGB", (640, 640), bytes(rng.getrandbits(8) for _ in range(640 * 640 * 3)))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=80)
+    return base64.b64encode(buffer.getvalue()).decode()
+
+async def probe_me(client, headers, count: int, latencies):
+    for _ in range(count):
+        await timed(lambda: client.get("/api/me", headers=headers), latencies)
+        await asyncio.sleep(0.002)
+
+async def upload_loop(client, mentor, headers, payloads, stop: asyncio.Event, statuses):
+    i = 0
+    while not stop.is_set():
+        response = await client.put("/api/profile", headers=headers, json={
+            "id": mentor.id, "name": mentor.name, "role": "mentor", "bio": "",
+            "image": payloads[i % len(payloads)],
+        })
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        i += 1
+
+async def run(uploads: int, probes: int):
+    password_hash = main.get_password_hash("password123")
+    mentee = create_user(main, "mentee", "probe@example.com", password_hash)
+    mentors = [create_user(main, "mentor", f"uploader{i}@example.com", password_hash) for i in range(uploads)]
+    payloads = [make_upload_payload(seed) for seed in range(4)]
+    print(f"업로드 크기: {len(base64.b64decode(payloads[0])) / 1024:.0f}KB, 동시 업로드: {uploads}")
+    
+    async with asgi_client(main.app) as client:
+        idle = []
+        await probe_me(client, auth_headers(main, mentee), probes, idle)
+        print(format_summary("/api/me (업로드 없음)", summarize(idle)))
+        
+        busy, statuses = [], {}
+        stop = asyncio.Event()
+        upload_tasks = [
+            asyncio.create_task(upload_loop(client, mentor, auth_headers(main, mentor), payloads, stop, statuses))
+            for mentor in mentors
+        ]
+        await asyncio.sleep(0.2)
+        await probe_me(client, auth_headers(main, mentee), probes, busy)
+        stop.set()
+        await asyncio.gather(*upload_tasks)
+        print(format_summary(f"/api/me (업로드 {uploads}개 진행 중)", summarize(busy)))
+        print(f"업로드 응답 코드: {statuses}")
+        print(f"이미지 워커 풀: {main.image_workers.stats()}")
+    await main.shutdown_workers()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uploads", type=int, default=8, help="동시 업로드 수")
+    parser.add_argument("--probes", type=int, default=300, help="/api/me 측정 요청 수")
+    args = parser.parse_args()
+    asyncio.run(run(args.uploads, args.probes))
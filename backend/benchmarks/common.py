@@ -0,0 +1,120 @@
+"""
+벤치마크 공통 도구
+임시 데이터베이스/이미지 저장소를 설정하고 main.app을 프로세스 내부 ASGI로 호출합니다.
+main을 import하기 전에 use_temp_storage()를 먼저 호출해야 합니다.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from statistics import mean
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def use_temp_storage() -> str:
+    """임시 디렉토리에 DB와 이미지 저장소를 두도록 환경 변수 설정"""
+    directory = tempfile.mkdtemp(prefix="mentor-mentee-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+    os.environ["IMAGE_STORE_DIR"] = os.path.join(directory, "images")
+    return directory
+
+def percentile(values: List[float], p: float) -> float:
+    """최근접 순위 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """지연 시간 목록(초)을 ms 단위 통계로 요약"""
+    return {
+        "count": len(latencies),
+        "mean_ms": mean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+def format_summary(label: str, summary: Dict[str, float]) -> str:
+    return (
+        f"{label:<32} n={summary['count']:<6} "
+        f"p50={summary['p50_ms']:8.2f}ms p95={summary['p95_ms']:8.2f}ms p99={summary['p99_ms']:8.2f}ms"
+    )
+
+def asgi_client(app):
+    """프로세스 내부 ASGI 트랜스포트를 쓰는 httpx 클라이언트"""
+    import httpx
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+async def timed(coro_factory, latencies: List[float]):
+    """요청 하나를 실행하고 지연 시간을 기록"""
+    started = time.perf_counter()
+    response = await coro_factory()
+    latencies.append(time.perf_counter() - started)
+    return response
+
+def create_user(main, role: str, email: str, password_hash: str, **fields):
+    """ORM으로 사용자를 직접 생성 (회원가입 API를 거치지 않음)"""
+    db = main.SessionLocal()
+    try:
+        user = main.User(email=email, password_hash=password_hash, name=email.split("@")[0], role=role, **fields)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        db.expunge(user)
+        return user
+    finally:
+        db.close()
+
+def auth_headers(main, user) -> Dict[str, str]:
+    token = main.create_access_token(
+        data={"user_id": user.id, "email": user.email, "name": user.name or "", "role": user.role}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+SYNTHETIC_SKILLS = ["Python", "Java", "Spring Boot", "React", "Vue.js", "TypeScript", "Go", "Kotlin",
+                    "Swift", "Docker", "Kubernetes", "AWS", "PyTorch", "TensorFlow", "SQL", "GraphQL"]
+SYNTHETIC_TOPICS = ["백엔드 서버 개발", "프론트엔드 웹 개발", "머신러닝 모델 서빙", "데이터 분석",
+                    "모바일 앱 개발", "클라우드 인프라 운영", "분산 시스템 설계", "게임 클라이언트 개발"]
+SYNTHETIC_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+# 1000명 중 1명꼴로만 등장하는 드문 주제
+SYNTHETIC_RARE_TOPICS = ["Haskell 함수형 프로그래밍", "Elixir 실시간 서비스", "컴파일러 최적화"]
+
+def seed_mentors(main, count: int, seed: int = 42) -> List[dict]:
+    """합성 멘토 데이터를 대량 삽입 (users, mentor_skills, mentor_search)하고 삽입한 행을 반환"""
+    import json
+    import random
+    from sqlalchemy import text
+    from mentor_search import rebuild_mentor_search
+
+    rng = random.Random(seed)
+    users, skill_rows = [], []
+    for i in range(1, count + 1):
+        skills = rng.sample(SYNTHETIC_SKILLS, 3)
+        bio = f"{rng.choice(SYNTHETIC_TOPICS)} {rng.randint(1, 15)}년차입니다. {rng.choice(SYNTHETIC_TOPICS)}에도 관심이 많습니다."
+        if rng.random() < 0.001:
+            bio += f" {rng.choice(SYNTHETIC_RARE_TOPICS)} 경험이 있습니다."
+        users.append({
+            "id": i, "email": f"mentor{i}@example.com", "name": f"{rng.choice(SYNTHETIC_SURNAMES)}멘토{i}",
+            "role": "mentor", "bio": bio, "skills": json.dumps(skills, ensure_ascii=False),
+        })
+        skill_rows.extend({"user_id": i, "skill": s, "skill_normalized": main.normalize_skill(s)} for s in skills)
+
+    with main.engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO users (id, email, password_hash, name, role, bio, skills) "
+            "VALUES (:id, :email, 'x', :name, :role, :bio, :skills)"
+        ), users)
+        conn.execute(text(
+            "INSERT INTO mentor_skills (user_id, skill, skill_normalized) VALUES (:user_id, :skill, :skill_normalized)"
+        ), skill_rows)
+    db = main.SessionLocal()
+    try:
+        rebuild_mentor_search(db, ((u["id"], u["name"], u["bio"], u["skills"]) for u in users))
+        db.commit()
+    finally:
+        db.close()
+    return users
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+엔드포인트 전체 벤치마크 스위트
+임시 데이터베이스를 seed.py로 데이터셋 크기마다 새로 채우고, main.app을 프로세스 내부 ASGI로
+호출하여 회원가입, 로그인, 내 정보, 멘토 목록(필터/정렬/검색), 이미지 조회, 프로필 수정,
+매칭 요청 전체 흐름(생성/목록/수락/거절/취소)의 지연 시간(p50/p95/p99)과 처리량을 측정합니다.
+
+결과는 JSON으로 저장할 수 있으며, 기준 결과(--baseline)보다 지정한 비율 이상 느려진
+항목이 있으면 종료 코드 1로 실패합니다. 기대하지 않은 응답 코드가 나와도 실패합니다.
+
+X-DB-Query-Count 헤더로 요청당 SQL 문 수도 기록합니다. 데이터셋이 커지거나 목록 API의
+limit을 늘렸을 때 쿼리 수가 늘어나는 엔드포인트(N+1)가 있으면 실패합니다.
+
+사용법:
+    python -m benchmarks.suite [--sizes 1000,10000] [--iterations 200] [--output results.json]
+    python -m benchmarks.suite --baseline baseline.json [--threshold 0.2] [--metric p95_ms]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Awaitable, Callable, Dict, List
+
+from benchmarks.common import use_temp_storage, asgi_client, summarize, format_summary, auth_headers
+
+use_temp_storage()
+
+from sqlalchemy import func, insert, select
+
+import main
+import query_tracker
+import seed
+
+# 데이터셋 크기(멘토 수) 대비 멘티, 매칭 요청 비율
+MENTEES_PER_MENTOR = 4
+REQUESTS_PER_MENTOR = 10
+
+METRICS = ("mean_ms", "p50_ms", "p95_ms", "p99_ms")
+
+@dataclass
+class Scenario:
+    name: str
+    run: Callable[[int], Awaitable]  # 반복 번호 -> 응답
+    iterations: int
+    expected_status: int = 200
+
+def query_count(response) -> int:
+    return int(response.headers.get(query_tracker.QUERY_COUNT_HEADER, -1))
+
+async def measure(scenario: Scenario) -> Dict[str, float]:
+    """시나리오를 순차 실행하여 지연 시간 통계, 처리량(요청/초), 요청당 최대 SQL 문 수를 계산"""
+    latencies, errors = [], {}
+    queries = 0
+    started = time.perf_counter()
+    for i in range(scenario.iterations):
+        request_started = time.perf_counter()
+        response = await scenario.run(i)
+        latencies.append(time.perf_counter() - request_started)
+        queries = max(queries, query_count(response))
+        if response.status_code != scenario.expected_status:
+            errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+    elapsed = time.perf_counter() - started
+    summary = summarize(latencies)
+    summary["rps"] = scenario.iterations / elapsed if elapsed else 0.0
+    summary["queries"] = queries
+    summary["errors"] = errors
+    return summary
+
+def reset_process_state():
+    """데이터셋을 바꿀 때 프로세스 내부 캐시/색인을 비움"""
+    main.token_cache.clear()
+    main.directory_cache.bump()
+    main.mentor_index.clear()
+
+def insert_fresh_users(role: str, first_id: int, count: int, password_hash: str) -> List[SimpleNamespace]:
+    """대기/수락 요청이 없는 사용자를 직접 삽입 (매칭 흐름 측정용)"""
+    rows = [
+        {"id": first_id + i, "email": f"bench-{role}{i}@example.com", "password_hash": password_hash,
+         "name": f"bench-{role}{i}", "role": role, "bio": "", "skills": "[]" if role == "mentor" else None}
+        for i in range(count)
+    ]
+    if rows:
+        with main.engine.begin() as conn:
+            conn.execute(insert(main.User.__table__), rows)
+    return [SimpleNamespace(**row) for row in rows]
+
+def build_scenarios(client, size: int, iterations: int, auth_iterations: int, password_hash: str) -> List[Scenario]:
+    mentors = size
+    mentees = size * MENTEES_PER_MENTOR
+    mentee = SimpleNamespace(id=mentors + 1, email="mentee1@example.com", name="", role="mentee")
+    mentor = SimpleNamespace(id=1, email="mentor1@example.com", name="", role="mentor")
+    mentee_headers = auth_headers(main, mentee)
+    mentor_headers = auth_headers(main, mentor)
+
+    def uncached(path: str, **params):
+        async def run(i):
+            main.directory_cache.bump()
+            return await client.get(path, headers=mentee_headers, params=params)
+        return run
+
+    # 매칭 흐름: 새 멘토/멘티 쌍마다 요청을 만든 뒤 1/3씩 수락, 거절, 취소
+    fresh_mentors = insert_fresh_users("mentor", mentors + mentees + 1, iterations, password_hash)
+    fresh_mentees = insert_fresh_users("mentee", mentors + mentees + iterations + 1, iterations, password_hash)
+    request_ids: List[int] = []
+
+    async def create_request(i):
+        response = await client.post("/api/match-requests", headers=auth_headers(main, fresh_mentees[i]), json={
+            "mentorId": fresh_mentors[i].id, "menteeId": fresh_mentees[i].id, "message": "벤치마크 요청",
+        })
+        if response.status_code == 200:
+            request_ids.append(response.json()["id"])
+        return response
+
+    def transition(offset: int, method: str, suffix: str, actor: str):
+        async def run(i):
+            n = i * 3 + offset
+            user = fresh_mentors[n] if actor == "mentor" else fresh_mentees[n]
+            return await client.request(
+                method, f"/api/match-requests/{request_ids[n]}{suffix}", headers=auth_headers(main, user)
+            )
+        return run
+
+    async def signup(i):
+        return await client.post("/api/signup", json={
+            "email": f"signup{size}-{i}@example.com", "password": seed.DEFAULT_PASSWORD,
+            "name": f"신규{i}", "role": "mentor" if i % 2 else "mentee",
+        })
+
+    async def login(i):
+        return await client.post("/api/login", json={
+            "email": f"mentee{i % mentees + 1}@example.com", "password": seed.DEFAULT_PASSWORD,
+        })
+
+    async def update_profile(i):
+        return await client.put("/api/profile", headers=mentor_headers, json={
+            "id": mentor.id, "name": "벤치마크 멘토", "role": "mentor",
+            "bio": f"프로필 수정 {i}", "skills": ["Python", "FastAPI"],
+        })
+
+    def get(path: str, headers, **params):
+        return lambda i: client.get(path, headers=headers, params=params)
+
+    image_user = lambda i: i % mentors + 1
+    return [
+        Scenario("signup", signup, auth_iterations, expected_status=201),
+        Scenario("login", login, auth_iterations),
+        Scenario("me", get("/api/me", mentee_headers), iterations),
+        Scenario("mentors_cached", get("/api/mentors", mentee_headers, limit=20), iterations),
+        Scenario("mentors_filtered", uncached("/api/mentors", skill="Python", order_by="name", limit=20), iterations),
+        Scenario("mentors_sorted", uncached("/api/mentors", order_by="skill", limit=20), iterations),
+        Scenario("mentors_search", uncached("/api/mentors", q="머신러닝", limit=20), iterations),
+        Scenario("image", lambda i: client.get(f"/api/images/mentor/{image_user(i)}", headers=mentee_headers),
+                 iterations),
+        Scenario("image_thumbnail", lambda i: client.get(
+            f"/api/images/mentor/{image_user(i)}", headers=mentee_headers, params={"size": 128}), iterations),
+        Scenario("profile_update", update_profile, iterations),
+        Scenario("match_create", create_request, iterations),
+        Scenario("match_incoming", get("/api/match-requests/incoming", mentor_headers, status="all"), iterations),
+        Scenario("match_outgoing", get("/api/match-requests/outgoing", mentee_headers), iterations),
+        Scenario("match_accept", transition(0, "PUT", "/accept", "mentor"), iterations // 3),
+        Scenario("match_reject", transition(1, "PUT", "/reject", "mentor"), iterations // 3),
+        Scenario("match_cancel", transition(2, "DELETE", "", "mentee"), iterations // 3),
+    ]
+
+def busiest(column) -> int:
+    """요청이 가장 많은 멘토/멘티 id (목록 API의 결과 크기를 키우기 위해)"""
+    with main.engine.connect() as conn:
+        return conn.execute(
+            select(column).group_by(column).order_by(func.count().desc()).limit(1)
+        ).scalar()
+
+async def probe_query_scaling(client) -> Dict[str, dict]:
+    """목록 API를 작은/큰 limit으로 호출하여 결과 개수에 따라 쿼리 수가 늘어나는지 확인"""
+    mentor = SimpleNamespace(id=busiest(main.MatchRequest.mentor_id), email="", name="", role="mentor")
+    mentee = SimpleNamespace(id=busiest(main.MatchRequest.mentee_id), email="", name="", role="mentee")
+    mentor_headers, mentee_headers = auth_headers(main, mentor), auth_headers(main, mentee)
+    await client.get("/api/mentors/recommended", headers=mentee_headers)  # 추천 색인 준비
+
+    probes = {
+        "mentors": ("/api/mentors", mentee_headers, "limit", {}),
+        "mentors_search": ("/api/mentors", mentee_headers, "limit", {"q": "개발"}),
+        "mentors_recommended": ("/api/mentors/recommended", mentee_headers, "k", {}),
+        "match_incoming": ("/api/match-requests/incoming", mentor_headers, "limit",
+                           {"status": "all", "include": "counterpart"}),
+        "match_outgoing": ("/api/match-requests/outgoing", mentee_headers, "limit", {"include": "counterpart"}),
+    }
+    results = {}
+    for name, (path, headers, size_param, params) in probes.items():
+        measured = {}
+        for label, value in (("small", 1), ("large", 50)):
+            main.directory_cache.bump()
+            response = await client.get(path, headers=headers, params={**params, size_param: value})
+            measured[label] = {"rows": len(response.json()), "queries": query_count(response)}
+        results[name] = measured
+        print(f"{name:<32} 결과 {measured['small']['rows']}건: 쿼리 {measured['small']['queries']}개, "
+              f"결과 {measured['large']['rows']}건: 쿼리 {measured['large']['queries']}개")
+    return results
+
+async def run_size(size: int, iterations: int, auth_iterations: int, password_hash: str):
+    seed.seed_database(size, size * MENTEES_PER_MENTOR, size * REQUESTS_PER_MENTOR, generate_thumbnails=True)
+    reset_process_state()
+    results = {}
+    async with asgi_client(main.app) as client:
+        scaling = await probe_query_scaling(client)
+        for scenario in build_scenarios(client, size, iterations, auth_iterations, password_hash):
+            results[scenario.name] = await measure(scenario)
+            summary = results[scenario.name]
+            errors = f" 오류 {summary['errors']}" if summary["errors"] else ""
+            print(f"{format_summary(scenario.name, summary)} {summary['rps']:8.1f} req/s "
+                  f"쿼리 {summary['queries']}개{errors}")
+    return results, scaling
+
+def find_regressions(results: dict, baseline: dict, threshold: float, metric: str, min_delta_ms: float) -> List[str]:
+    """기준 결과보다 threshold 비율 이상(그리고 min_delta_ms 이상) 느려진 항목 목록"""
+    regressions = []
+    for size, scenarios in results["sizes"].items():
+        for name, summary in scenarios.items():
+            base = baseline.get("sizes", {}).get(size, {}).get(name)
+            if not base or metric not in base:
+                continue
+            current, previous = summary[metric], base[metric]
+            if current > previous * (1 + threshold) and current - previous >= min_delta_ms:
+                regressions.append(
+                    f"[{size}] {name} {metric}: {previous:.2f}ms -> {current:.2f}ms (+{current / previous - 1:.0%})"
+                    if previous else f"[{size}] {name} {metric}: {previous:.2f}ms -> {current:.2f}ms"
+                )
+    return regressions
+
+def find_query_growth(results: dict) -> List[str]:
+    """결과 개수나 데이터셋 크기에 따라 요청당 쿼리 수가 늘어난 엔드포인트 목록"""
+    growth = []
+    for size, probes in results["query_scaling"].items():
+        for name, measured in probes.items():
+            small, large = measured["small"], measured["large"]
+            if large["rows"] > small["rows"] and large["queries"] > small["queries"]:
+                growth.append(f"[{size}] {name}: 결과 {small['rows']}건 {small['queries']}개 -> "
+                              f"{large['rows']}건 {large['queries']}개")
+    sizes = sorted(results["sizes"], key=int)
+    for smaller, larger in zip(sizes, sizes[1:]):
+        for name, summary in results["sizes"][larger].items():
+            base = results["sizes"][smaller].get(name)
+            if base and summary["queries"] > base["queries"]:
+                growth.append(f"{name}: 데이터셋 {smaller} {base['queries']}개 -> {larger} {summary['queries']}개")
+    return growth
+
+async def run(sizes: List[int], iterations: int, auth_iterations: int) -> dict:
+    password_hash = main.get_password_hash(seed.DEFAULT_PASSWORD)
+    results = {
+        "created_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "iterations": iterations,
+        "auth_iterations": auth_iterations,
+        "sizes": {},
+        "query_scaling": {},
+    }
+    try:
+        for size in sizes:
+            print(f"\n=== 데이터셋: 멘토 {size}명, 멘티 {size * MENTEES_PER_MENTOR}명, "
+                  f"요청 {size * REQUESTS_PER_MENTOR}건 ===")
+            results["sizes"][str(size)], results["query_scaling"][str(size)] = await run_size(
+                size, iterations, auth_iterations, password_hash
+            )
+    finally:
+        await main.shutdown_workers()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000", help="쉼표로 구분한 데이터셋 크기 (멘토 수)")
+    parser.add_argument("--iterations", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument("--auth-iterations", type=int, default=20, help="회원가입/로그인 요청 수 (bcrypt 비용)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용하는 느려짐 비율 (0.2 = 20%%)")
+    parser.add_argument("--metric", choices=METRICS, default="p95_ms", help="기준 비교에 쓸 지표")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="이보다 작은 차이는 회귀로 보지 않음")
+    args = parser.parse_args()
+    if args.iterations < 3:
+        parser.error("--iterations는 3 이상이어야 합니다")
+
+    results = asyncio.run(run([int(size) for size in args.sizes.split(",")], args.iterations, args.auth_iterations))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    failed = False
+    errors = [
+        f"[{size}] {name}: {summary['errors']}"
+        for size, scenarios in results["sizes"].items() for name, summary in scenarios.items() if summary["errors"]
+    ]
+    if errors:
+        failed = True
+        print("\n❌ 기대하지 않은 응답 코드:")
+        for line in errors:
+            print(f"  {line}")
+    growth = find_query_growth(results)
+    if growth:
+        failed = True
+        print("\n❌ 결과/데이터셋 크기에 따라 쿼리 수가 늘어난 엔드포인트 (N+1):")
+        for line in growth:
+            print(f"  {line}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold, args.metric, args.min_delta_ms)
+        if regressions:
+            failed = True
+            print(f"\n❌ 기준 대비 {args.threshold:.0%} 넘게 느려진 항목 ({args.metric}):")
+            for line in regressions:
+                print(f"  {line}")
+        else:
+            print(f"\n✅ 기준 대비 회귀 없음 ({args.metric}, 허용 {args.threshold:.0%})")
+    sys.exit(1 if failed else 0)
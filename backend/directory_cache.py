@@ -0,0 +1,85 @@
+"""
+멘토 목록 응답 캐시
+멘토 목록은 멘토가 가입하거나 프로필을 수정할 때만 바뀌므로
+(skill, order_by, limit, cursor) 페이지별로 이미 인코딩된 JSON 바이트를 보관합니다.
+캐시 적중 시 ORM 조회와 Pydantic 직렬화를 모두 건너뜁니다.
+
+멘토 쓰기가 일어나면 bump()로 전역 버전을 올려 모든 항목을 무효화합니다.
+조회를 시작할 때의 버전을 put()에 넘기므로, 재구성 도중 버전이 바뀌면
+오래된 결과는 저장되지 않습니다. 버전은 프로세스 단위입니다.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional
+
+@dataclass(frozen=True)
+class DirectoryPage:
+    """캐시된 멘토 목록 한 페이지"""
+    body: bytes
+    next_cursor: Optional[str] = None
+
+class DirectoryCache:
+    """버전 기반 무효화를 지원하는 크기 제한 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, DirectoryPage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+        self.rebuild_seconds = 0.0
+        self.last_rebuild_seconds = 0.0
+
+    def get(self, key: Hashable) -> Optional[DirectoryPage]:
+        with self._lock:
+            page = self._entries.get(key)
+            if page is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def put(self, key: Hashable, page: DirectoryPage, version: int, rebuild_seconds: float):
+        """페이지 저장 (조회 시작 후 버전이 바뀌었으면 저장하지 않음)"""
+        with self._lock:
+            self.rebuilds += 1
+            self.rebuild_seconds += rebuild_seconds
+            self.last_rebuild_seconds = rebuild_seconds
+            if self.max_size <= 0 or version != self.version:
+                return
+            self._entries[key] = page
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def bump(self):
+        """멘토 데이터가 바뀌었을 때 호출하여 모든 페이지 무효화"""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "rebuilds": self.rebuilds,
+            "avg_rebuild_ms": self.rebuild_seconds * 1000 / self.rebuilds if self.rebuilds else 0.0,
+            "last_rebuild_ms": self.last_rebuild_seconds * 1000,
+        }
+
+directory_cache = DirectoryCache(int(os.getenv("MENTOR_DIRECTORY_CACHE_SIZE", "256")))
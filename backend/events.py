@@ -0,0 +1,164 @@
+"""
+매칭 요청 변경 이벤트 (Server-Sent Events)
+요청 생성/수락/거절/취소가 커밋되면 프로세스 내부 브로커가 관련된 멘토와 멘티의
+연결에 이벤트를 전달합니다.
+
+- 연결마다 크기가 제한된 큐를 두며, 큐가 가득 찰 만큼 느린 연결에는 `reset`을 보내고
+  연결을 끊습니다. 클라이언트는 Last-Event-ID로 다시 연결하여 이어 받습니다.
+- 최근 이벤트를 일정 개수 보관하여 Last-Event-ID 이후의 이벤트를 다시 보냅니다.
+  보관 범위를 벗어났으면 `reset`을 보내 목록을 새로 조회하도록 합니다.
+- 이벤트가 없으면 주기적으로 주석 줄(heartbeat)을 보내 프록시가 연결을 끊지 않게 합니다.
+
+이벤트 id와 구독 정보는 프로세스 단위이므로 여러 워커로 실행하면
+같은 워커에서 일어난 변경만 전달됩니다.
+"""
+
+import asyncio
+import json
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Optional, Set, Tuple
+
+RESET = "reset"
+_CLOSE = object()
+
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+SSE_RETRY_MS = 3000  # 끊겼을 때 브라우저 재연결 대기 시간
+
+@dataclass(frozen=True)
+class MatchEvent:
+    id: int
+    type: str           # "created", "accepted", "rejected", "cancelled", "reset"
+    user_ids: Tuple[int, ...]
+    data: dict
+
+class Subscription:
+    """연결 하나의 이벤트 큐"""
+    __slots__ = ("user_id", "queue", "closed")
+
+    def __init__(self, user_id: int, max_queue: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue" = asyncio.Queue(max_queue)
+        self.closed = False
+
+class EventBroker:
+    """사용자별 구독자에게 이벤트를 나눠 주는 asyncio 브로커 (이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, max_queue: int, history_size: int):
+        self.max_queue = max_queue
+        self.history: Deque[MatchEvent] = deque(maxlen=history_size)
+        self.last_id = 0
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+
+    def subscribe(self, user_id: int, last_event_id: Optional[int] = None) -> Subscription:
+        """구독 생성 (last_event_id가 있으면 그 이후의 이벤트를 먼저 넣음)"""
+        subscription = Subscription(user_id, self.max_queue)
+        if last_event_id is not None and last_event_id != self.last_id:
+            self._replay(subscription, last_event_id)
+        if not subscription.closed:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.user_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.user_id]
+
+    def publish(self, event_type: str, user_ids, data: dict) -> MatchEvent:
+        """이벤트를 기록하고 관련 사용자의 모든 연결에 전달"""
+        self.last_id += 1
+        event = MatchEvent(self.last_id, event_type, tuple(dict.fromkeys(user_ids)), data)
+        self.history.append(event)
+        self.published += 1
+        for user_id in event.user_ids:
+            for subscription in list(self._subscribers.get(user_id, ())):
+                self._offer(subscription, event)
+        return event
+
+    def close_all(self):
+        """서버 종료 시 모든 스트림을 끝냄"""
+        for subscribers in list(self._subscribers.values()):
+            for subscription in list(subscribers):
+                self._close(subscription, _CLOSE)
+        self._subscribers.clear()
+
+    def connections(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def stats(self) -> dict:
+        return {
+            "connections": self.connections(),
+            "last_id": self.last_id,
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+        }
+
+    def _replay(self, subscription: Subscription, last_event_id: int):
+        oldest = self.history[0].id if self.history else self.last_id + 1
+        if last_event_id > self.last_id or last_event_id < oldest - 1:
+            # 서버 재시작 또는 보관 범위 밖: 목록을 다시 조회해야 함
+            subscription.queue.put_nowait(self._reset_event())
+            return
+        for event in self.history:
+            if event.id > last_event_id and subscription.user_id in event.user_ids:
+                if subscription.queue.full():
+                    self._close(subscription, self._reset_event())
+                    return
+                subscription.queue.put_nowait(event)
+
+    def _offer(self, subscription: Subscription, event: MatchEvent):
+        try:
+            subscription.queue.put_nowait(event)
+            self.delivered += 1
+        except asyncio.QueueFull:
+            # 느린 연결은 기다리지 않고 끊음 (재연결 후 Last-Event-ID로 이어 받음)
+            self.overflows += 1
+            self.unsubscribe(subscription)
+            self._close(subscription, self._reset_event())
+
+    def _reset_event(self) -> MatchEvent:
+        return MatchEvent(self.last_id, RESET, (), {})
+
+    def _close(self, subscription: Subscription, final):
+        """남은 이벤트를 버리고 마지막 항목(reset 또는 종료 신호)만 남김"""
+        subscription.closed = True
+        queue = subscription.queue
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(final)
+
+def format_event(event: MatchEvent) -> bytes:
+    """SSE 형식으로 직렬화"""
+    data = json.dumps(event.data, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {event.id}\nevent: {event.type}\ndata: {data}\n\n".encode("utf-8")
+
+async def event_stream(broker: EventBroker, subscription: Subscription, heartbeat: float) -> AsyncIterator[bytes]:
+    """구독 큐를 SSE 바이트 스트림으로 변환 (연결이 끊기면 구독 해제)"""
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n".encode("ascii")
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if event is _CLOSE:
+                return
+            yield format_event(event)
+            if subscription.closed and subscription.queue.empty():
+                return
+    finally:
+        broker.unsubscribe(subscription)
+
+
+broker = EventBroker(
+    max_queue=int(os.getenv("SSE_QUEUE_SIZE", "64")),
+    history_size=int(os.getenv("SSE_HISTORY_SIZE", "1000")),
+)
@@ -0,0 +1,73 @@
+"""
+콘텐츠 주소 기반 프로필 이미지 저장소
+검증된 이미지를 SHA-256 해시를 이름으로 하는 파일로 한 번만 저장합니다.
+데이터베이스에는 해시만 기록하고, 이미지는 파일 응답으로 바로 전송합니다.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+from typing import Optional
+
+IMAGE_STORE_DIR = os.getenv("IMAGE_STORE_DIR", "./images")
+
+_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+class ImageStore:
+    """SHA-256 해시로 주소를 지정하는 디스크 이미지 저장소"""
+    
+    def __init__(self, root: str):
+        self.root = root
+    
+    def path_for(self, digest: str) -> str:
+        """해시에 해당하는 파일 경로 (디렉토리 하나에 파일이 몰리지 않도록 앞 2글자로 분산)"""
+        if not _DIGEST_PATTERN.match(digest):
+            raise ValueError(f"Invalid image digest: {digest!r}")
+        return os.path.join(self.root, digest[:2], digest)
+    
+    def variant_path_for(self, digest: str, size: int, extension: str) -> str:
+        """원본 해시에서 파생된 썸네일 변형 파일 경로"""
+        return f"{self.path_for(digest)}_{int(size)}.{extension}"
+    
+    def put(self, data: bytes) -> str:
+        """이미지를 저장하고 해시를 반환 (이미 있는 내용이면 다시 쓰지 않음)"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            _write_atomic(path, data)
+        return digest
+    
+    def put_variant(self, digest: str, size: int, extension: str, data: bytes) -> str:
+        """썸네일 변형을 저장하고 경로를 반환"""
+        path = self.variant_path_for(digest, size, extension)
+        _write_atomic(path, data)
+        return path
+    
+    def get_path(self, digest: Optional[str]) -> Optional[str]:
+        """저장된 파일 경로를 반환 (없으면 None)"""
+        if not digest:
+            return None
+        path = self.path_for(digest)
+        return path if os.path.exists(path) else None
+    
+    def get_variant_path(self, digest: str, size: int, extension: str) -> Optional[str]:
+        """저장된 썸네일 변형 경로를 반환 (없으면 None)"""
+        path = self.variant_path_for(digest, size, extension)
+        return path if os.path.exists(path) else None
+
+def _write_atomic(path: str, data: bytes):
+    """임시 파일에 쓴 뒤 rename하여 읽는 쪽이 불완전한 파일을 보지 않도록 함"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+image_store = ImageStore(IMAGE_STORE_DIR)
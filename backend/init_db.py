@@ -7,42 +7,25 @@
 import os
 import sys
 import json
-import requests
 from datetime import datetime
 from passlib.context import CryptContext
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from main import Base, User, MatchRequest
+from storage import engine, SessionLocal
+from main import Base, User, MatchRequest, MentorSkill, sync_mentor_skills, sync_mentor_search
+from image_store import image_store
+from mentor_search import clear_mentor_search
+from seed import render_placeholder
 
 # 비밀번호 해싱
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# 데이터베이스 설정
-SQLALCHEMY_DATABASE_URL = "sqlite:///./mentor_mentee.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
 def hash_password(password: str) -> str:
     """비밀번호를 해시화합니다."""
     return pwd_context.hash(password)
 
 def get_default_image_data(role: str) -> bytes:
-    """기본 프로필 이미지를 다운로드하여 바이너리 데이터로 반환합니다."""
-    try:
-        if role == "mentor":
-            url = "https://placehold.co/500x500.jpg?text=MENTOR"
-        else:
-            url = "https://placehold.co/500x500.jpg?text=MENTEE"
-        
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            return response.content
-        else:
-            print(f"Warning: 기본 이미지 다운로드 실패 ({response.status_code})")
-            return None
-    except Exception as e:
-        print(f"Warning: 기본 이미지 다운로드 중 오류 발생: {e}")
-        return None
+    """기본 프로필 이미지를 로컬에서 렌더링하여 바이너리 데이터로 반환합니다 (네트워크 불필요)."""
+    color = (66, 133, 244) if role == "mentor" else (52, 168, 83)
+    return render_placeholder(role.upper(), color)
 
 def create_sample_users():
     """샘플 사용자 데이터를 생성합니다."""
@@ -58,12 +41,15 @@ def create_sample_users():
         # 기존 데이터 삭제
         print("기존 데이터 삭제 중...")
         db.query(MatchRequest).delete()
+        db.query(MentorSkill).delete()
         db.query(User).delete()
+        # 검색 색인은 users와 rowid로만 연결되므로 함께 비우지 않으면 삭제된 멘토가 검색됨
+        clear_mentor_search(db)
         db.commit()
         
-        print("기본 프로필 이미지 다운로드 중...")
-        mentor_image = get_default_image_data("mentor")
-        mentee_image = get_default_image_data("mentee")
+        print("기본 프로필 이미지 생성 중...")
+        mentor_image_hash = image_store.put(get_default_image_data("mentor"))
+        mentee_image_hash = image_store.put(get_default_image_data("mentee"))
         
         # 멘토 사용자들 생성
         mentors = [
@@ -164,7 +150,7 @@ def create_sample_users():
                 name=mentor_data["name"],
                 role=mentor_data["role"],
                 bio=mentor_data["bio"],
-                image_data=mentor_image,
+                image_hash=mentor_image_hash,
                 skills=json.dumps(mentor_data["skills"], ensure_ascii=False),
                 created_at=datetime.utcnow()
             )
@@ -180,7 +166,7 @@ def create_sample_users():
                 name=mentee_data["name"],
                 role=mentee_data["role"],
                 bio=mentee_data["bio"],
-                image_data=mentee_image,
+                image_hash=mentee_image_hash,
                 skills=None,
                 created_at=datetime.utcnow()
             )
@@ -196,6 +182,12 @@ def create_sample_users():
         for mentee in created_mentees:
             db.refresh(mentee)
         
+        print("멘토 스킬 인덱스 생성 중...")
+        for mentor, mentor_data in zip(created_mentors, mentors):
+            sync_mentor_skills(db, mentor.id, mentor_data["skills"])
+            sync_mentor_search(db, mentor)
+        db.commit()
+        
         print("샘플 매칭 요청 생성 중...")
         # 샘플 매칭 요청들 생성
         sample_requests = [
@@ -5,35 +5,59 @@ import uuid
 import base64
 import io
 import binascii
+import asyncio
+import json
+import logging
+import time
 from PIL import Image
 
 from fastapi import FastAPI, HTTPException, Depends, status, File, UploadFile, Query, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, RedirectResponse, JSONResponse
+from fastapi.responses import Response, RedirectResponse, JSONResponse, FileResponse, StreamingResponse
 from fastapi.exceptions import RequestValidationError
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, LargeBinary, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, LargeBinary, Boolean, ForeignKey, Index, func, tuple_, select, delete, text, update, insert, literal_column, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from passlib.context import CryptContext
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, deferred
 from jose import JWTError, jwt
-from pydantic import BaseModel, EmailStr, validator, ValidationError
+from pydantic import BaseModel, EmailStr, TypeAdapter, validator, ValidationError
 import uvicorn
 
+import storage
+from image_store import image_store
+import thumbnails
+from workers import PoolSaturated, image_workers, password_workers
+from passwords import pwd_context, verify_password, get_password_hash
+from token_cache import Principal, token_cache, token_key
+from directory_cache import DirectoryPage, directory_cache
+import mentor_search
+from recommender import mentor_index, parse_skills
+import events
+import metrics
+import app_logging
+from app_logging import log_event
+import query_tracker
+from mentor_search import sync_mentor_search, sync_mentor_search_async
+
+app_logging.configure()
+logger = app_logging.get_logger("api")
+
 # JWT 설정
 SECRET_KEY = "your-secret-key-here-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 1
 
-# 데이터베이스 설정
-SQLALCHEMY_DATABASE_URL = "sqlite:///./mentor_mentee.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 데이터베이스 설정 (storage.py: 환경 변수 기반 PRAGMA/커넥션 풀)
+# 동기 엔진은 스키마 생성과 스크립트용, 비동기 엔진은 API 엔드포인트용
+SQLALCHEMY_DATABASE_URL = storage.settings.database_url
+engine = storage.engine
+SessionLocal = storage.SessionLocal
+async_engine = storage.async_engine
+AsyncSessionLocal = storage.AsyncSessionLocal
 Base = declarative_base()
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # JWT 스키마
 security = HTTPBearer()
 
@@ -46,6 +70,14 @@ app = FastAPI(
     openapi_url="/openapi.json"
 )
 
+@app.on_event("shutdown")
+async def shutdown_workers():
+    thumbnails.shutdown_pool()
+    image_workers.shutdown()
+    password_workers.shutdown()
+    events.broker.close_all()
+    await async_engine.dispose()
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -53,6 +85,45 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Next-Cursor", "X-Status-Counts", app_logging.REQUEST_ID_HEADER,
+        query_tracker.QUERY_COUNT_HEADER, query_tracker.QUERY_TIME_HEADER,
+    ],
+)
+
+# 라우트별 요청당 SQL 문 수 상한 (없는 라우트는 DB_QUERY_BUDGET_DEFAULT)
+# 목록 API도 결과 개수와 무관하게 일정해야 하므로 고정 값
+QUERY_BUDGETS = {
+    "POST /api/signup": 4,
+    "POST /api/login": 1,
+    "GET /api/me": 2,
+    "GET /api/images/{role}/{user_id}": 3,
+    "PUT /api/profile": 7,  # 멘토: 사용자 조회/수정 + mentor_skills, mentor_search 교체
+    "GET /api/mentors": 2,
+    "GET /api/mentors/recommended": 4,  # 색인을 처음 만들 때의 멘토 전체 조회 포함
+    "POST /api/match-requests": 4,
+    "GET /api/match-requests/stream": 1,
+    "GET /api/match-requests/incoming": 4,
+    "GET /api/match-requests/outgoing": 4,
+    "PUT /api/match-requests/{request_id}/accept": 5,
+    "PUT /api/match-requests/{request_id}/reject": 3,
+    "DELETE /api/match-requests/{request_id}": 3,
+    "POST /api/match-requests/bulk": 5,
+}
+query_tracker.install(app, engines=[async_engine.sync_engine], budgets=QUERY_BUDGETS)
+
+# 요청 id (쿼리 추적 미들웨어 바깥: 쿼리 예산 경고 로그에도 요청 id가 붙음)
+app.add_middleware(app_logging.RequestContextMiddleware)
+
+# Prometheus 메트릭 (마지막에 추가되어 가장 바깥 미들웨어: 요청 id, 쿼리 추적, CORS 처리까지 포함해 측정)
+# 미들웨어 순서 (바깥 -> 안쪽): 메트릭 -> 요청 id -> 쿼리 추적 -> CORS -> 라우트
+metrics.install(
+    app,
+    engines=[engine, async_engine.sync_engine],
+    pools={"password": password_workers, "image": image_workers},
+    caches={"token": token_cache, "mentor_directory": directory_cache},
+    mentor_index=mentor_index,
+    broker=events.broker,
 )
 
 # 예외 핸들러
@@ -74,9 +145,29 @@ class User(Base):
     name = Column(String, nullable=True)
     role = Column(String, nullable=False)  # "mentor" or "mentee"
     bio = Column(Text, nullable=True)
-    image_data = Column(LargeBinary, nullable=True)
+    image_data = deferred(Column(LargeBinary, nullable=True), group="image")  # 레거시 blob (migrate.py images로 이전)
+    image_hash = Column(String(64), nullable=True)  # image_store의 SHA-256 키
     skills = Column(Text, nullable=True)  # JSON string for mentor skills
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # 멘토 목록 정렬/키셋 페이지네이션용 (이름이 NULL이어도 비교되도록 ''로 대체한 식 인덱스)
+        Index("ix_users_role_name_key_id", "role", func.coalesce(name, literal_column("''")), "id"),
+        Index("ix_users_role_skills_key_id", "role", func.coalesce(skills, literal_column("''")), "id"),
+        Index("ix_users_role_id", "role", "id"),
+    )
+
+class MentorSkill(Base):
+    """멘토 스킬 정규화 테이블 (users.skills JSON의 검색용 사본)"""
+    __tablename__ = "mentor_skills"
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    skill_normalized = Column(String, primary_key=True)  # 대소문자 무시 비교용
+    skill = Column(String, nullable=False)  # 원본 표기
+    
+    __table_args__ = (
+        Index("ix_mentor_skills_normalized_user", "skill_normalized", "user_id"),
+    )
 
 class MatchRequest(Base):
     __tablename__ = "match_requests"
@@ -88,8 +179,39 @@ class MatchRequest(Base):
     status = Column(String, default="pending")  # "pending", "accepted", "rejected", "cancelled"
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # 받은/보낸 요청 목록: 상태 필터 + 최근 변경순 정렬, 상태별 개수
+        Index("ix_match_requests_mentor_status_updated", "mentor_id", "status", "updated_at", "id"),
+        Index("ix_match_requests_mentee_status_updated", "mentee_id", "status", "updated_at", "id"),
+        # 전체 상태 목록 (status=all)
+        Index("ix_match_requests_mentor_updated", "mentor_id", "updated_at", "id"),
+        Index("ix_match_requests_mentee_updated", "mentee_id", "updated_at", "id"),
+        # 멘티당 대기 중 요청 1개, 멘토당 수락된 멘티 1명을 DB에서 보장
+        Index("uq_match_requests_pending_mentee", "mentee_id", unique=True,
+              sqlite_where=text("status = 'pending'")),
+        Index("uq_match_requests_accepted_mentor", "mentor_id", unique=True,
+              sqlite_where=text("status = 'accepted'")),
+    )
 
-# 데이터베이스 테이블 생성
+class MatchRequestTransition(Base):
+    """매칭 요청 상태 전이 기록"""
+    __tablename__ = "match_request_transitions"
+    
+    id = Column(Integer, primary_key=True)
+    request_id = Column(Integer, ForeignKey("match_requests.id", ondelete="CASCADE"), nullable=False, index=True)
+    from_status = Column(String, nullable=True)  # 생성 시 NULL
+    to_status = Column(String, nullable=False)
+    actor_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+# 허용되는 상태 전이 (대기 중인 요청만 수락/거절/취소 가능)
+MATCH_REQUEST_TRANSITIONS = {
+    "pending": ("accepted", "rejected", "cancelled"),
+}
+
+# 데이터베이스 테이블 생성 (멘토 검색용 FTS5 테이블 포함)
+mentor_search.install(Base.metadata)
 Base.metadata.create_all(bind=engine)
 
 # Pydantic 모델
@@ -131,12 +253,53 @@ class MatchRequestCreate(BaseModel):
     menteeId: int
     message: str
 
+BULK_ACTIONS = ("reject", "cancel", "accept-one-reject-rest")
+MAX_BULK_IDS = 500
+
+class BulkMatchRequestAction(BaseModel):
+    action: str
+    ids: List[int]
+    acceptId: Optional[int] = None  # accept-one-reject-rest에서 수락할 요청
+    
+    @validator('action')
+    def validate_action(cls, v):
+        if v not in BULK_ACTIONS:
+            raise ValueError(f'Action must be one of {", ".join(BULK_ACTIONS)}')
+        return v
+    
+    @validator('ids')
+    def validate_ids(cls, v):
+        if not v:
+            raise ValueError('ids must not be empty')
+        if len(v) > MAX_BULK_IDS:
+            raise ValueError(f'At most {MAX_BULK_IDS} ids are allowed')
+        return list(dict.fromkeys(v))  # 중복 제거 (순서 유지)
+
+class BulkActionResult(BaseModel):
+    id: int
+    outcome: str  # "updated", "not_found", "not_pending"
+    # accept-one-reject-rest에서 ids에 없지만 함께 거절된 요청은 ids 뒤에 outcome="updated"로 추가
+    status: Optional[str] = None  # 처리 후(또는 현재) 상태
+
+class BulkActionResponse(BaseModel):
+    action: str
+    updated: int
+    results: List[BulkActionResult]
+
+class CounterpartSummary(BaseModel):
+    id: int
+    name: str
+    role: str
+    imageUrl: str
+    skills: List[str] = []
+
 class MatchRequestResponse(BaseModel):
     id: int
     mentorId: int
     menteeId: int
     message: str
     status: str
+    counterpart: Optional[CounterpartSummary] = None  # include=counterpart일 때만 포함
 
 class UserProfile(BaseModel):
     name: str
@@ -156,22 +319,24 @@ class MentorResponse(BaseModel):
     role: str
     profile: UserProfile
 
+class RecommendedMentorResponse(MentorResponse):
+    score: float  # 멘티 소개글과의 코사인 유사도 (0~1)
+
 class ErrorResponse(BaseModel):
     detail: str
 
 # 의존성 함수
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password):
-    return pwd_context.hash(password)
+def password_pool_busy() -> HTTPException:
+    """비밀번호 풀이 포화되었을 때의 503 응답"""
+    return HTTPException(
+        status_code=503,
+        detail="Authentication service is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -196,8 +361,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(request: Request, db: Session = Depends(get_db)):
-    """Authorization 헤더를 직접 확인하여 401을 반환"""
+async def _authenticate(request: Request, db: AsyncSession) -> Principal:
+    """Authorization 헤더의 Bearer 토큰을 검증하여 Principal을 반환 (실패 시 401)"""
     auth_header = request.headers.get("Authorization")
     
     if not auth_header:
@@ -216,6 +381,12 @@ def get_current_user(request: Request, db: Session = Depends(get_db)):
     
     token = auth_header.split(" ")[1]
     
+    # 이미 검증한 토큰이면 jwt.decode와 DB 조회 생략
+    cache_key = token_key(token)
+    principal = token_cache.get(cache_key)
+    if principal is not None:
+        return principal
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -233,52 +404,31 @@ def get_current_user(request: Request, db: Session = Depends(get_db)):
         if user_id is None:
             raise credentials_exception
     except JWTError as e:
-        print(f"JWT Error: {e}")  # 디버깅용
+        # 잘못된/만료된 토큰은 반복될 수 있으므로 샘플링
+        log_event(logger, logging.WARNING, "jwt_invalid", sample=True, error=e)
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = (await db.execute(
+        select(User.id, User.role, User.email, User.name).where(User.id == int(user_id))
+    )).first()
     if user is None:
         raise credentials_exception
-    return user
+    
+    principal = Principal(id=user.id, role=user.role, email=user.email, name=user.name)
+    token_cache.put(cache_key, principal, expires_at=payload["exp"])
+    return principal
+
+async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)) -> Principal:
+    """Authorization 헤더를 직접 확인하여 401을 반환"""
+    return await _authenticate(request, db)
 
-def get_current_user_optional(request: Request, db: Session = Depends(get_db)):
+async def get_current_user_optional(request: Request, db: AsyncSession = Depends(get_db)) -> Principal:
     """토큰이 없어도 401 대신 None을 반환하는 버전 (실제론 401 반환)"""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header missing",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    if not auth_header.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    token = auth_header.split(" ")[1]
-    try:
-        payload = jwt.decode(
-            token,
-            SECRET_KEY,
-            algorithms=[ALGORITHM],
-            options={"verify_aud": False}
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except JWTError as e:
-        print(f"JWT Error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    return await _authenticate(request, db)
+
+async def load_current_user(db: AsyncSession, principal: Principal) -> User:
+    """전체 사용자 행이 필요한 엔드포인트용"""
+    user = await db.get(User, principal.id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -287,9 +437,146 @@ def get_current_user_optional(request: Request, db: Session = Depends(get_db)):
         )
     return user
 
+def normalize_skill(skill: str) -> str:
+    """스킬 비교용 정규화 (앞뒤 공백 제거 + 대소문자 무시)"""
+    return skill.strip().casefold()
+
+def mentor_skill_rows(user_id: int, skills: List[str]) -> List[MentorSkill]:
+    """스킬 목록을 중복 없는 mentor_skills 행으로 변환"""
+    rows = []
+    seen = set()
+    for skill in skills:
+        if not isinstance(skill, str):
+            continue
+        normalized = normalize_skill(skill)
+        if not normalized or normalized in seen:
+            continue
+        seen.add(normalized)
+        rows.append(MentorSkill(user_id=user_id, skill=skill.strip(), skill_normalized=normalized))
+    return rows
+
+def sync_mentor_skills(db: Session, user_id: int, skills: List[str]):
+    """mentor_skills 테이블을 주어진 스킬 목록으로 교체 (스크립트용 동기 버전, 커밋은 호출자가 수행)"""
+    db.execute(delete(MentorSkill).where(MentorSkill.user_id == user_id))
+    db.add_all(mentor_skill_rows(user_id, skills))
+
+async def sync_mentor_skills_async(db: AsyncSession, user_id: int, skills: List[str]):
+    """mentor_skills 테이블을 주어진 스킬 목록으로 교체 (커밋은 호출자가 수행)"""
+    await db.execute(delete(MentorSkill).where(MentorSkill.user_id == user_id))
+    db.add_all(mentor_skill_rows(user_id, skills))
+
+# 프로필 이미지 캐시 설정 (버전이 붙은 URL은 내용이 바뀌지 않으므로 장기 캐시)
+IMAGE_CACHE_CONTROL_VERSIONED = "private, max-age=31536000, immutable"
+IMAGE_CACHE_CONTROL_UNVERSIONED = "private, no-cache"
+
+def profile_image_url(user: User) -> str:
+    """프로필 이미지 URL (이미지가 바뀌면 URL도 바뀌도록 해시 일부를 버전으로 붙임)"""
+    url = f"/api/images/{user.role}/{user.id}"
+    if user.image_hash:
+        url += f"?v={user.image_hash[:16]}"
+    return url
+
+def image_etag(image_hash: str) -> str:
+    """이미지 내용 해시 기반 strong ETag"""
+    return f'"{image_hash}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (목록, W/ 접두사, * 지원)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+# 멘토 목록 정렬 키 (None이면 id만으로 정렬)
+# ORDER BY, 커서 값, 키셋 비교가 모두 NULL이 아닌 같은 식을 써야 행이 누락되지 않음
+MENTOR_ORDERINGS = {
+    "name": func.coalesce(User.name, literal_column("''")),  # ix_users_role_name_key_id와 같은 식
+    "skill": func.coalesce(User.skills, literal_column("''")),  # ix_users_role_skills_key_id와 같은 식
+    "id": None,
+}
+
+def keyset_after(sort_column, key):
+    """(정렬 키, id)가 커서 이후인 멘토 행 조건"""
+    # 행 값 비교(tuple_)로 쓰면 SQLite가 role로만 인덱스를 탐색하고 앞쪽 행을 모두 훑으므로
+    # 정렬 키 범위 조건을 풀어 써서 커서 위치로 바로 탐색하게 함
+    return and_(sort_column >= key[0], or_(sort_column > key[0], User.id > key[1]))
+
+def pack_cursor(order: str, key: list) -> str:
+    """정렬 기준과 마지막 행의 정렬 키로 불투명 커서를 생성"""
+    raw = json.dumps({"o": order, "k": key}, ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def unpack_cursor(order: str, cursor: str, key_length: int) -> list:
+    """커서를 해석하여 정렬 키를 반환 (정렬 기준이 다르거나 형식이 잘못되면 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        key = data["k"]
+        if data["o"] != order or not isinstance(key, list) or len(key) != key_length:
+            raise ValueError("cursor mismatch")
+        if not isinstance(key[-1], int):
+            raise ValueError("invalid id")
+        return key
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def encode_cursor(order_by: str, mentor: User) -> str:
+    """마지막 멘토 행의 정렬 키로 커서를 생성"""
+    if order_by == "name":
+        key = [mentor.name or "", mentor.id]
+    elif order_by == "skill":
+        key = [mentor.skills or "", mentor.id]
+    else:
+        key = [mentor.id]
+    return pack_cursor(order_by, key)
+
+def decode_cursor(order_by: str, cursor: str) -> list:
+    """멘토 목록 커서를 해석"""
+    key = unpack_cursor(order_by, cursor, 1 if MENTOR_ORDERINGS[order_by] is None else 2)
+    if len(key) == 2 and not isinstance(key[0], str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
+
+def encode_search_cursor(score: float, mentor: User) -> str:
+    """검색 결과 마지막 행의 (관련도 점수, id)로 커서를 생성"""
+    return pack_cursor("search", [score, mentor.id])
+
+def decode_search_cursor(cursor: str) -> list:
+    """검색 결과 커서를 해석"""
+    key = unpack_cursor("search", cursor, 2)
+    if isinstance(key[0], bool) or not isinstance(key[0], (int, float)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
+
+MATCH_REQUEST_STATUSES = ("pending", "accepted", "rejected", "cancelled")
+
+def encode_request_cursor(status_filter: str, match_request) -> str:
+    """마지막 매칭 요청 행의 (updated_at, id)로 커서를 생성"""
+    return pack_cursor(status_filter, [match_request.updated_at.isoformat(), match_request.id])
+
+def decode_request_cursor(status_filter: str, cursor: str) -> tuple[datetime, int]:
+    """매칭 요청 목록 커서를 해석 (상태 필터가 다르면 400)"""
+    updated_at, request_id = unpack_cursor(status_filter, cursor, 2)
+    try:
+        return datetime.fromisoformat(updated_at), request_id
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+MAX_IMAGE_BYTES = 1024 * 1024
+
 def validate_image(image_data: bytes) -> tuple[bool, str]:
-    """이미지 유효성 검사"""
+    """이미지 유효성 검사 (바이트 길이 -> 헤더 순으로 확인하며 픽셀 전체 디코딩은 하지 않음)"""
     try:
+        # 파일 크기 확인 (1MB)
+        if len(image_data) > MAX_IMAGE_BYTES:
+            return False, f"이미지 파일 크기는 1MB 이하여야 합니다. (현재: {len(image_data) / 1024 / 1024:.2f}MB)"
+        
+        # Image.open은 헤더만 읽음
         image = Image.open(io.BytesIO(image_data))
         
         # 포맷 확인
@@ -301,14 +588,255 @@ def validate_image(image_data: bytes) -> tuple[bool, str]:
         if not (500 <= width <= 1000 and 500 <= height <= 1000):
             return False, f"이미지 크기는 500x500 ~ 1000x1000 픽셀이어야 합니다. (현재: {width}x{height})"
         
-        # 파일 크기 확인 (1MB)
-        if len(image_data) > 1024 * 1024:
-            return False, f"이미지 파일 크기는 1MB 이하여야 합니다. (현재: {len(image_data) / 1024 / 1024:.2f}MB)"
-        
         return True, "유효한 이미지입니다."
     except Exception as e:
         return False, f"이미지 처리 중 오류가 발생했습니다: {str(e)}"
 
+def decode_and_validate_image(encoded: str) -> tuple[bytes, bool, str]:
+    """base64 이미지를 디코딩하고 검증 (image_workers 풀에서 실행)"""
+    # 디코딩 전에 base64 길이로 크기 초과를 먼저 거름
+    estimated_size = len(encoded) * 3 // 4 - encoded[-2:].count("=")
+    if estimated_size > MAX_IMAGE_BYTES:
+        return b"", False, f"이미지 파일 크기는 1MB 이하여야 합니다. (현재: {estimated_size / 1024 / 1024:.2f}MB)"
+    image_data = base64.b64decode(encoded)
+    is_valid, message = validate_image(image_data)
+    return image_data, is_valid, message
+
+def match_request_response(row, counterpart: Optional[CounterpartSummary] = None) -> MatchRequestResponse:
+    """MatchRequest 행(ORM 객체 또는 RETURNING 결과)을 응답으로 변환"""
+    return MatchRequestResponse(
+        id=row.id,
+        mentorId=row.mentor_id,
+        menteeId=row.mentee_id,
+        message=row.message,
+        status=row.status,
+        counterpart=counterpart
+    )
+
+COUNTERPART_TOP_SKILLS = 3
+
+async def load_counterpart_summaries(db: AsyncSession, user_ids) -> dict:
+    """상대방 요약 정보를 한 번의 IN 조회로 가져옴 (페이지 크기와 무관하게 쿼리 1회)"""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    rows = (await db.execute(
+        select(User.id, User.name, User.role, User.image_hash, User.skills).where(User.id.in_(user_ids))
+    )).all()
+    summaries = {}
+    for row in rows:
+        try:
+            skills = json.loads(row.skills) if row.skills else []
+        except ValueError:
+            skills = []
+        summaries[row.id] = CounterpartSummary(
+            id=row.id,
+            name=row.name or "",
+            role=row.role,
+            imageUrl=profile_image_url(row),
+            skills=skills[:COUNTERPART_TOP_SKILLS] if isinstance(skills, list) else []
+        )
+    return summaries
+
+async def match_request_list_response(db: AsyncSession, requests, counterpart_column: str, include: Optional[str]) -> list:
+    """목록 응답 생성 (include=counterpart이면 상대방 요약을 일괄 조회하여 포함)"""
+    if include not in (None, "", "counterpart"):
+        raise HTTPException(status_code=400, detail="Invalid include")
+    if include != "counterpart":
+        return [match_request_response(req) for req in requests]
+    
+    summaries = await load_counterpart_summaries(db, (getattr(req, counterpart_column) for req in requests))
+    return [
+        match_request_response(req, summaries.get(getattr(req, counterpart_column)))
+        for req in requests
+    ]
+
+async def transition_match_requests(db: AsyncSession, actor_id: int, to_status: str, *conditions) -> list:
+    """조건에 맞는 pending 요청을 단일 UPDATE ... RETURNING으로 전이하고 전이 기록을 남김
+    
+    변경된 행 목록을 반환하며, 비어 있으면 조건에 맞는 pending 요청이 없었던 것입니다.
+    커밋은 호출자가 수행합니다.
+    """
+    from_status = "pending"
+    assert to_status in MATCH_REQUEST_TRANSITIONS[from_status]
+    now = datetime.utcnow()
+    rows = (await db.execute(
+        update(MatchRequest)
+        .where(MatchRequest.status == from_status, *conditions)
+        .values(status=to_status, updated_at=now)
+        .returning(MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id,
+                   MatchRequest.message, MatchRequest.status)
+        .execution_options(synchronize_session=False)
+    )).all()
+    if rows:
+        await db.execute(insert(MatchRequestTransition), [
+            {"request_id": row.id, "from_status": from_status, "to_status": to_status,
+             "actor_id": actor_id, "created_at": now}
+            for row in rows
+        ])
+    return rows
+
+def publish_match_events(event_type: str, rows):
+    """커밋된 요청 변경을 관련 멘토/멘티의 이벤트 스트림으로 전달"""
+    for row in rows:
+        events.broker.publish(
+            event_type, (row.mentor_id, row.mentee_id), match_request_response(row).model_dump(exclude={"counterpart"})
+        )
+
+async def raise_transition_failed(db: AsyncSession, request_id: int, owner_condition):
+    """전이가 0건일 때 원인 구분: 내 요청이 아니면 404, 이미 처리된 요청이면 400"""
+    current_status = await db.scalar(
+        select(MatchRequest.status).where(MatchRequest.id == request_id, owner_condition)
+    )
+    if current_status is None:
+        raise HTTPException(status_code=404, detail="Match request not found")
+    raise HTTPException(status_code=400, detail=f"Match request is already {current_status}")
+
+async def list_match_requests(
+    db: AsyncSession,
+    response: Response,
+    owner_column,
+    owner_id: int,
+    status_filter: str,
+    limit: int,
+    cursor: Optional[str],
+    since: Optional[datetime],
+) -> list:
+    """받은/보낸 요청 목록 조회 (최근 변경순 키셋 페이지네이션)
+    
+    다음 페이지 커서는 X-Next-Cursor, 상태별 전체 개수는 X-Status-Counts 헤더로 전달합니다.
+    """
+    if status_filter != "all" and status_filter not in MATCH_REQUEST_STATUSES:
+        raise HTTPException(status_code=400, detail="Invalid status")
+    
+    query = select(MatchRequest).where(owner_column == owner_id)
+    if status_filter != "all":
+        query = query.where(MatchRequest.status == status_filter)
+    if since:
+        # since는 UTC 기준 (updated_at은 UTC naive로 저장)
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        query = query.where(MatchRequest.updated_at > since)
+    if cursor:
+        updated_at, request_id = decode_request_cursor(status_filter, cursor)
+        query = query.where(tuple_(MatchRequest.updated_at, MatchRequest.id) < tuple_(updated_at, request_id))
+    
+    # 정렬 (ix_match_requests_*_updated 인덱스 역순 스캔)
+    query = query.order_by(MatchRequest.updated_at.desc(), MatchRequest.id.desc()).limit(limit + 1)
+    requests = (await db.execute(query)).scalars().all()
+    if len(requests) > limit:
+        requests = requests[:limit]
+        response.headers["X-Next-Cursor"] = encode_request_cursor(status_filter, requests[-1])
+    
+    # 상태별 개수 (ix_match_requests_*_status_updated 인덱스만 사용)
+    counts = dict.fromkeys(MATCH_REQUEST_STATUSES, 0)
+    counts.update((await db.execute(
+        select(MatchRequest.status, func.count()).where(owner_column == owner_id).group_by(MatchRequest.status)
+    )).all())
+    response.headers["X-Status-Counts"] = ",".join(f"{name}={count}" for name, count in counts.items())
+    
+    return requests
+
+MENTOR_LIST_ADAPTER = TypeAdapter(List[MentorResponse])
+
+async def build_mentor_page(
+    db: AsyncSession,
+    skill_key: Optional[str],
+    order_by: str,
+    limit: Optional[int],
+    cursor: Optional[str],
+    q: Optional[str] = None,
+) -> DirectoryPage:
+    """멘토 목록 한 페이지를 조회하여 JSON 바이트로 직렬화 (q가 있으면 관련도순)"""
+    sort_column = MENTOR_ORDERINGS[order_by]
+    search = mentor_search.ranked_matches(q) if q else None
+    
+    if search is not None:
+        query = select(User, search.c.score).join(search, search.c.user_id == User.id)
+    else:
+        query = select(User)
+    query = query.where(User.role == "mentor")
+    
+    # 스킬 필터링 (mentor_skills 인덱스 조회, 대소문자 무시 정확히 일치)
+    if skill_key:
+        query = query.join(MentorSkill, MentorSkill.user_id == User.id).where(
+            MentorSkill.skill_normalized == skill_key
+        )
+    
+    # 커서 이후 행만 조회
+    if cursor:
+        if search is not None:
+            key = decode_search_cursor(cursor)
+            query = query.where(tuple_(search.c.score, User.id) > tuple_(key[0], key[1]))
+        else:
+            key = decode_cursor(order_by, cursor)
+            if sort_column is None:
+                query = query.where(User.id > key[0])
+            else:
+                query = query.where(keyset_after(sort_column, key))
+    
+    # 정렬 (검색은 bm25 점수순, 그 외에는 users 인덱스 순서와 일치)
+    if search is not None:
+        query = query.order_by(search.c.score, User.id)
+    elif sort_column is None:
+        query = query.order_by(User.id)
+    else:
+        query = query.order_by(sort_column, User.id)
+    
+    if limit:
+        query = query.limit(limit + 1)
+    rows = (await db.execute(query)).all()
+    
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        if search is not None:
+            next_cursor = encode_search_cursor(rows[-1].score, rows[-1][0])
+        else:
+            next_cursor = encode_cursor(order_by, rows[-1][0])
+    mentors = [row[0] for row in rows]
+    
+    # 응답 생성
+    result = []
+    for mentor in mentors:
+        image_url = profile_image_url(mentor)
+        profile = UserProfile(
+            name=mentor.name or "",
+            bio=mentor.bio or "",
+            imageUrl=image_url
+        )
+        
+        if mentor.skills:
+            try:
+                profile.skills = json.loads(mentor.skills)
+            except:
+                profile.skills = []
+        
+        result.append(MentorResponse(
+            id=mentor.id,
+            email=mentor.email,
+            role=mentor.role,
+            profile=profile
+        ))
+    
+    return DirectoryPage(body=MENTOR_LIST_ADAPTER.dump_json(result), next_cursor=next_cursor)
+
+_mentor_index_lock = asyncio.Lock()
+
+async def ensure_mentor_index(db: AsyncSession):
+    """추천 색인이 없으면 DB의 멘토 전체로 생성 (첫 요청 한 번만)"""
+    if mentor_index.ready:
+        return
+    async with _mentor_index_lock:
+        if mentor_index.ready:
+            return
+        mentor_index.begin_build()
+        mentors = (await db.execute(
+            select(User.id, User.bio, User.skills).where(User.role == "mentor")
+        )).all()
+        await db.close()
+        await asyncio.to_thread(mentor_index.build, mentors)
+
 # API 엔드포인트
 
 @app.get("/")
@@ -316,8 +844,13 @@ async def root():
     """루트 URL에서 Swagger UI로 리다이렉트"""
     return RedirectResponse(url="/swagger-ui")
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus 텍스트 형식 메트릭"""
+    return Response(content=metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
 @app.post("/api/signup", status_code=201)
-async def signup(request: dict, db: Session = Depends(get_db)):
+async def signup(request: dict, db: AsyncSession = Depends(get_db)):
     """회원가입"""
     try:
         # 필수 필드 검증
@@ -336,12 +869,14 @@ async def signup(request: dict, db: Session = Depends(get_db)):
             raise HTTPException(status_code=400, detail="Invalid email format")
         
         # 이메일 중복 확인
-        existing_user = db.query(User).filter(User.email == email).first()
+        existing_user = await db.scalar(select(User.id).where(User.email == email))
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already registered")
+        # 해싱하는 동안 DB 연결을 풀에 반환
+        await db.close()
         
         # 사용자 생성
-        hashed_password = get_password_hash(request["password"])
+        hashed_password = await password_workers.run(get_password_hash, request["password"])
         user = User(
             email=email,
             password_hash=hashed_password,
@@ -350,16 +885,29 @@ async def signup(request: dict, db: Session = Depends(get_db)):
         )
         
         db.add(user)
-        db.commit()
+        try:
+            if user.role == "mentor":
+                await db.flush()
+                await sync_mentor_search_async(db, user)
+            await db.commit()
+        except IntegrityError:
+            # 해싱하는 사이 같은 이메일로 가입한 경우
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="Email already registered")
+        if user.role == "mentor":
+            directory_cache.bump()
+            mentor_index.upsert(user.id, user.bio, [])
         return {"message": "User created successfully"}
+    except PoolSaturated:
+        raise password_pool_busy()
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Signup error: {e}")
+        log_event(logger, logging.ERROR, "signup_failed", exc_info=e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.post("/api/login", response_model=TokenResponse)
-async def login(request: dict, db: Session = Depends(get_db)):
+async def login(request: dict, db: AsyncSession = Depends(get_db)):
     """로그인"""
     try:
         # 필수 필드 검증
@@ -369,9 +917,15 @@ async def login(request: dict, db: Session = Depends(get_db)):
                 detail="Missing email or password"
             )
         
-        user = db.query(User).filter(User.email == request["email"]).first()
+        user = (await db.execute(
+            select(User.id, User.email, User.name, User.role, User.password_hash).where(
+                User.email == request["email"]
+            )
+        )).first()
+        # 검증하는 동안 DB 연결을 풀에 반환
+        await db.close()
         
-        if not user or not verify_password(request["password"], user.password_hash):
+        if not user or not await password_workers.run(verify_password, request["password"], user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -387,18 +941,22 @@ async def login(request: dict, db: Session = Depends(get_db)):
         )
         
         return {"token": access_token}
+    except PoolSaturated:
+        raise password_pool_busy()
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Login error: {e}")
+        log_event(logger, logging.ERROR, "login_failed", exc_info=e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(principal: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     """내 정보 조회"""
     try:
+        current_user = await load_current_user(db, principal)
+        
         # 기본 이미지 URL 설정
-        image_url = f"/api/images/{current_user.role}/{current_user.id}"
+        image_url = profile_image_url(current_user)
         
         profile = UserProfile(
             name=current_user.name or "",
@@ -423,29 +981,69 @@ async def get_me(current_user: User = Depends(get_current_user)):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Get me error: {e}")
+        log_event(logger, logging.ERROR, "get_me_failed", exc_info=e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/images/{role}/{user_id}")
 async def get_profile_image(
     role: str, 
     user_id: int, 
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    v: Optional[str] = Query(None),
+    size: Optional[int] = Query(None, ge=1),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    """프로필 이미지 조회"""
+    """프로필 이미지 조회 (size로 썸네일 선택, ETag/If-None-Match 조건부 요청 지원)"""
     try:
         # 역할 검증
         if role not in ["mentor", "mentee"]:
             raise HTTPException(status_code=400, detail="Invalid role")
         
-        user = db.query(User).filter(User.id == user_id, User.role == role).first()
+        user = (await db.execute(
+            select(User.id, User.image_hash).where(User.id == user_id, User.role == role)
+        )).first()
         
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        if user.image_data:
-            return Response(content=user.image_data, media_type="image/jpeg")
+        if user.image_hash:
+            # 썸네일 변형 선택 (WebP를 받는 클라이언트에는 WebP)
+            variant_size = thumbnails.select_variant(size) if size else None
+            extension = "webp" if "image/webp" in request.headers.get("Accept", "") else "jpg"
+            variant_path = (
+                image_store.get_variant_path(user.image_hash, variant_size, extension)
+                if variant_size else None
+            )
+            if variant_path:
+                etag = image_etag(f"{user.image_hash}-{variant_size}.{extension}")
+                media_type = thumbnails.THUMBNAIL_FORMATS[extension][1]
+            else:
+                etag = image_etag(user.image_hash)
+                media_type = "image/jpeg"
+            
+            cache_headers = {
+                "ETag": etag,
+                "Cache-Control": (
+                    IMAGE_CACHE_CONTROL_VERSIONED
+                    if v and user.image_hash.startswith(v)
+                    else IMAGE_CACHE_CONTROL_UNVERSIONED
+                ),
+                "Vary": "Accept",
+            }
+            # 클라이언트가 같은 이미지를 갖고 있으면 파일을 열지 않고 304 응답
+            if etag_matches(request.headers.get("If-None-Match"), etag):
+                return Response(status_code=304, headers=cache_headers)
+            
+            image_path = variant_path or image_store.get_path(user.image_hash)
+            if image_path:
+                # 파일 응답: 서버가 지원하면 커널이 직접 복사 (sendfile)
+                return FileResponse(image_path, media_type=media_type, headers=cache_headers)
+        
+        # 아직 마이그레이션되지 않은 레거시 blob
+        legacy_image = await db.scalar(select(User.image_data).where(User.id == user_id))
+        if legacy_image:
+            return Response(content=legacy_image, media_type="image/jpeg")
         else:
             # 기본 이미지로 리다이렉트
             default_url = f"https://placehold.co/500x500.jpg?text={role.upper()}"
@@ -453,19 +1051,21 @@ async def get_profile_image(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Get profile image error: {e}")
+        log_event(logger, logging.ERROR, "get_profile_image_failed", exc_info=e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.put("/api/profile", response_model=UserResponse)
 async def update_profile(
     request: dict,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    principal: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """프로필 수정"""
     try:
-        print(f"프로필 업데이트 요청: {request}")
-        print(f"현재 사용자: {current_user.id}, 역할: {current_user.role}")
+        current_user = await load_current_user(db, principal)
+        # image 필드는 길이만 기록
+        log_event(logger, logging.DEBUG, "profile_update_requested",
+                  user_id=current_user.id, role=current_user.role, request=request)
         
         # 필수 필드 검증
         required_fields = ["id", "name", "role", "bio"]
@@ -483,33 +1083,59 @@ async def update_profile(
         # 이미지 처리
         if "image" in request and request["image"]:
             try:
-                image_data = base64.b64decode(request["image"])
-                is_valid, message = validate_image(image_data)
+                image_data, is_valid, message = await image_workers.run(
+                    decode_and_validate_image, request["image"]
+                )
                 if not is_valid:
-                    print(f"이미지 유효성 검사 실패: {message}")
+                    log_event(logger, logging.INFO, "profile_image_rejected", sample=True,
+                              user_id=current_user.id, reason=message)
                     raise HTTPException(status_code=400, detail=message)
-                current_user.image_data = image_data
-                print("이미지 업데이트 성공")
+                image_hash = image_store.put(image_data)
+                current_user.image_hash = image_hash
+                current_user.image_data = None
+                try:
+                    await thumbnails.generate_thumbnails(image_store, image_hash, image_data)
+                except Exception as e:
+                    # 썸네일이 없으면 원본으로 응답하므로 업로드는 계속 진행
+                    log_event(logger, logging.WARNING, "thumbnail_failed", image_hash=image_hash, error=e)
+                log_event(logger, logging.DEBUG, "profile_image_updated",
+                          user_id=current_user.id, image_hash=image_hash, size=len(image_data))
+            except PoolSaturated:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Image processing is busy, please retry",
+                    headers={"Retry-After": "1"},
+                )
             except binascii.Error:
                 error_msg = "잘못된 base64 이미지 데이터입니다."
-                print(f"Base64 디코딩 오류: {error_msg}")
+                log_event(logger, logging.INFO, "profile_image_rejected", sample=True,
+                          user_id=current_user.id, reason="invalid_base64")
                 raise HTTPException(status_code=400, detail=error_msg)
             except HTTPException:
                 raise
             except Exception as e:
                 error_msg = f"이미지 처리 중 오류가 발생했습니다: {str(e)}"
-                print(f"이미지 처리 예외: {error_msg}")
+                log_event(logger, logging.WARNING, "profile_image_error", user_id=current_user.id, exc_info=e)
                 raise HTTPException(status_code=400, detail=error_msg)
         
         # 멘토인 경우 스킬 처리
         if current_user.role == "mentor" and "skills" in request and request["skills"]:
             import json
             current_user.skills = json.dumps(request["skills"])
+            await sync_mentor_skills_async(db, current_user.id, request["skills"])
+        
+        if current_user.role == "mentor":
+            await sync_mentor_search_async(db, current_user)
         
-        db.commit()
+        await db.commit()
+        # 이름 등이 바뀌었으므로 캐시된 인증 정보 폐기
+        token_cache.invalidate_user(current_user.id)
+        if current_user.role == "mentor":
+            directory_cache.bump()
+            mentor_index.upsert(current_user.id, current_user.bio, parse_skills(current_user.skills))
         
         # 응답 생성
-        image_url = f"/api/images/{current_user.role}/{current_user.id}"
+        image_url = profile_image_url(current_user)
         profile = UserProfile(
             name=current_user.name or "",
             bio=current_user.bio or "",
@@ -532,73 +1158,91 @@ async def update_profile(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Update profile error: {e}")
+        log_event(logger, logging.ERROR, "update_profile_failed", exc_info=e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/mentors", response_model=List[MentorResponse])
 async def get_mentors(
     skill: Optional[str] = Query(None),
     order_by: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, max_length=200),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    """멘토 목록 조회 (멘티 전용)"""
+    """멘토 목록 조회 (멘티 전용, q로 이름·소개글·스킬 전문 검색, limit/cursor로 키셋 페이지네이션, 페이지별 JSON 캐시)"""
     try:
         if current_user.role != "mentee":
             raise HTTPException(status_code=403, detail="Only mentees can access mentor list")
         
-        query = db.query(User).filter(User.role == "mentor")
-        
-        # 스킬 필터링
-        if skill:
-            query = query.filter(User.skills.contains(f'"{skill}"'))
-        
-        mentors = query.all()
+        if order_by not in MENTOR_ORDERINGS:
+            order_by = "id"
+        skill_key = normalize_skill(skill) if skill else None
+        q = " ".join(q.split()) if q else None
+        cache_key = (skill_key, q, order_by, limit, cursor)
         
-        # 정렬
-        if order_by == "name":
-            mentors.sort(key=lambda x: x.name or "")
-        elif order_by == "skill":
-            mentors.sort(key=lambda x: x.skills or "")
-        else:
-            mentors.sort(key=lambda x: x.id)
-        
-        # 응답 생성
-        result = []
-        for mentor in mentors:
-            image_url = f"/api/images/{mentor.role}/{mentor.id}"
-            profile = UserProfile(
-                name=mentor.name or "",
-                bio=mentor.bio or "",
-                imageUrl=image_url
-            )
-            
-            if mentor.skills:
-                import json
-                try:
-                    profile.skills = json.loads(mentor.skills)
-                except:
-                    profile.skills = []
-            
-            result.append(MentorResponse(
-                id=mentor.id,
-                email=mentor.email,
-                role=mentor.role,
-                profile=profile
-            ))
+        page = directory_cache.get(cache_key)
+        if page is None:
+            version = directory_cache.version
+            started = time.perf_counter()
+            page = await build_mentor_page(db, skill_key, order_by, limit, cursor, q)
+            directory_cache.put(cache_key, page, version, time.perf_counter() - started)
         
-        return result
+        headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+        return Response(content=page.body, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Get mentors error: {e}")
+        log_event(logger, logging.ERROR, "get_mentors_failed", exc_info=e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.get("/api/mentors/recommended", response_model=List[RecommendedMentorResponse])
+async def get_recommended_mentors(
+    k: int = Query(10, ge=1, le=50),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """내 소개글과 비슷한 멘토 추천 (멘티 전용, TF-IDF 코사인 유사도 상위 k명)"""
+    if current_user.role != "mentee":
+        raise HTTPException(status_code=403, detail="Only mentees can get mentor recommendations")
+    
+    bio = await db.scalar(select(User.bio).where(User.id == current_user.id))
+    await ensure_mentor_index(db)
+    ranked = await asyncio.to_thread(mentor_index.top_k, bio, k)
+    if not ranked:
+        return []
+    
+    mentors = {
+        mentor.id: mentor
+        for mentor in (await db.execute(
+            select(User).where(User.id.in_([mentor_id for mentor_id, _ in ranked]), User.role == "mentor")
+        )).scalars()
+    }
+    result = []
+    for mentor_id, score in ranked:
+        mentor = mentors.get(mentor_id)
+        if mentor is None:
+            continue
+        result.append(RecommendedMentorResponse(
+            id=mentor.id,
+            email=mentor.email,
+            role=mentor.role,
+            profile=UserProfile(
+                name=mentor.name or "",
+                bio=mentor.bio or "",
+                imageUrl=profile_image_url(mentor),
+                skills=parse_skills(mentor.skills)
+            ),
+            score=round(score, 4)
+        ))
+    return result
+
 @app.post("/api/match-requests", response_model=MatchRequestResponse)
 async def create_match_request(
     request: dict,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """매칭 요청 생성 (멘티 전용)"""
     try:
@@ -611,198 +1255,267 @@ async def create_match_request(
             if field not in request:
                 raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
         
+        # 다른 멘티 명의로 요청할 수 없음 (pending 유일성 인덱스가 mentee_id 기준이므로 필수)
+        if str(request["menteeId"]) != str(current_user.id):
+            raise HTTPException(status_code=403, detail="menteeId must match the current user")
+        
         # 멘토 존재 확인
-        mentor = db.query(User).filter(User.id == request["mentorId"], User.role == "mentor").first()
+        mentor = await db.scalar(select(User.id).where(User.id == request["mentorId"], User.role == "mentor"))
         if not mentor:
             raise HTTPException(status_code=400, detail="Mentor not found")
         
-        # 기존 pending 요청 확인 (한 번에 하나의 요청만)
-        existing_request = db.query(MatchRequest).filter(
-            MatchRequest.mentee_id == current_user.id,
-            MatchRequest.status == "pending"
-        ).first()
-        
-        if existing_request:
-            raise HTTPException(status_code=400, detail="You already have a pending request")
-        
-        # 매칭 요청 생성
+        # 매칭 요청 생성 (한 번에 하나의 pending 요청만: uq_match_requests_pending_mentee)
         match_request = MatchRequest(
             mentor_id=request["mentorId"],
-            mentee_id=request["menteeId"],
+            mentee_id=current_user.id,
             message=request["message"],
             status="pending"
         )
         
         db.add(match_request)
-        db.commit()
-        db.refresh(match_request)
-        
-        return MatchRequestResponse(
-            id=match_request.id,
-            mentorId=match_request.mentor_id,
-            menteeId=match_request.mentee_id,
-            message=match_request.message,
-            status=match_request.status
-        )
+        try:
+            await db.flush()
+            db.add(MatchRequestTransition(
+                request_id=match_request.id,
+                from_status=None,
+                to_status="pending",
+                actor_id=current_user.id,
+            ))
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="You already have a pending request")
+        
+        publish_match_events("created", [match_request])
+        return match_request_response(match_request)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Create match request error: {e}")
+        log_event(logger, logging.ERROR, "create_match_request_failed", exc_info=e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.get("/api/match-requests/stream")
+async def stream_match_requests(
+    request: Request,
+    last_event_id: Optional[str] = Query(None, alias="lastEventId"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """내 매칭 요청 변경 이벤트 스트림 (SSE, Last-Event-ID 헤더 또는 lastEventId로 이어 받기)"""
+    # 스트림이 열려 있는 동안 DB 연결을 잡고 있지 않도록 즉시 반환
+    await db.close()
+    
+    resume_from = request.headers.get("last-event-id") or last_event_id
+    try:
+        resume_id = int(resume_from) if resume_from else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+    
+    subscription = events.broker.subscribe(current_user.id, resume_id)
+    return StreamingResponse(
+        events.event_stream(events.broker, subscription, events.SSE_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @app.get("/api/match-requests/incoming", response_model=List[MatchRequestResponse])
 async def get_incoming_requests(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    status_filter: str = Query("pending", alias="status"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    since: Optional[datetime] = Query(None),
+    include: Optional[str] = Query(None),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    """나에게 들어온 요청 목록 (멘토 전용)"""
+    """나에게 들어온 요청 목록 (멘토 전용, 기본값은 처리할 pending 요청)"""
     try:
         if current_user.role != "mentor":
             raise HTTPException(status_code=403, detail="Only mentors can access incoming requests")
         
-        requests = db.query(MatchRequest).filter(MatchRequest.mentor_id == current_user.id).all()
-        
-        return [
-            MatchRequestResponse(
-                id=req.id,
-                mentorId=req.mentor_id,
-                menteeId=req.mentee_id,
-                message=req.message,
-                status=req.status
-            )
-            for req in requests
-        ]
+        requests = await list_match_requests(
+            db, response, MatchRequest.mentor_id, current_user.id, status_filter, limit, cursor, since
+        )
+        return await match_request_list_response(db, requests, "mentee_id", include)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Get incoming requests error: {e}")
+        log_event(logger, logging.ERROR, "get_incoming_requests_failed", exc_info=e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/match-requests/outgoing", response_model=List[MatchRequestResponse])
 async def get_outgoing_requests(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    status_filter: str = Query("all", alias="status"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    since: Optional[datetime] = Query(None),
+    include: Optional[str] = Query(None),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """내가 보낸 요청 목록 (멘티 전용)"""
     if current_user.role != "mentee":
         raise HTTPException(status_code=403, detail="Only mentees can access outgoing requests")
     
-    requests = db.query(MatchRequest).filter(MatchRequest.mentee_id == current_user.id).all()
-    
-    return [
-        MatchRequestResponse(
-            id=req.id,
-            mentorId=req.mentor_id,
-            menteeId=req.mentee_id,
-            message=req.message,
-            status=req.status
-        )
-        for req in requests
-    ]
+    requests = await list_match_requests(
+        db, response, MatchRequest.mentee_id, current_user.id, status_filter, limit, cursor, since
+    )
+    return await match_request_list_response(db, requests, "mentor_id", include)
 
 @app.put("/api/match-requests/{request_id}/accept", response_model=MatchRequestResponse)
 async def accept_request(
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    """요청 수락 (멘토 전용)"""
+    """요청 수락 (멘토 전용, 같은 트랜잭션에서 나머지 대기 요청은 자동 거절)"""
     if current_user.role != "mentor":
         raise HTTPException(status_code=403, detail="Only mentors can accept requests")
     
-    # 요청 확인
-    match_request = db.query(MatchRequest).filter(
-        MatchRequest.id == request_id,
-        MatchRequest.mentor_id == current_user.id
-    ).first()
-    
-    if not match_request:
-        raise HTTPException(status_code=404, detail="Match request not found")
-    
-    # 이미 수락된 요청이 있는지 확인
-    existing_accepted = db.query(MatchRequest).filter(
-        MatchRequest.mentor_id == current_user.id,
-        MatchRequest.status == "accepted"
-    ).first()
-    
-    if existing_accepted:
+    try:
+        # 요청 수락 (멘토당 수락 1명: uq_match_requests_accepted_mentor)
+        accepted = await transition_match_requests(
+            db, current_user.id, "accepted",
+            MatchRequest.id == request_id,
+            MatchRequest.mentor_id == current_user.id,
+        )
+        if not accepted:
+            await raise_transition_failed(db, request_id, MatchRequest.mentor_id == current_user.id)
+        
+        # 나머지 대기 요청 자동 거절
+        auto_rejected = await transition_match_requests(
+            db, current_user.id, "rejected",
+            MatchRequest.mentor_id == current_user.id,
+            MatchRequest.id != request_id,
+        )
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(status_code=400, detail="You already have an accepted mentee")
     
-    # 요청 수락
-    match_request.status = "accepted"
-    match_request.updated_at = datetime.utcnow()
-    db.commit()
-    
-    return MatchRequestResponse(
-        id=match_request.id,
-        mentorId=match_request.mentor_id,
-        menteeId=match_request.mentee_id,
-        message=match_request.message,
-        status=match_request.status
-    )
+    publish_match_events("accepted", accepted)
+    publish_match_events("rejected", auto_rejected)
+    return match_request_response(accepted[0])
 
 @app.put("/api/match-requests/{request_id}/reject", response_model=MatchRequestResponse)
 async def reject_request(
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """요청 거절 (멘토 전용)"""
     if current_user.role != "mentor":
         raise HTTPException(status_code=403, detail="Only mentors can reject requests")
     
-    # 요청 확인
-    match_request = db.query(MatchRequest).filter(
+    rejected = await transition_match_requests(
+        db, current_user.id, "rejected",
         MatchRequest.id == request_id,
-        MatchRequest.mentor_id == current_user.id
-    ).first()
-    
-    if not match_request:
-        raise HTTPException(status_code=404, detail="Match request not found")
-    
-    # 요청 거절
-    match_request.status = "rejected"
-    match_request.updated_at = datetime.utcnow()
-    db.commit()
-    
-    return MatchRequestResponse(
-        id=match_request.id,
-        mentorId=match_request.mentor_id,
-        menteeId=match_request.mentee_id,
-        message=match_request.message,
-        status=match_request.status
+        MatchRequest.mentor_id == current_user.id,
     )
+    if not rejected:
+        await raise_transition_failed(db, request_id, MatchRequest.mentor_id == current_user.id)
+    await db.commit()
+    
+    publish_match_events("rejected", rejected)
+    return match_request_response(rejected[0])
 
 @app.delete("/api/match-requests/{request_id}", response_model=MatchRequestResponse)
 async def cancel_request(
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """요청 취소 (멘티 전용)"""
     if current_user.role != "mentee":
         raise HTTPException(status_code=403, detail="Only mentees can cancel requests")
     
-    # 요청 확인
-    match_request = db.query(MatchRequest).filter(
+    cancelled = await transition_match_requests(
+        db, current_user.id, "cancelled",
         MatchRequest.id == request_id,
-        MatchRequest.mentee_id == current_user.id
-    ).first()
+        MatchRequest.mentee_id == current_user.id,
+    )
+    if not cancelled:
+        await raise_transition_failed(db, request_id, MatchRequest.mentee_id == current_user.id)
+    await db.commit()
     
-    if not match_request:
-        raise HTTPException(status_code=404, detail="Match request not found")
+    publish_match_events("cancelled", cancelled)
+    return match_request_response(cancelled[0])
+
+@app.post("/api/match-requests/bulk", response_model=BulkActionResponse)
+async def bulk_match_request_action(
+    payload: BulkMatchRequestAction,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """여러 요청을 한 트랜잭션에서 일괄 처리 (거절/취소는 멘토/멘티 본인 요청만, 수락 1건 + 나머지 거절은 멘토 전용)"""
+    if payload.action == "cancel":
+        if current_user.role != "mentee":
+            raise HTTPException(status_code=403, detail="Only mentees can cancel requests")
+        owner_condition = MatchRequest.mentee_id == current_user.id
+    else:
+        if current_user.role != "mentor":
+            raise HTTPException(status_code=403, detail="Only mentors can accept or reject requests")
+        owner_condition = MatchRequest.mentor_id == current_user.id
     
-    # 요청 취소
-    match_request.status = "cancelled"
-    match_request.updated_at = datetime.utcnow()
-    db.commit()
+    updated_rows = []
+    try:
+        if payload.action == "accept-one-reject-rest":
+            if payload.acceptId is None or payload.acceptId not in payload.ids:
+                raise HTTPException(status_code=400, detail="acceptId must be one of ids")
+            accepted = await transition_match_requests(
+                db, current_user.id, "accepted", MatchRequest.id == payload.acceptId, owner_condition
+            )
+            if not accepted:
+                await raise_transition_failed(db, payload.acceptId, owner_condition)
+            updated_rows.extend(accepted)
+            # 단건 수락과 동일하게 멘토의 나머지 pending 요청도 모두 거절
+            rejected = await transition_match_requests(
+                db, current_user.id, "rejected", owner_condition, MatchRequest.id != payload.acceptId
+            )
+            updated_rows.extend(rejected)
+        else:
+            to_status = "cancelled" if payload.action == "cancel" else "rejected"
+            updated_rows = await transition_match_requests(
+                db, current_user.id, to_status, MatchRequest.id.in_(payload.ids), owner_condition
+            )
+        
+        # 처리되지 않은 id는 한 번의 조회로 원인 구분
+        updated = {row.id: row.status for row in updated_rows}
+        missing = [request_id for request_id in payload.ids if request_id not in updated]
+        current = {}
+        if missing:
+            current = dict((await db.execute(
+                select(MatchRequest.id, MatchRequest.status).where(MatchRequest.id.in_(missing), owner_condition)
+            )).all())
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="You already have an accepted mentee")
     
-    return MatchRequestResponse(
-        id=match_request.id,
-        mentorId=match_request.mentor_id,
-        menteeId=match_request.mentee_id,
-        message=match_request.message,
-        status=match_request.status
+    for row in updated_rows:
+        publish_match_events(row.status, [row])
+    
+    results = []
+    for request_id in payload.ids:
+        if request_id in updated:
+            results.append(BulkActionResult(id=request_id, outcome="updated", status=updated[request_id]))
+        elif request_id in current:
+            results.append(BulkActionResult(id=request_id, outcome="not_pending", status=current[request_id]))
+        else:
+            results.append(BulkActionResult(id=request_id, outcome="not_found"))
+    # 호출자가 상태가 바뀐 요청을 모두 알 수 있도록 암묵적으로 거절된 요청도 보고
+    submitted = set(payload.ids)
+    results.extend(
+        BulkActionResult(id=row.id, outcome="updated", status=row.status)
+        for row in updated_rows if row.id not in submitted
+    )
+    
+    return BulkActionResponse(
+        action=payload.action,
+        updated=sum(result.outcome == "updated" for result in results),
+        results=results
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+"""
+멘토 전문 검색 (SQLite FTS5)
+멘토의 이름, 소개글, 스킬을 trigram 토크나이저로 색인합니다.
+trigram은 공백 단위 형태소 분석이 필요 없어 한글("머신러닝")과 영문("Spring Boot")
+부분 문자열 검색을 모두 지원하며, 대소문자를 구분하지 않습니다.
+
+mentor_search의 rowid는 users.id와 같습니다. mentor_skills와 마찬가지로
+회원가입과 프로필 수정 시 애플리케이션에서 갱신하며, 기존 데이터는
+`python migrate.py search`로 채웁니다.
+"""
+
+import json
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import DDL, Float, Integer, and_, column, event, func, literal, literal_column, or_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+SEARCH_TABLE = "mentor_search"
+
+mentor_search = table(
+    SEARCH_TABLE,
+    column("rowid", Integer),
+    column("name"),
+    column("bio"),
+    column("skills"),
+)
+
+CREATE_SEARCH_TABLE = DDL(
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+    "USING fts5(name, bio, skills, tokenize='trigram')"
+)
+DROP_SEARCH_TABLE = DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+# bm25 열 가중치 (이름 > 스킬 > 소개글)
+RANK_WEIGHTS = (10.0, 1.0, 5.0)
+
+# trigram 색인은 3글자 이상만 검색할 수 있음
+MIN_MATCH_LENGTH = 3
+
+MAX_QUERY_TERMS = 8
+
+def install(metadata):
+    """create_all/drop_all 시 FTS 테이블도 함께 생성/삭제되도록 등록"""
+    event.listen(metadata, "after_create", CREATE_SEARCH_TABLE.execute_if(dialect="sqlite"))
+    event.listen(metadata, "before_drop", DROP_SEARCH_TABLE.execute_if(dialect="sqlite"))
+
+def skills_text(skills_json: Optional[str]) -> str:
+    """users.skills JSON을 색인용 문자열로 변환"""
+    try:
+        skills = json.loads(skills_json) if skills_json else []
+    except ValueError:
+        return ""
+    if not isinstance(skills, list):
+        return ""
+    return " ".join(skill for skill in skills if isinstance(skill, str))
+
+def search_document(user_id: int, name: Optional[str], bio: Optional[str], skills_json: Optional[str]) -> dict:
+    """mentor_search 한 행"""
+    return {"rowid": user_id, "name": name or "", "bio": bio or "", "skills": skills_text(skills_json)}
+
+_DELETE = text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid")
+_INSERT = text(f"INSERT INTO {SEARCH_TABLE} (rowid, name, bio, skills) VALUES (:rowid, :name, :bio, :skills)")
+
+def sync_mentor_search(db: Session, user):
+    """멘토 한 명의 검색 문서를 교체 (스크립트용 동기 버전, 커밋은 호출자가 수행)"""
+    document = search_document(user.id, user.name, user.bio, user.skills)
+    db.execute(_DELETE, {"rowid": user.id})
+    db.execute(_INSERT, document)
+
+async def sync_mentor_search_async(db: AsyncSession, user):
+    """멘토 한 명의 검색 문서를 교체 (커밋은 호출자가 수행)"""
+    document = search_document(user.id, user.name, user.bio, user.skills)
+    await db.execute(_DELETE, {"rowid": user.id})
+    await db.execute(_INSERT, document)
+
+def insert_mentor_search(db, mentors: Iterable[Tuple[int, Optional[str], Optional[str], Optional[str]]]) -> int:
+    """(id, name, bio, skills) 목록의 검색 문서를 executemany로 추가 (Session/Connection 모두 가능)"""
+    documents = [search_document(*mentor) for mentor in mentors]
+    if documents:
+        db.execute(_INSERT, documents)
+    return len(documents)
+
+def clear_mentor_search(db: Session):
+    """검색 색인의 모든 문서를 삭제 (커밋은 호출자가 수행)"""
+    db.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+
+def rebuild_mentor_search(db: Session, mentors: Iterable[Tuple[int, Optional[str], Optional[str], Optional[str]]]) -> int:
+    """(id, name, bio, skills) 목록으로 검색 색인 전체를 다시 만듦 (커밋은 호출자가 수행)"""
+    clear_mentor_search(db)
+    return insert_mentor_search(db, mentors)
+
+def parse_query(q: str) -> Tuple[List[str], List[str]]:
+    """검색어를 MATCH로 찾을 단어(3글자 이상)와 LIKE로 찾을 짧은 단어로 분리"""
+    terms = list(dict.fromkeys(term for term in q.split() if term))[:MAX_QUERY_TERMS]
+    long_terms = [term for term in terms if len(term) >= MIN_MATCH_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_MATCH_LENGTH]
+    return long_terms, short_terms
+
+def match_expression(terms: List[str]) -> str:
+    """각 단어를 FTS5 문자열로 인용하여 AND로 결합 (연산자 주입 방지)"""
+    return " AND ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def ranked_matches(q: str):
+    """검색어에 맞는 (user_id, score) 서브쿼리 (score가 작을수록 관련도 높음), 검색어가 비면 None"""
+    long_terms, short_terms = parse_query(q)
+    if not long_terms and not short_terms:
+        return None
+
+    conditions = []
+    if long_terms:
+        conditions.append(literal_column(SEARCH_TABLE).op("MATCH")(match_expression(long_terms)))
+        score = func.bm25(literal_column(SEARCH_TABLE), *RANK_WEIGHTS)
+    else:
+        score = literal(0.0, Float)
+    # 짧은 단어는 trigram 색인을 쓸 수 없으므로 색인 대상 열에서 부분 일치 확인
+    for term in short_terms:
+        pattern = f"%{_escape_like(term)}%"
+        conditions.append(or_(*(
+            mentor_search.c[name].like(pattern, escape="\\") for name in ("name", "bio", "skills")
+        )))
+
+    return select(
+        mentor_search.c.rowid.label("user_id"),
+        score.label("score"),
+    ).where(and_(*conditions)).subquery("search")
@@ -0,0 +1,363 @@
+"""
+Prometheus 메트릭
+`/metrics`에서 Prometheus 텍스트 형식(0.0.4)으로 내보냅니다. 외부 클라이언트 라이브러리 없이
+카운터/게이지/히스토그램만 직접 구현하여 요청 경로에서의 비용을 최소화했습니다.
+
+- HTTP: 라우트 템플릿·메서드·상태 코드별 지연 시간 히스토그램, 메서드별 처리 중 요청 수
+  (SSE 같은 스트리밍 응답은 응답 헤더를 보낼 때까지의 시간을 기록)
+- DB: SQLAlchemy 엔진 이벤트로 문장 종류별 쿼리 수와 실행 시간
+- 워커 풀: bcrypt 해싱/검증, 이미지 검증 실행 시간 (대기열 대기 시간 제외)
+- 캐시/색인/이벤트 스트림: 스크레이프할 때 각 모듈의 stats()에서 읽음
+
+값은 프로세스 단위이므로 여러 워커로 실행하면 워커마다 따로 수집됩니다.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 초 단위 (API 응답은 대부분 수 ms, bcrypt는 수백 ms)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (라벨, 값) 목록: 스크레이프 시 수집기가 반환
+Samples = List[Tuple[Dict[str, str], float]]
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "_lock")
+
+    def __init__(self, upper_bounds: Sequence[float]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+class _Metric:
+    """라벨 조합별 자식 값을 가지는 메트릭 (라벨이 없으면 메서드를 바로 호출)"""
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _label_dict(self, values: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in list(self._children.items()):
+            lines.append(f"{self.name}{_format_labels(self._label_dict(values))} {_format_value(child.value)}")
+        return lines
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.upper_bounds = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in list(self._children.items()):
+            labels = self._label_dict(values)
+            with child._lock:
+                counts, total = list(child.counts), child.sum
+            cumulative = 0
+            for bound, count in zip(self.upper_bounds + (float("inf"),), counts):
+                cumulative += count
+                bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+class Registry:
+    """메트릭과 스크레이프 시점 수집기 목록"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        # (이름, 종류, 설명, 샘플을 돌려주는 함수)
+        self._collectors: List[Tuple[str, str, str, Callable[[], Samples]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, name: str, kind: str, documentation: str, collect: Callable[[], Samples]):
+        self._collectors.append((name, kind, documentation, collect))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        for name, kind, documentation, collect in self._collectors:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in collect():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+
+HTTP_REQUEST_SECONDS = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template, method and status.",
+    ("method", "route", "status"),
+))
+HTTP_IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed.", ("method",),
+))
+DB_QUERY_SECONDS = registry.register(Histogram(
+    "db_query_duration_seconds", "SQL statement execution time by statement type.", ("operation",),
+))
+DB_QUERY_ERRORS = registry.register(Counter(
+    "db_query_errors_total", "SQL statements that raised an error, by statement type.", ("operation",),
+))
+PASSWORD_SECONDS = registry.register(Histogram(
+    "password_hash_duration_seconds", "bcrypt hash/verify time in the password worker pool.", ("operation",),
+))
+IMAGE_VALIDATION_SECONDS = registry.register(Histogram(
+    "image_validation_duration_seconds", "Profile image decode and validation time in the image worker pool.",
+))
+
+# ---- HTTP ----
+
+UNMATCHED_ROUTE = "unmatched"  # 404 등 라우트가 없는 요청 (경로를 그대로 쓰면 라벨 수가 무한히 늘어남)
+
+def _is_stream(headers: Iterable[Tuple[bytes, bytes]]) -> bool:
+    for name, value in headers:
+        if name == b"content-type":
+            return value.startswith(b"text/event-stream")
+    return False
+
+class MetricsMiddleware:
+    """요청 지연 시간과 처리 중 요청 수를 기록하는 순수 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_flight = HTTP_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        started = time.perf_counter()
+        state = {"status": 500, "done": False}
+
+        def finish():
+            state["done"] = True
+            in_flight.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                method, getattr(route, "path", UNMATCHED_ROUTE), str(state["status"])
+            ).observe(time.perf_counter() - started)
+
+        async def send_with_metrics(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                if _is_stream(message.get("headers", ())):
+                    # 장시간 연결은 지연 시간 분포를 왜곡하므로 헤더 전송 시점에 기록
+                    finish()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            if not state["done"]:
+                finish()
+
+# ---- DB ----
+
+_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+def statement_operation(statement: str) -> str:
+    """SQL 문 종류 (SELECT/INSERT/UPDATE/DELETE, 그 밖은 OTHER)"""
+    keyword = statement.lstrip()[:6].upper()
+    return keyword if keyword in _OPERATIONS else "OTHER"
+
+# 컴파일 캐시 덕분에 같은 SQL 문이 반복되므로 문장별 히스토그램을 기억 (크기 제한)
+_statement_histograms: Dict[str, _HistogramChild] = {}
+_STATEMENT_CACHE_SIZE = 1024
+
+def _statement_histogram(statement: str) -> _HistogramChild:
+    histogram = _statement_histograms.get(statement)
+    if histogram is None:
+        if len(_statement_histograms) >= _STATEMENT_CACHE_SIZE:
+            _statement_histograms.clear()
+        histogram = _statement_histograms[statement] = DB_QUERY_SECONDS.labels(statement_operation(statement))
+    return histogram
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_metrics_started", None)
+    if started is not None:
+        _statement_histogram(statement).observe(time.perf_counter() - started)
+
+def _handle_error(exception_context):
+    if exception_context.statement is not None:
+        DB_QUERY_ERRORS.labels(statement_operation(exception_context.statement)).inc()
+
+def instrument_engine(engine):
+    """동기 엔진(비동기 엔진은 .sync_engine)에 쿼리 측정 이벤트 등록"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+# ---- 워커 풀 ----
+
+PASSWORD_OPERATIONS = {"get_password_hash": "hash", "verify_password": "verify"}
+
+def observe_password_task(func: Callable, seconds: float):
+    PASSWORD_SECONDS.labels(PASSWORD_OPERATIONS.get(func.__name__, func.__name__)).observe(seconds)
+
+def observe_image_task(func: Callable, seconds: float):
+    IMAGE_VALIDATION_SECONDS.observe(seconds)
+
+# ---- 스크레이프 시점 수집기 ----
+
+def _cache_collectors(caches: Dict[str, object]):
+    """stats()에 hits/misses/size가 있는 캐시들의 적중률"""
+    def samples(key: str) -> Callable[[], Samples]:
+        return lambda: [({"cache": name}, cache.stats()[key]) for name, cache in caches.items()]
+
+    registry.add_collector("cache_hits_total", "counter", "Cache hits.", samples("hits"))
+    registry.add_collector("cache_misses_total", "counter", "Cache misses.", samples("misses"))
+    registry.add_collector("cache_hit_ratio", "gauge", "Cache hit ratio since process start.", samples("hit_ratio"))
+    registry.add_collector("cache_entries", "gauge", "Entries currently cached.", samples("size"))
+
+def _stats_collector(name: str, kind: str, documentation: str, stats: Callable[[], dict], key: str,
+                     labels: Optional[Dict[str, str]] = None):
+    registry.add_collector(name, kind, documentation, lambda: [(labels or {}, float(stats()[key]))])
+
+def install(app, engines: Iterable, pools: Dict[str, object], caches: Dict[str, object],
+            mentor_index=None, broker=None):
+    """앱 미들웨어, 엔진 이벤트, 워커 풀 관찰자, 캐시/색인/이벤트 수집기를 등록"""
+    app.add_middleware(MetricsMiddleware)
+    for engine in engines:
+        instrument_engine(engine)
+
+    observers = {"password": observe_password_task, "image": observe_image_task}
+    for name, pool in pools.items():
+        if name in observers:
+            pool.on_complete = observers[name]
+    registry.add_collector(
+        "worker_pool_pending", "gauge", "Tasks running or queued in each worker pool.",
+        lambda: [({"pool": name}, pool.pending) for name, pool in pools.items()],
+    )
+    registry.add_collector(
+        "worker_pool_rejected_total", "counter", "Tasks rejected because the pool was saturated.",
+        lambda: [({"pool": name}, pool.rejected) for name, pool in pools.items()],
+    )
+
+    _cache_collectors(caches)
+
+    if mentor_index is not None:
+        _stats_collector("mentor_index_mentors", "gauge", "Mentors in the recommendation index.",
+                         mentor_index.stats, "mentors")
+        _stats_collector("mentor_index_delta_rows", "gauge", "Rows in the recommendation delta matrix.",
+                         mentor_index.stats, "delta_rows")
+        _stats_collector("mentor_index_builds_total", "counter", "Full recommendation index builds.",
+                         mentor_index.stats, "builds")
+    if broker is not None:
+        _stats_collector("sse_connections", "gauge", "Open match request event streams.", broker.stats, "connections")
+        _stats_collector("sse_events_published_total", "counter", "Match request events published.",
+                         broker.stats, "published")
+        _stats_collector("sse_events_delivered_total", "counter", "Events queued to stream connections.",
+                         broker.stats, "delivered")
+        _stats_collector("sse_overflows_total", "counter", "Slow stream connections dropped on queue overflow.",
+                         broker.stats, "overflows")
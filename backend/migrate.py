@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 마이그레이션 스크립트
+기존 데이터베이스를 현재 스키마에 맞게 변환합니다. 여러 번 실행해도 안전합니다.
+
+사용법:
+    python migrate.py              # 모든 단계 실행
+    python migrate.py indexes skills   # 지정한 단계만 실행
+"""
+
+import sys
+import json
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+from storage import engine, SessionLocal
+from main import Base, User, sync_mentor_skills
+from mentor_search import rebuild_mentor_search
+from concurrent.futures import ProcessPoolExecutor
+from image_store import image_store
+import thumbnails
+
+def add_missing_columns(db) -> int:
+    """모델에 추가되었지만 기존 테이블에 없는 컬럼을 ALTER TABLE로 추가합니다."""
+    count = 0
+    inspector = inspect(db.connection())
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            db.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+            count += 1
+    db.commit()
+    return count
+
+def create_missing_indexes(db) -> int:
+    """모델에 선언되었지만 기존 테이블에 없는 인덱스를 생성합니다."""
+    count = 0
+    existing = {
+        row[0] for row in db.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))
+    }
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                index.create(bind=db.connection())
+                db.commit()
+                count += 1
+            except IntegrityError as e:
+                # 유니크 인덱스와 충돌하는 기존 데이터는 자동으로 고치지 않음
+                db.rollback()
+                print(f"Warning: 인덱스 {index.name}을(를) 만들 수 없습니다. 중복 데이터를 정리한 뒤 다시 실행하세요: {e.orig}")
+    return count
+
+# 더 넓은 인덱스로 대체되어 더 이상 쓰지 않는 인덱스
+OBSOLETE_INDEXES = (
+    "ix_match_requests_mentor_status",
+    "ix_match_requests_mentee_status",
+)
+
+def drop_obsolete_indexes(db) -> int:
+    """대체된 인덱스를 삭제합니다."""
+    count = 0
+    for name in OBSOLETE_INDEXES:
+        exists = db.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"), {"name": name}
+        ).first()
+        if exists:
+            db.execute(text(f"DROP INDEX {name}"))
+            count += 1
+    db.commit()
+    return count
+
+def backfill_mentor_skills(db) -> int:
+    """users.skills JSON을 읽어 mentor_skills 테이블을 채웁니다."""
+    mentors = db.query(User.id, User.skills).filter(User.role == "mentor").all()
+    count = 0
+    for user_id, skills_json in mentors:
+        try:
+            skills = json.loads(skills_json) if skills_json else []
+        except ValueError:
+            print(f"Warning: 사용자 {user_id}의 skills JSON을 해석할 수 없어 건너뜁니다.")
+            continue
+        if not isinstance(skills, list):
+            continue
+        sync_mentor_skills(db, user_id, skills)
+        count += 1
+    db.commit()
+    return count
+
+def backfill_mentor_search(db) -> int:
+    """멘토 이름·소개글·스킬로 전문 검색 색인을 다시 만듭니다."""
+    mentors = db.query(User.id, User.name, User.bio, User.skills).filter(User.role == "mentor").all()
+    count = rebuild_mentor_search(db, mentors)
+    db.commit()
+    return count
+
+def move_images_to_store(db) -> int:
+    """users.image_data blob을 이미지 저장소로 옮기고 해시만 남긴 뒤 DB 파일을 압축합니다."""
+    user_ids = [
+        user_id for (user_id,) in db.query(User.id).filter(User.image_data.isnot(None)).all()
+    ]
+    for i, user_id in enumerate(user_ids, start=1):
+        # 한 번에 한 명의 blob만 메모리에 올림
+        image_data = db.query(User.image_data).filter(User.id == user_id).scalar()
+        digest = image_store.put(image_data)
+        db.query(User).filter(User.id == user_id).update(
+            {User.image_hash: digest, User.image_data: None}, synchronize_session=False
+        )
+        if i % 100 == 0:
+            db.commit()
+    db.commit()
+    
+    if user_ids:
+        # 비워진 페이지를 운영체제에 반환
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM"))
+    return len(user_ids)
+
+def backfill_thumbnails(db) -> int:
+    """썸네일 변형이 없는 저장 이미지에 대해 프로세스 풀에서 변형을 생성합니다."""
+    digests = [
+        digest for (digest,) in db.query(User.image_hash).filter(User.image_hash.isnot(None)).distinct()
+    ]
+    missing = [
+        digest for digest in digests
+        if image_store.get_path(digest) and not all(
+            image_store.get_variant_path(digest, size, extension)
+            for size in thumbnails.THUMBNAIL_SIZES
+            for extension in thumbnails.THUMBNAIL_FORMATS
+        )
+    ]
+    with ProcessPoolExecutor(max_workers=thumbnails.THUMBNAIL_WORKERS) as pool:
+        list(pool.map(thumbnails.render_and_store, [image_store.root] * len(missing), missing))
+    return len(missing)
+
+STEPS = {
+    "columns": ("누락된 컬럼 추가", add_missing_columns),
+    "indexes": ("누락된 인덱스 생성", create_missing_indexes),
+    "obsolete_indexes": ("대체된 인덱스 삭제", drop_obsolete_indexes),
+    "skills": ("멘토 스킬 테이블 백필", backfill_mentor_skills),
+    "search": ("멘토 검색 색인 생성", backfill_mentor_search),
+    "images": ("프로필 이미지를 디스크 저장소로 이전", move_images_to_store),
+    "thumbnails": ("썸네일 변형 백필", backfill_thumbnails),
+}
+
+def migrate(step_names):
+    """지정한 마이그레이션 단계를 순서대로 실행합니다."""
+    Base.metadata.create_all(bind=engine)
+    
+    db = SessionLocal()
+    try:
+        for name in step_names:
+            description, step = STEPS[name]
+            print(f"▶ {description} ({name})...")
+            result = step(db)
+            print(f"  ✅ 완료: {result}건 처리")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(STEPS)
+    unknown = [name for name in names if name not in STEPS]
+    if unknown:
+        print(f"❌ 알 수 없는 단계: {', '.join(unknown)} (가능한 단계: {', '.join(STEPS)})")
+        sys.exit(1)
+    migrate(names)
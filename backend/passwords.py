@@ -0,0 +1,15 @@
+"""
+비밀번호 해싱/검증
+bcrypt 호출은 수백 ms의 CPU를 쓰므로 API에서는 workers.password_workers 풀을 통해 실행합니다.
+프로세스 풀에서도 pickle로 전달할 수 있도록 무거운 의존성 없는 모듈로 분리했습니다.
+"""
+
+from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password):
+    return pwd_context.hash(password)
@@ -0,0 +1,172 @@
+"""
+요청별 SQL 쿼리 집계와 N+1 탐지
+요청마다 contextvar에 집계 객체를 두고, SQLAlchemy 엔진 이벤트에서 실행된 SQL 문 수와
+시간을 더합니다.
+
+- 개발 환경(`APP_ENV`가 production이 아님)에서는 `X-DB-Query-Count`/`X-DB-Time-Ms`
+  응답 헤더로 알려 주고, 모든 환경에서 라우트별 히스토그램을 /metrics에 기록합니다.
+- 라우트별 예산(요청당 최대 SQL 문 수)을 넘거나 같은 SQL 문이 반복 실행되면(N+1)
+  `DB_QUERY_BUDGET_MODE`에 따라 무시(off), 경고(warn), 예외(raise, 테스트용)로 처리합니다.
+  executemany는 한 번으로 셉니다.
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from sqlalchemy import event
+
+import metrics
+from app_logging import get_logger, log_event
+
+APP_ENV = os.getenv("APP_ENV", "development")
+QUERY_HEADERS = APP_ENV != "production"
+DB_QUERY_BUDGET_MODE = os.getenv("DB_QUERY_BUDGET_MODE", "warn")  # off | warn | raise
+DB_QUERY_BUDGET_DEFAULT = int(os.getenv("DB_QUERY_BUDGET_DEFAULT", "10"))
+DB_REPEATED_QUERY_LIMIT = int(os.getenv("DB_REPEATED_QUERY_LIMIT", "5"))
+
+logger = get_logger("query_tracker")
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time-Ms"
+
+DB_QUERIES_PER_REQUEST = metrics.registry.register(metrics.Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request.", ("method", "route"),
+    buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21, 34, 55, 89),
+))
+DB_SECONDS_PER_REQUEST = metrics.registry.register(metrics.Histogram(
+    "http_request_db_duration_seconds", "Total SQL execution time per HTTP request.", ("method", "route"),
+))
+DB_BUDGET_VIOLATIONS = metrics.registry.register(metrics.Counter(
+    "db_query_budget_violations_total", "Requests over their query budget or repeating a statement (N+1).",
+    ("method", "route", "reason"),
+))
+
+class QueryBudgetExceeded(AssertionError):
+    """요청의 쿼리 수가 예산을 넘거나 N+1 패턴이 감지된 경우 (raise 모드)"""
+
+class QueryStats:
+    """요청 하나의 SQL 실행 집계"""
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def most_repeated(self) -> Tuple[Optional[str], int]:
+        """가장 많이 반복된 SQL 문과 횟수"""
+        if not self.statements:
+            return None, 0
+        statement = max(self.statements, key=self.statements.get)
+        return statement, self.statements[statement]
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+def current() -> Optional[QueryStats]:
+    return _current.get()
+
+@contextmanager
+def track() -> Iterator[QueryStats]:
+    """HTTP 요청 밖(스크립트, 테스트)에서 블록 안의 쿼리를 집계"""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+# ---- 엔진 이벤트 ----
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current.get() is not None:
+        context._query_tracker_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = getattr(context, "_query_tracker_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+def instrument_engine(engine):
+    """동기 엔진(비동기 엔진은 .sync_engine)에 요청별 집계 이벤트 등록"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+# ---- 예산 ----
+
+def check_budget(route_key: str, stats: QueryStats, budgets: Dict[str, int],
+                 default_budget: int = DB_QUERY_BUDGET_DEFAULT,
+                 repeated_limit: int = DB_REPEATED_QUERY_LIMIT) -> Optional[Tuple[str, str]]:
+    """예산 위반이면 (reason, 설명), 아니면 None"""
+    budget = budgets.get(route_key, default_budget)
+    if stats.count > budget:
+        return "budget", f"{route_key}: {stats.count} queries (budget {budget})"
+    statement, repeats = stats.most_repeated()
+    if repeats > repeated_limit:
+        return "repeated", f"{route_key}: same statement executed {repeats} times (N+1?): {statement[:200]}"
+    return None
+
+class QueryTrackingMiddleware:
+    """요청별 쿼리 집계, 헤더/메트릭 기록, 예산 검사를 하는 순수 ASGI 미들웨어"""
+
+    def __init__(self, app, budgets: Dict[str, int], mode: str = DB_QUERY_BUDGET_MODE,
+                 headers: bool = QUERY_HEADERS):
+        if mode not in ("off", "warn", "raise"):
+            raise ValueError(f"Unknown DB_QUERY_BUDGET_MODE: {mode}")
+        self.app = app
+        self.budgets = budgets
+        self.mode = mode
+        self.headers = headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and self.headers:
+                message = {**message, "headers": [
+                    *message.get("headers", ()),
+                    (b"x-db-query-count", str(stats.count).encode("ascii")),
+                    (b"x-db-time-ms", f"{stats.seconds * 1000:.2f}".encode("ascii")),
+                ]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current.reset(token)
+
+        method = scope["method"]
+        route = getattr(scope.get("route"), "path", metrics.UNMATCHED_ROUTE)
+        DB_QUERIES_PER_REQUEST.labels(method, route).observe(stats.count)
+        DB_SECONDS_PER_REQUEST.labels(method, route).observe(stats.seconds)
+        if self.mode == "off":
+            return
+        violation = check_budget(f"{method} {route}", stats, self.budgets)
+        if violation is None:
+            return
+        reason, message = violation
+        DB_BUDGET_VIOLATIONS.labels(method, route, reason).inc()
+        if self.mode == "raise":
+            raise QueryBudgetExceeded(message)
+        log_event(logger, logging.WARNING, "query_budget_exceeded", sample=True,
+                  reason=reason, detail=message, queries=stats.count)
+
+def install(app, engines: Iterable, budgets: Dict[str, int]):
+    """앱 미들웨어와 엔진 이벤트 등록"""
+    app.add_middleware(QueryTrackingMiddleware, budgets=budgets)
+    for engine in engines:
+        instrument_engine(engine)
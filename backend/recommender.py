@@ -0,0 +1,268 @@
+"""
+멘토 추천 색인 (TF-IDF)
+멘토의 스킬과 소개글을 단어 빈도 희소 행렬로 보관하고, 멘티 소개글과의
+코사인 유사도를 희소 행렬-벡터 곱 한 번으로 계산하여 상위 k명을 고릅니다.
+
+- 단어: 소문자 영단어/숫자, 한글 단어와 그 2글자 조각(조사가 붙어도 일치하도록),
+  스킬은 "skill:<이름>" 토큰으로 한 번 더 넣어 가중치를 높입니다.
+- IDF는 문서 빈도(df)로 질의 시점에 계산하므로 멘토가 바뀌어도 행렬 전체를
+  다시 만들 필요가 없습니다.
+- 프로필이 바뀐 멘토는 기본 행렬의 행을 비활성화하고 작은 변경분(delta) 행렬에
+  새 행을 넣습니다. 변경분이 커지면 기본 행렬로 합칩니다.
+
+색인은 프로세스 메모리에 있으며 첫 추천 요청 때 DB에서 만들어집니다.
+"""
+
+import json
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+WORD_PATTERN = re.compile(r"[a-z0-9+#.]+|[가-힣]+")
+HANGUL_PATTERN = re.compile(r"[가-힣]+")
+
+# 변경분 행 수가 이 값과 기본 행렬의 10% 중 큰 값을 넘으면 합침
+MIN_COMPACT_ROWS = 256
+
+# 어미·조사에서 나오는 2글자 조각은 주제와 무관하므로 제외
+HANGUL_STOP_BIGRAMS = frozenset([
+    "니다", "습니", "합니", "입니", "됩니", "있습", "싶습", "었습", "았습", "했습",
+    "하고", "하는", "에서", "으로", "에게", "이고", "있는", "싶고", "하며", "해요",
+])
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """텍스트를 색인 단어 목록으로 변환"""
+    tokens = []
+    for word in WORD_PATTERN.findall((text or "").lower()):
+        word = word.strip(".")
+        if not word:
+            continue
+        tokens.append(word)
+        if HANGUL_PATTERN.fullmatch(word) and len(word) > 2:
+            tokens.extend(
+                bigram for bigram in (word[i:i + 2] for i in range(len(word) - 1))
+                if bigram not in HANGUL_STOP_BIGRAMS
+            )
+    return tokens
+
+def parse_skills(skills_json: Optional[str]) -> List[str]:
+    try:
+        skills = json.loads(skills_json) if skills_json else []
+    except ValueError:
+        return []
+    return [skill for skill in skills if isinstance(skill, str)] if isinstance(skills, list) else []
+
+def document_terms(bio: Optional[str], skills: Iterable[str]) -> Counter:
+    """멘토 한 명의 단어 빈도"""
+    terms = Counter(tokenize(bio))
+    for skill in skills:
+        terms.update(tokenize(skill))
+        normalized = " ".join(skill.lower().split())
+        if normalized:
+            terms[f"skill:{normalized}"] += 1
+    return terms
+
+@dataclass
+class _Snapshot:
+    """질의가 읽는 불변 상태 (갱신 시 새 스냅샷으로 교체)"""
+    base: sparse.csr_matrix            # (기본 멘토 수, 기본 어휘 수) 로그 스케일 단어 빈도
+    base_squared: sparse.csr_matrix    # 행 크기 계산용 base의 원소별 제곱
+    base_ids: np.ndarray
+    base_active: np.ndarray            # 변경되어 delta로 옮겨진 행은 0
+    delta: sparse.csr_matrix           # (변경된 멘토 수, 현재 어휘 수)
+    delta_ids: np.ndarray
+    df: np.ndarray                     # 어휘별 문서 빈도 (활성 행 기준)
+    documents: int
+    vocabulary: Dict[str, int] = field(default_factory=dict)
+    _weights: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def weights(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(idf², 행별 1/|tf·idf| (비활성 행은 0), 멘토 id) — 스냅샷마다 한 번만 계산"""
+        if self._weights is None:
+            idf = np.log((1.0 + self.documents) / (1.0 + self.df)) + 1.0
+            idf_squared = idf * idf
+            norms = np.concatenate([
+                np.sqrt(self.base_squared @ idf_squared[:self.base.shape[1]]),
+                np.sqrt(self.delta.multiply(self.delta) @ idf_squared),
+            ])
+            inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+            inverse_norms[:self.base.shape[0]] *= self.base_active
+            self._weights = (idf_squared, inverse_norms, np.concatenate([self.base_ids, self.delta_ids]))
+        return self._weights
+
+class MentorIndex:
+    """멘토 TF-IDF 추천 색인 (스레드 안전, 질의는 잠금 없이 스냅샷을 읽음)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._rows: Dict[int, Tuple[str, int]] = {}        # 멘토 id -> ("base" | "delta", 행 번호)
+        self._delta_terms: Dict[int, Counter] = {}         # delta 멘토의 단어 빈도
+        self._pending: Dict[int, Counter] = {}             # 색인 생성 중 들어온 변경
+        self._building = False
+        self.builds = 0
+        self.compactions = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    def begin_build(self):
+        """DB에서 멘토를 읽기 전에 호출 (그 사이의 변경은 보관했다가 적용)"""
+        with self._lock:
+            self._building = True
+            self._pending.clear()
+
+    def build(self, mentors: Iterable[Tuple[int, Optional[str], Optional[str]]]):
+        """(id, bio, skills JSON) 목록으로 색인 전체 생성"""
+        documents = {user_id: document_terms(bio, parse_skills(skills)) for user_id, bio, skills in mentors}
+        with self._lock:
+            documents.update(self._pending)
+            self._pending.clear()
+            self._building = False
+            vocabulary: Dict[str, int] = {}
+            for terms in documents.values():
+                for term in terms:
+                    vocabulary.setdefault(term, len(vocabulary))
+            ids = np.fromiter(documents, dtype=np.int64, count=len(documents))
+            self._install_base(_term_matrix(documents.values(), vocabulary), ids, vocabulary)
+            self.builds += 1
+
+    def upsert(self, user_id: int, bio: Optional[str], skills: Iterable[str]):
+        """멘토 한 명의 프로필 변경 반영 (변경분 행렬만 다시 만듦)"""
+        terms = document_terms(bio, skills)
+        with self._lock:
+            if self._building:
+                self._pending[user_id] = terms
+            if self._snapshot is None:
+                return
+            snapshot = self._snapshot
+            vocabulary = dict(snapshot.vocabulary)
+            df = snapshot.df.copy()
+            base_active = snapshot.base_active
+            documents = snapshot.documents
+
+            # 이전 문서의 df 기여분 제거
+            location = self._rows.get(user_id)
+            if location is None:
+                documents += 1
+            elif location[0] == "base":
+                row = location[1]
+                if base_active[row]:
+                    base_active = base_active.copy()
+                    base_active[row] = 0.0
+                    df[snapshot.base.indices[snapshot.base.indptr[row]:snapshot.base.indptr[row + 1]]] -= 1
+            else:
+                for term in self._delta_terms[user_id]:
+                    df[vocabulary[term]] -= 1
+
+            for term in terms:
+                if term not in vocabulary:
+                    vocabulary[term] = len(vocabulary)
+            if len(vocabulary) > len(df):
+                df = np.concatenate([df, np.zeros(len(vocabulary) - len(df))])
+            for term in terms:
+                df[vocabulary[term]] += 1
+
+            self._delta_terms[user_id] = terms
+            delta_ids = np.fromiter(self._delta_terms, dtype=np.int64, count=len(self._delta_terms))
+            delta = _term_matrix(self._delta_terms.values(), vocabulary)
+
+            if len(delta_ids) > max(MIN_COMPACT_ROWS, snapshot.base.shape[0] // 10):
+                # 활성 기본 행과 변경분을 새 기본 행렬로 합침 (어휘 번호는 그대로 유지)
+                active_rows = np.flatnonzero(base_active)
+                kept = snapshot.base[active_rows]
+                kept = sparse.csr_matrix((kept.data, kept.indices, kept.indptr), shape=(len(active_rows), len(vocabulary)))
+                base = sparse.vstack([kept, delta], format="csr")
+                self._install_base(base, np.concatenate([snapshot.base_ids[active_rows], delta_ids]), vocabulary)
+                self.compactions += 1
+                return
+
+            self._rows.update({int(mentor_id): ("delta", i) for i, mentor_id in enumerate(delta_ids)})
+            self._snapshot = _Snapshot(
+                base=snapshot.base, base_squared=snapshot.base_squared, base_ids=snapshot.base_ids,
+                base_active=base_active, delta=delta, delta_ids=delta_ids, df=df, documents=documents,
+                vocabulary=vocabulary,
+            )
+
+    def top_k(self, bio: Optional[str], k: int) -> List[Tuple[int, float]]:
+        """멘티 소개글과 코사인 유사도가 높은 멘토 (id, 점수) 상위 k개 (점수 0 제외)"""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.documents == 0:
+            return []
+        # 현재 어떤 멘토에도 없는 단어(df 0)는 제외해야 전체 재생성과 같은 점수가 나옴
+        query_terms = {
+            snapshot.vocabulary[term]: 1.0 + math.log(count)
+            for term, count in Counter(tokenize(bio)).items()
+            if term in snapshot.vocabulary and snapshot.df[snapshot.vocabulary[term]] > 0
+        }
+        if not query_terms:
+            return []
+
+        idf_squared, inverse_norms, ids = snapshot.weights()
+        query = np.zeros(len(snapshot.vocabulary))
+        query[list(query_terms)] = list(query_terms.values())
+        query_norm = np.sqrt(np.dot(query * query, idf_squared))
+        weighted_query = query * idf_squared
+
+        # 코사인 유사도 = (tf·idf)·(q·idf) / (|tf·idf| |q·idf|), 행렬-벡터 곱 한 번
+        scores = np.concatenate([
+            snapshot.base @ weighted_query[:snapshot.base.shape[1]],
+            snapshot.delta @ weighted_query,
+        ]) * inverse_norms / query_norm
+
+        k = min(k, len(scores))
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        candidates = candidates[np.lexsort((ids[candidates], -scores[candidates]))]
+        return [(int(ids[i]), float(scores[i])) for i in candidates if scores[i] > 0]
+
+    def clear(self):
+        with self._lock:
+            self._snapshot = None
+            self._rows.clear()
+            self._delta_terms.clear()
+            self._pending.clear()
+            self._building = False
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "ready": snapshot is not None,
+            "mentors": snapshot.documents if snapshot else 0,
+            "vocabulary": len(snapshot.vocabulary) if snapshot else 0,
+            "delta_rows": snapshot.delta.shape[0] if snapshot else 0,
+            "builds": self.builds,
+            "compactions": self.compactions,
+        }
+
+    def _install_base(self, base: sparse.csr_matrix, ids: np.ndarray, vocabulary: Dict[str, int]):
+        """기본 행렬을 교체하고 변경분을 비움 (잠금을 잡은 상태에서 호출)"""
+        df = np.bincount(base.indices, minlength=len(vocabulary)).astype(np.float64)
+        self._rows = {int(user_id): ("base", row) for row, user_id in enumerate(ids)}
+        self._delta_terms = {}
+        self._snapshot = _Snapshot(
+            base=base, base_squared=base.multiply(base).tocsr(), base_ids=ids, base_active=np.ones(len(ids)),
+            delta=sparse.csr_matrix((0, len(vocabulary))), delta_ids=np.zeros(0, dtype=np.int64),
+            df=df, documents=len(ids), vocabulary=vocabulary,
+        )
+
+def _term_matrix(documents: Iterable[Counter], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+    """단어 빈도 목록을 로그 스케일 CSR 행렬로 변환"""
+    indptr, indices, data = [0], [], []
+    for terms in documents:
+        for term, count in terms.items():
+            indices.append(vocabulary[term])
+            data.append(1.0 + math.log(count))
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(indptr) - 1, len(vocabulary)),
+    )
+
+mentor_index = MentorIndex()
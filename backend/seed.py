@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+대량 시드 데이터 생성 스크립트
+용량 테스트용 합성 멘토, 멘티, 매칭 요청을 시드 값으로 결정적으로 생성하여 대량 삽입합니다.
+같은 시드와 개수로 실행하면 항상 같은 데이터가 만들어집니다.
+
+- 합성 계정은 미리 계산한 bcrypt 해시 하나를 공유합니다 (모든 계정의 비밀번호가 같음).
+  `--unique-passwords`를 주면 계정마다 `{비밀번호}-{id}`를 프로세스 풀에서 해시합니다.
+- 행은 Core insert의 executemany로 배치 단위 삽입하고, 단계마다 하나의 트랜잭션으로 커밋합니다.
+- 기본 프로필 이미지는 Pillow로 로컬에서 렌더링하므로 네트워크 없이 동작합니다.
+- mentor_skills와 mentor_search 색인도 함께 채웁니다.
+
+기존 데이터는 모두 삭제됩니다.
+
+사용법:
+    python seed.py                                  # 멘토 1000, 멘티 4000, 요청 10000
+    python seed.py --mentors 100000 --mentees 400000 --requests 1000000 --seed 7
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+from sqlalchemy import insert
+
+from storage import engine
+from main import Base, User, MentorSkill, MatchRequest, MatchRequestTransition, normalize_skill
+from mentor_search import insert_mentor_search
+from image_store import image_store
+from passwords import get_password_hash
+import thumbnails
+
+DEFAULT_PASSWORD = "password123"
+DEFAULT_BATCH_SIZE = 10_000
+
+SKILLS = ["Python", "Java", "Spring Boot", "React", "Vue.js", "TypeScript", "JavaScript", "Go", "Kotlin",
+          "Swift", "Flutter", "Node.js", "Docker", "Kubernetes", "AWS", "PyTorch", "TensorFlow", "SQL",
+          "GraphQL", "FastAPI", "Next.js", "Rust"]
+TOPICS = ["백엔드 서버 개발", "프론트엔드 웹 개발", "머신러닝 모델 서빙", "데이터 분석", "모바일 앱 개발",
+          "클라우드 인프라 운영", "분산 시스템 설계", "게임 클라이언트 개발", "보안 취약점 분석", "데브옵스 자동화"]
+MENTEE_GOALS = ["취업을 준비하고 있습니다.", "실무 경험을 쌓고 싶습니다.", "이직을 고민하고 있습니다.",
+                "비전공자로 개발을 배우고 있습니다.", "사이드 프로젝트를 진행하고 있습니다."]
+REQUEST_MESSAGES = ["{topic} 분야의 멘토링을 부탁드립니다.", "{topic} 로드맵이 궁금합니다.",
+                    "{topic} 실무 경험을 듣고 싶습니다.", "{topic} 프로젝트 리뷰를 받고 싶습니다."]
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAME_SYLLABLES = "민서준지현우예은하도윤시연유진수아건태린채"
+
+# 요청 상태 비율 (멘티당 대기 1건, 멘토당 수락 1건 제약을 어기는 경우 다른 상태로 바뀜)
+REQUEST_STATUS_WEIGHTS = {"pending": 30, "accepted": 5, "rejected": 45, "cancelled": 20}
+
+# 생성 데이터의 시각은 실행 시각과 무관하게 고정된 기간 안에 둠
+SEED_EPOCH = datetime(2024, 1, 1)
+SEED_PERIOD_SECONDS = 365 * 24 * 3600
+
+PLACEHOLDER_SIZE = 500
+PLACEHOLDER_COLORS = [(66, 133, 244), (52, 168, 83), (251, 140, 0), (171, 71, 188),
+                      (0, 150, 136), (229, 57, 53), (84, 110, 122), (121, 85, 72)]
+
+def render_placeholder(label: str, color: Tuple[int, int, int], size: int = PLACEHOLDER_SIZE) -> bytes:
+    """단색 배경 가운데에 라벨을 그린 JPEG 기본 프로필 이미지"""
+    image = Image.new("RGB", (size, size), color)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=size // 8)
+    draw.text((size / 2, size / 2), label, fill=(255, 255, 255), font=font, anchor="mm")
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+def store_placeholders(role: str, count: int) -> List[str]:
+    """역할별 기본 이미지 count종을 저장소에 넣고 해시 목록을 반환"""
+    return [
+        image_store.put(render_placeholder(role.upper(), PLACEHOLDER_COLORS[i % len(PLACEHOLDER_COLORS)]))
+        for i in range(count)
+    ]
+
+def batched(rows: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _timestamp(rng: random.Random) -> datetime:
+    return SEED_EPOCH + timedelta(seconds=rng.randrange(SEED_PERIOD_SECONDS))
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + "".join(rng.choices(GIVEN_NAME_SYLLABLES, k=2))
+
+def mentor_rows(rng: random.Random, first_id: int, count: int, image_hashes: Sequence[Optional[str]]) -> Iterator[dict]:
+    """합성 멘토 users 행 (password_hash는 삽입 시 채움)"""
+    for n in range(1, count + 1):
+        skills = rng.sample(SKILLS, rng.randint(2, 5))
+        topic = rng.choice(TOPICS)
+        yield {
+            "id": first_id + n - 1,
+            "email": f"mentor{n}@example.com",
+            "name": _name(rng),
+            "role": "mentor",
+            "bio": f"{topic} {rng.randint(1, 20)}년차 개발자입니다. {rng.choice(TOPICS)}에도 관심이 많습니다.",
+            "image_hash": rng.choice(image_hashes),
+            "skills": json.dumps(skills, ensure_ascii=False),
+            "created_at": _timestamp(rng),
+        }
+
+def mentee_rows(rng: random.Random, first_id: int, count: int, image_hashes: Sequence[Optional[str]]) -> Iterator[dict]:
+    """합성 멘티 users 행 (password_hash는 삽입 시 채움)"""
+    for n in range(1, count + 1):
+        yield {
+            "id": first_id + n - 1,
+            "email": f"mentee{n}@example.com",
+            "name": _name(rng),
+            "role": "mentee",
+            "bio": f"{rng.choice(TOPICS)}에 관심이 있습니다. {rng.choice(MENTEE_GOALS)}",
+            "image_hash": rng.choice(image_hashes),
+            "skills": None,
+            "created_at": _timestamp(rng),
+        }
+
+def skill_rows(mentor: dict) -> List[dict]:
+    """멘토 행의 스킬을 mentor_skills 행으로 변환"""
+    return [
+        {"user_id": mentor["id"], "skill": skill, "skill_normalized": normalize_skill(skill)}
+        for skill in json.loads(mentor["skills"])
+    ]
+
+def request_rows(rng: random.Random, mentor_ids: range, mentee_ids: range, count: int) -> Iterator[Tuple[dict, List[dict]]]:
+    """(match_requests 행, 상태 전이 행 목록)을 생성
+
+    멘티당 대기 중 요청 1건, 멘토당 수락 1건인 부분 유니크 인덱스를 지키도록
+    이미 대기 요청이 있는 멘티의 요청은 취소로, 이미 수락한 멘토의 요청은 거절로 바꿉니다.
+    """
+    statuses, weights = zip(*REQUEST_STATUS_WEIGHTS.items())
+    pending_mentees, accepted_mentors = set(), set()
+    for request_id in range(1, count + 1):
+        mentor_id = rng.choice(mentor_ids)
+        mentee_id = rng.choice(mentee_ids)
+        status = rng.choices(statuses, weights)[0]
+        if status == "pending":
+            if mentee_id in pending_mentees:
+                status = "cancelled"
+            else:
+                pending_mentees.add(mentee_id)
+        elif status == "accepted":
+            if mentor_id in accepted_mentors:
+                status = "rejected"
+            else:
+                accepted_mentors.add(mentor_id)
+
+        created_at = _timestamp(rng)
+        updated_at = created_at
+        transitions = [{
+            "request_id": request_id, "from_status": None, "to_status": "pending",
+            "actor_id": mentee_id, "created_at": created_at,
+        }]
+        if status != "pending":
+            updated_at = created_at + timedelta(seconds=rng.randrange(7 * 24 * 3600))
+            transitions.append({
+                "request_id": request_id, "from_status": "pending", "to_status": status,
+                "actor_id": mentee_id if status == "cancelled" else mentor_id, "created_at": updated_at,
+            })
+        request = {
+            "id": request_id,
+            "mentor_id": mentor_id,
+            "mentee_id": mentee_id,
+            "message": rng.choice(REQUEST_MESSAGES).format(topic=rng.choice(TOPICS)),
+            "status": status,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+        yield request, transitions
+
+class PasswordHasher:
+    """users 배치에 password_hash를 채움 (공유 해시 또는 프로세스 풀에서 계정별 해시)"""
+
+    def __init__(self, password: str, unique: bool, workers: int):
+        self.password = password
+        self.unique = unique
+        self.workers = workers
+        self.shared_hash = None if unique else get_password_hash(password)
+        self._pool = None
+        if unique:
+            # thumbnails와 같이 spawn 컨텍스트 사용 (passwords 모듈은 가벼워 빠르게 시작됨)
+            self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def fill(self, users: List[dict]):
+        if not self.unique:
+            for user in users:
+                user["password_hash"] = self.shared_hash
+            return
+        passwords = [f"{self.password}-{user['id']}" for user in users]
+        chunksize = max(1, len(passwords) // (self.workers * 4))
+        for user, password_hash in zip(users, self._pool.map(get_password_hash, passwords, chunksize=chunksize)):
+            user["password_hash"] = password_hash
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+
+def reset_database():
+    """모든 테이블(검색 색인 포함)을 다시 만듦"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+def insert_users(conn, hasher: PasswordHasher, rows: Iterable[dict], batch_size: int) -> Dict[str, int]:
+    """users를 배치로 삽입하고 멘토는 mentor_skills, mentor_search도 채움"""
+    counts = {"users": 0, "mentor_skills": 0, "mentor_search": 0}
+    for batch in batched(rows, batch_size):
+        hasher.fill(batch)
+        conn.execute(insert(User.__table__), batch)
+        counts["users"] += len(batch)
+
+        mentors = [user for user in batch if user["role"] == "mentor"]
+        if mentors:
+            skills = [row for mentor in mentors for row in skill_rows(mentor)]
+            conn.execute(insert(MentorSkill.__table__), skills)
+            counts["mentor_skills"] += len(skills)
+            counts["mentor_search"] += insert_mentor_search(
+                conn, ((m["id"], m["name"], m["bio"], m["skills"]) for m in mentors)
+            )
+    return counts
+
+def insert_requests(conn, rows: Iterable[Tuple[dict, List[dict]]], batch_size: int) -> Dict[str, int]:
+    """매칭 요청과 상태 전이 기록을 배치로 삽입"""
+    counts = {"match_requests": 0, "match_request_transitions": 0}
+    for batch in batched(rows, batch_size):
+        requests = [request for request, _ in batch]
+        transitions = [transition for _, request_transitions in batch for transition in request_transitions]
+        conn.execute(insert(MatchRequest.__table__), requests)
+        conn.execute(insert(MatchRequestTransition.__table__), transitions)
+        counts["match_requests"] += len(requests)
+        counts["match_request_transitions"] += len(transitions)
+    return counts
+
+def _report(label: str, counts: Dict[str, int], seconds: float) -> Tuple[int, float]:
+    rows = sum(counts.values())
+    detail = ", ".join(f"{table} {count}" for table, count in counts.items())
+    print(f"  ✅ {label}: {rows}행 ({detail}) / {seconds:.2f}초, {rows / seconds if seconds else 0:,.0f}행/초")
+    return rows, seconds
+
+def seed_database(mentors: int, mentees: int, requests: int, seed: int = 42, password: str = DEFAULT_PASSWORD,
+         unique_passwords: bool = False, workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+         images: int = 4, generate_thumbnails: bool = False) -> Dict[str, int]:
+    """기존 데이터를 지우고 시드 데이터를 생성하여 삽입한 뒤 테이블별 행 수를 반환"""
+    if requests and (not mentors or not mentees):
+        raise ValueError("매칭 요청을 만들려면 멘토와 멘티가 한 명 이상 필요합니다")
+
+    started = time.perf_counter()
+    totals: Dict[str, int] = {}
+    reset_database()
+
+    print(f"▶ 기본 프로필 이미지 렌더링 ({images}종 × 2)...")
+    mentor_images: List[Optional[str]] = store_placeholders("mentor", images) or [None]
+    mentee_images: List[Optional[str]] = store_placeholders("mentee", images) or [None]
+    if generate_thumbnails and images:
+        digests = [digest for digest in mentor_images + mentee_images if digest]
+        with ProcessPoolExecutor(max_workers=workers or thumbnails.THUMBNAIL_WORKERS) as pool:
+            list(pool.map(thumbnails.render_and_store, [image_store.root] * len(digests), digests))
+
+    hasher = PasswordHasher(password, unique_passwords, workers or os.cpu_count() or 1)
+    try:
+        print(f"▶ 사용자 생성 (멘토 {mentors}명, 멘티 {mentees}명)...")
+        phase_started = time.perf_counter()
+        users = chain(
+            mentor_rows(random.Random(f"{seed}:mentors"), 1, mentors, mentor_images),
+            mentee_rows(random.Random(f"{seed}:mentees"), mentors + 1, mentees, mentee_images),
+        )
+        with engine.begin() as conn:
+            counts = insert_users(conn, hasher, users, batch_size)
+        _report("사용자", counts, time.perf_counter() - phase_started)
+        totals.update(counts)
+    finally:
+        hasher.close()
+
+    print(f"▶ 매칭 요청 생성 ({requests}건)...")
+    phase_started = time.perf_counter()
+    with engine.begin() as conn:
+        counts = insert_requests(conn, request_rows(
+            random.Random(f"{seed}:requests"),
+            range(1, mentors + 1),
+            range(mentors + 1, mentors + mentees + 1),
+            requests,
+        ), batch_size)
+    _report("매칭 요청", counts, time.perf_counter() - phase_started)
+    totals.update(counts)
+
+    _report("전체", totals, time.perf_counter() - started)
+    return totals
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mentors", type=int, default=1000)
+    parser.add_argument("--mentees", type=int, default=4000)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="모든 합성 계정의 비밀번호")
+    parser.add_argument("--unique-passwords", action="store_true",
+                        help="계정마다 '{password}-{id}'를 해시 (bcrypt 비용 때문에 대량 생성에는 느림)")
+    parser.add_argument("--workers", type=int, default=None, help="해시/썸네일 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--images", type=int, default=4, help="역할별 기본 이미지 종류 수 (0이면 이미지 없음)")
+    parser.add_argument("--thumbnails", action="store_true", help="기본 이미지의 썸네일 변형도 생성")
+    args = parser.parse_args()
+
+    try:
+        seed_database(args.mentors, args.mentees, args.requests, seed=args.seed, password=args.password,
+             unique_passwords=args.unique_passwords, workers=args.workers, batch_size=args.batch_size,
+             images=args.images, generate_thumbnails=args.thumbnails)
+    except KeyboardInterrupt:
+        print("\n\n❌ 사용자에 의해 중단되었습니다.")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
@@ -0,0 +1,122 @@
+"""
+데이터베이스 저장소 설정
+환경 변수로 SQLite 연결 URL, PRAGMA, 커넥션 풀을 설정하고 동기/비동기 엔진을 생성합니다.
+main.py(API)와 init_db.py, migrate.py(스크립트)가 같은 설정을 공유합니다.
+
+| 환경 변수 | 기본값 |
+|-----------|--------|
+| DATABASE_URL | sqlite:///./mentor_mentee.db |
+| SQLITE_JOURNAL_MODE | WAL |
+| SQLITE_SYNCHRONOUS | NORMAL |
+| SQLITE_BUSY_TIMEOUT_MS | 5000 |
+| SQLITE_MMAP_SIZE | 268435456 (256MB) |
+| SQLITE_CACHE_SIZE | -65536 (음수는 KiB 단위, 64MB) |
+| SQLITE_TEMP_STORE | MEMORY |
+| DB_POOL_SIZE / DB_MAX_OVERFLOW | 10 / 20 |
+| DB_POOL_TIMEOUT | 30 (초) |
+| DB_POOL_RECYCLE | 3600 (초, -1이면 비활성화) |
+"""
+
+import os
+from dataclasses import dataclass
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+@dataclass(frozen=True)
+class StorageSettings:
+    database_url: str = "sqlite:///./mentor_mentee.db"
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64 * 1024
+    temp_store: str = "MEMORY"
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30
+    pool_recycle: int = 3600
+    
+    @classmethod
+    def from_env(cls) -> "StorageSettings":
+        return cls(
+            database_url=os.getenv("DATABASE_URL", cls.database_url),
+            journal_mode=os.getenv("SQLITE_JOURNAL_MODE", cls.journal_mode),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", cls.synchronous),
+            busy_timeout_ms=int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", cls.busy_timeout_ms)),
+            mmap_size=int(os.getenv("SQLITE_MMAP_SIZE", cls.mmap_size)),
+            cache_size=int(os.getenv("SQLITE_CACHE_SIZE", cls.cache_size)),
+            temp_store=os.getenv("SQLITE_TEMP_STORE", cls.temp_store),
+            pool_size=int(os.getenv("DB_POOL_SIZE", cls.pool_size)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", cls.max_overflow)),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", cls.pool_timeout)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", cls.pool_recycle)),
+        )
+    
+    @property
+    def is_memory(self) -> bool:
+        database = make_url(self.database_url).database
+        return not database or database == ":memory:"
+    
+    def pragmas(self) -> list:
+        """연결마다 실행할 PRAGMA 목록 (순서대로)"""
+        statements = [f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}"]
+        if not self.is_memory:
+            # 인메모리 DB는 WAL/mmap을 지원하지 않음
+            statements.append(f"PRAGMA journal_mode = {self.journal_mode}")
+            statements.append(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        statements += [
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA cache_size = {int(self.cache_size)}",
+            f"PRAGMA temp_store = {self.temp_store}",
+            "PRAGMA foreign_keys = ON",
+        ]
+        return statements
+    
+    def pool_options(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+        }
+
+def install_pragmas(engine: Engine, settings: StorageSettings):
+    """새 DBAPI 연결이 만들어질 때마다 PRAGMA를 적용"""
+    statements = settings.pragmas()
+    
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+def create_sync_engine(settings: StorageSettings) -> Engine:
+    """스크립트/스키마 작업용 동기 엔진"""
+    engine = create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False},
+        **settings.pool_options(),
+    )
+    install_pragmas(engine, settings)
+    return engine
+
+def create_async_sqlite_engine(settings: StorageSettings) -> AsyncEngine:
+    """API용 비동기 엔진 (aiosqlite)"""
+    url = make_url(settings.database_url).set(drivername="sqlite+aiosqlite")
+    engine = create_async_engine(url, **settings.pool_options())
+    install_pragmas(engine.sync_engine, settings)
+    return engine
+
+settings = StorageSettings.from_env()
+
+engine = create_sync_engine(settings)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = create_async_sqlite_engine(settings)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
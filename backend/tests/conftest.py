@@ -0,0 +1,98 @@
+"""
+pytest 공통 설정
+임시 SQLite 데이터베이스에 main.app을 연결하여 서버 없이 API를 테스트합니다.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="mentor-mentee-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["IMAGE_STORE_DIR"] = os.path.join(_db_dir, "images")
+# 라우트별 쿼리 예산을 넘으면 테스트 실패
+os.environ.setdefault("DB_QUERY_BUDGET_MODE", "raise")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import main
+
+TEST_PASSWORD = "password123"
+TEST_PASSWORD_HASH = main.get_password_hash(TEST_PASSWORD)
+
+@pytest.fixture(autouse=True)
+def reset_database():
+    """테스트마다 빈 데이터베이스로 시작"""
+    main.Base.metadata.drop_all(bind=main.engine)
+    main.Base.metadata.create_all(bind=main.engine)
+    main.token_cache.clear()
+    main.directory_cache.bump()
+    main.mentor_index.clear()
+    yield
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def db():
+    session = main.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def make_user(db):
+    """사용자를 직접 생성하는 헬퍼 (회원가입 API의 bcrypt 비용을 피함)"""
+    counter = {"n": 0}
+
+    def _make_user(role="mentee", name=None, skills=None, **fields):
+        counter["n"] += 1
+        user = main.User(
+            email=fields.pop("email", f"{role}{counter['n']}@example.com"),
+            password_hash=TEST_PASSWORD_HASH,
+            name=name or f"{role}{counter['n']}",
+            role=role,
+            bio=fields.pop("bio", ""),
+            skills=json.dumps(skills) if skills is not None else None,
+            **fields,
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        if skills:
+            main.sync_mentor_skills(db, user.id, skills)
+            db.commit()
+        if role == "mentor":
+            main.sync_mentor_search(db, user)
+            db.commit()
+            # API를 거치지 않은 멘토 쓰기이므로 직접 무효화
+            main.directory_cache.bump()
+            main.mentor_index.upsert(user.id, user.bio, skills or [])
+        return user
+
+    return _make_user
+
+def auth_headers(user):
+    token = main.create_access_token(
+        data={"user_id": user.id, "email": user.email, "name": user.name or "", "role": user.role}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def captured_sql():
+    """요청 중 실행된 SQL 문을 수집"""
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(main.async_engine.sync_engine, "before_cursor_execute", _capture)
+    yield statements
+    event.remove(main.async_engine.sync_engine, "before_cursor_execute", _capture)
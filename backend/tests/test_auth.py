@@ -0,0 +1,52 @@
+"""회원가입/로그인 테스트"""
+
+import asyncio
+
+import main
+import passwords
+from workers import BoundedExecutor
+from tests.conftest import TEST_PASSWORD
+
+def test_signup_then_login(client):
+    signup = client.post("/api/signup", json={
+        "email": "new@example.com", "password": "secret123", "name": "신규", "role": "mentee",
+    })
+    login = client.post("/api/login", json={"email": "new@example.com", "password": "secret123"})
+    wrong = client.post("/api/login", json={"email": "new@example.com", "password": "wrong"})
+    
+    assert signup.status_code == 201
+    assert login.status_code == 200
+    assert "token" in login.json()
+    assert wrong.status_code == 401
+
+def test_signup_rejects_duplicate_email(client, make_user):
+    make_user("mentor", email="taken@example.com")
+    
+    response = client.post("/api/signup", json={
+        "email": "taken@example.com", "password": "secret123", "name": "중복", "role": "mentor",
+    })
+    
+    assert response.status_code == 400
+
+def test_login_returns_503_when_password_pool_saturated(client, make_user, monkeypatch):
+    make_user("mentee", email="busy@example.com")
+    monkeypatch.setattr(main.password_workers, "max_queue", 0)
+    monkeypatch.setattr(main.password_workers, "_pending", main.password_workers.max_workers)
+    
+    response = client.post("/api/login", json={"email": "busy@example.com", "password": TEST_PASSWORD})
+    
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+def test_password_hashing_in_process_pool():
+    pool = BoundedExecutor("password-test", max_workers=1, max_queue=4, kind="process")
+    
+    async def scenario():
+        hashed = await pool.run(passwords.get_password_hash, "secret")
+        return await pool.run(passwords.verify_password, "secret", hashed)
+    
+    try:
+        assert asyncio.run(scenario()) is True
+    finally:
+        pool.shutdown()
+    assert pool.stats()["calls"] == 2
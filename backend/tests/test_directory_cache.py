@@ -0,0 +1,65 @@
+"""멘토 목록 캐시 테스트"""
+
+import json
+
+import main
+from directory_cache import DirectoryCache, DirectoryPage
+from tests.conftest import auth_headers
+
+def test_cache_hit_skips_database(client, make_user, captured_sql):
+    make_user("mentor", skills=["React"])
+    make_user("mentor", skills=["Vue"])
+    headers = auth_headers(make_user("mentee"))
+    
+    first = client.get("/api/mentors", headers=headers, params={"skill": "react"})
+    captured_sql.clear()
+    second = client.get("/api/mentors", headers=headers, params={"skill": "REACT"})
+    
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert [mentor["profile"]["skills"] for mentor in second.json()] == [["React"]]
+    assert captured_sql == []
+    stats = main.directory_cache.stats()
+    assert stats["hits"] >= 1 and stats["rebuilds"] >= 1
+
+def test_cached_pages_keep_next_cursor(client, make_user):
+    for _ in range(3):
+        make_user("mentor")
+    headers = auth_headers(make_user("mentee"))
+    
+    first = client.get("/api/mentors", headers=headers, params={"limit": 2})
+    cached = client.get("/api/mentors", headers=headers, params={"limit": 2})
+    assert cached.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+    
+    last = client.get("/api/mentors", headers=headers, params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert len(last.json()) == 1
+    assert "X-Next-Cursor" not in last.headers
+
+def test_mentor_writes_invalidate_cache(client, make_user):
+    mentor = make_user("mentor", name="이전 이름")
+    headers = auth_headers(make_user("mentee"))
+    assert client.get("/api/mentors", headers=headers).json()[0]["profile"]["name"] == "이전 이름"
+    
+    client.put("/api/profile", headers=auth_headers(mentor), json={
+        "id": mentor.id, "name": "새 이름", "role": "mentor", "bio": "", "skills": ["Go"],
+    })
+    mentors = client.get("/api/mentors", headers=headers).json()
+    assert mentors[0]["profile"]["name"] == "새 이름"
+    
+    client.post("/api/signup", json={
+        "email": "new-mentor@example.com", "password": "password123", "name": "신규", "role": "mentor",
+    })
+    assert len(client.get("/api/mentors", headers=headers).json()) == 2
+
+def test_stale_rebuild_is_not_stored():
+    cache = DirectoryCache(max_size=2)
+    version = cache.version
+    cache.bump()  # 재구성 도중 멘토 쓰기 발생
+    cache.put("key", DirectoryPage(body=b"[]"), version, 0.01)
+    assert cache.get("key") is None
+    
+    for key in ("a", "b", "c"):
+        cache.put(key, DirectoryPage(body=json.dumps([key]).encode()), cache.version, 0.01)
+    assert cache.get("a") is None
+    assert cache.get("c").body == b'["c"]'
+    assert cache.stats()["rebuilds"] == 4
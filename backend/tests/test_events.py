@@ -0,0 +1,172 @@
+"""매칭 요청 이벤트 스트림 테스트"""
+
+import asyncio
+import gc
+import json
+import tracemalloc
+
+import httpx
+
+import main
+from events import RESET, EventBroker, event_stream
+from tests.conftest import auth_headers
+
+def parse_events(chunks):
+    """SSE 바이트 조각을 (id, event, data) 목록으로 변환 (주석/retry 줄 제외)"""
+    parsed = []
+    for block in b"".join(chunks).decode("utf-8").split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line and not line.startswith(":"))
+        if "event" in fields:
+            parsed.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return parsed
+
+async def open_stream(headers, query=b""):
+    """ASGI 앱에 직접 스트리밍 요청을 보내고 (응답 조각 목록, 연결 종료 함수)를 반환"""
+    chunks, started = [], asyncio.Event()
+    disconnected = asyncio.Event()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/api/match-requests/stream", "raw_path": b"/api/match-requests/stream",
+        "query_string": query, "root_path": "", "server": ("test", 80), "client": ("test", 1234),
+        "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+    }
+    
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            chunks.append(message)
+            started.set()
+        elif message.get("body"):
+            chunks.append(message["body"])
+    
+    task = asyncio.create_task(main.app(scope, receive, send))
+    await started.wait()
+    
+    async def close():
+        disconnected.set()
+        await asyncio.wait_for(task, 5)
+    
+    return chunks, close
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+def test_stream_pushes_committed_changes(make_user):
+    mentor = make_user("mentor")
+    mentee = make_user("mentee")
+    other_mentee = make_user("mentee")
+    
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+            mentor_chunks, close_mentor = await open_stream(auth_headers(mentor))
+            mentee_chunks, close_mentee = await open_stream(auth_headers(other_mentee))
+            assert mentor_chunks[0]["status"] == 200
+            
+            created = (await client.post("/api/match-requests", headers=auth_headers(mentee), json={
+                "mentorId": mentor.id, "menteeId": mentee.id, "message": "안녕하세요",
+            })).json()
+            await client.put(f"/api/match-requests/{created['id']}/accept", headers=auth_headers(mentor))
+            await settle()
+            await close_mentor()
+            await close_mentee()
+        await main.async_engine.dispose()
+        return parse_events(mentor_chunks[1:]), parse_events(mentee_chunks[1:])
+    
+    mentor_events, other_events = asyncio.run(scenario())
+    assert [(event, data["id"], data["status"]) for _, event, data in mentor_events] == [
+        ("created", 1, "pending"), ("accepted", 1, "accepted"),
+    ]
+    assert mentor_events[0][0] < mentor_events[1][0]
+    assert other_events == []  # 관련 없는 사용자에게는 전달되지 않음
+    assert main.events.broker.connections() == 0
+
+def test_stream_resumes_from_last_event_id(make_user):
+    mentor = make_user("mentor")
+    mentee = make_user("mentee")
+    
+    async def scenario():
+        broker = main.events.broker
+        before = broker.last_id
+        broker.publish("created", (mentor.id, mentee.id), {"id": 10, "status": "pending"})
+        broker.publish("created", (999,), {"id": 11, "status": "pending"})
+        broker.publish("rejected", (mentor.id, mentee.id), {"id": 10, "status": "rejected"})
+        
+        chunks, close = await open_stream({**auth_headers(mentee), "Last-Event-ID": str(before + 1)})
+        await settle()
+        await close()
+        return parse_events(chunks[1:])
+    
+    resumed = asyncio.run(scenario())
+    assert [(event, data["id"]) for _, event, data in resumed] == [("rejected", 10)]
+
+def test_broker_replay_gap_and_overflow():
+    async def scenario():
+        broker = EventBroker(max_queue=2, history_size=3)
+        for n in range(5):
+            broker.publish("created", (1,), {"n": n})
+        
+        # 보관 범위를 벗어난 이어 받기와 재시작 이후의 id는 reset
+        assert broker.subscribe(1, last_event_id=0).queue.get_nowait().type == RESET
+        assert broker.subscribe(1, last_event_id=99).queue.get_nowait().type == RESET
+        
+        # 느린 연결: 큐가 가득 차면 reset 후 구독 해제
+        slow = broker.subscribe(2)
+        for n in range(3):
+            broker.publish("created", (2,), {"n": n})
+        assert broker.overflows == 1
+        stream = event_stream(broker, slow, heartbeat=10)
+        received = [chunk async for chunk in stream]
+        assert b"event: reset" in received[-1]
+        assert slow not in broker._subscribers.get(2, ())
+    
+    asyncio.run(scenario())
+
+def test_stream_sends_heartbeat():
+    async def scenario():
+        broker = EventBroker(max_queue=4, history_size=4)
+        stream = event_stream(broker, broker.subscribe(1), heartbeat=0.01)
+        assert (await stream.__anext__()).startswith(b"retry:")
+        assert await stream.__anext__() == b": keepalive\n\n"
+        await stream.aclose()
+        assert broker.connections() == 0
+    
+    asyncio.run(scenario())
+
+def test_idle_connections_use_bounded_memory():
+    connections = 5000
+    
+    async def consume(stream, received):
+        async for chunk in stream:
+            received.append(chunk)
+    
+    async def scenario():
+        broker = EventBroker(max_queue=64, history_size=1000)
+        received = [[] for _ in range(connections)]
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tasks = [
+            asyncio.create_task(consume(event_stream(broker, broker.subscribe(user_id), heartbeat=3600), received[user_id]))
+            for user_id in range(connections)
+        ]
+        await settle()
+        per_connection = (tracemalloc.get_traced_memory()[0] - baseline) / connections
+        tracemalloc.stop()
+        
+        assert broker.connections() == connections
+        broker.publish("created", (7, 4999), {"id": 1})
+        await settle()
+        delivered = [user_id for user_id, chunks in enumerate(received) if len(chunks) > 1]
+        
+        broker.close_all()
+        await asyncio.wait_for(asyncio.gather(*tasks), 5)
+        return per_connection, delivered, broker.connections()
+    
+    per_connection, delivered, remaining = asyncio.run(scenario())
+    assert per_connection < 8 * 1024, per_connection
+    assert delivered == [7, 4999]
+    assert remaining == 0
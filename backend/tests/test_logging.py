@@ -0,0 +1,84 @@
+"""구조화된 로깅 테스트"""
+
+import base64
+import logging
+import queue
+
+import pytest
+
+import app_logging
+from tests.conftest import auth_headers
+from tests.test_profile_image import make_jpeg
+
+@pytest.fixture
+def records(monkeypatch):
+    """mentor_mentee 로거로 들어온 레코드의 정리된 페이로드 목록"""
+    captured: queue.Queue = queue.Queue()
+    handler = app_logging.DroppingQueueHandler(captured)
+    logger = logging.getLogger(app_logging.LOGGER_NAME)
+    logger.addHandler(handler)
+    level = logger.level
+    logger.setLevel(logging.DEBUG)  # setLevel이 하위 로거의 isEnabledFor 캐시도 비움
+    monkeypatch.setattr(app_logging, "sampler", app_logging.Sampler(limit=2, window_seconds=60))
+
+    def drain():
+        payloads = []
+        while not captured.empty():
+            payloads.append(captured.get_nowait().payload)
+        return payloads
+
+    yield drain
+    logger.removeHandler(handler)
+    logger.setLevel(level)
+
+def test_sanitize_redacts_secrets_and_caps_sizes():
+    cleaned = app_logging.sanitize({
+        "password": "password123",
+        "image": "A" * 10_000,
+        "Authorization": "Bearer abc",
+        "bio": "b" * 1000,
+        "skills": list(range(50)),
+        "raw": b"\x00" * 64,
+    })
+    assert cleaned["password"] == "[redacted 11 chars]"
+    assert cleaned["image"] == "[redacted 10000 chars]"
+    assert cleaned["Authorization"].startswith("[redacted")
+    assert len(cleaned["bio"]) < 300 and cleaned["bio"].endswith("(+744 chars)")
+    assert len(cleaned["skills"]) == app_logging.MAX_COLLECTION_ITEMS + 1
+    assert cleaned["raw"] == "[64 bytes]"
+
+def test_sampler_limits_per_window_and_reports_suppressed():
+    sampler = app_logging.Sampler(limit=2, window_seconds=60)
+    assert [sampler.allow("a") for _ in range(5)] == [0, 0, None, None, None]
+    assert sampler.allow("b") == 0
+    assert sampler.suppressed_total == 3
+    sampler.window_seconds = 0  # 창 만료: 생략한 개수를 다음 레코드에 전달
+    assert sampler.allow("a") == 3
+
+def test_records_carry_request_context_and_never_raw_images(client, make_user, records):
+    mentor = make_user("mentor")
+    image = base64.b64encode(make_jpeg()).decode()
+    response = client.put("/api/profile", headers={**auth_headers(mentor), "X-Request-ID": "req-123"}, json={
+        "id": mentor.id, "name": "새 이름", "role": "mentor", "bio": "소개", "image": image,
+    })
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"] == "req-123"
+
+    payloads = records()
+    requested = next(p for p in payloads if p["event"] == "profile_update_requested")
+    assert requested["request_id"] == "req-123"
+    assert requested["method"] == "PUT" and requested["route"] == "/api/profile"
+    assert requested["request"]["image"] == f"[redacted {len(image)} chars]"
+    assert all(image[:100] not in str(p) for p in payloads)
+
+def test_invalid_tokens_are_sampled(client, records):
+    for _ in range(5):
+        response = client.get("/api/me", headers={"Authorization": "Bearer not-a-jwt"})
+        assert response.status_code == 401
+        assert len(response.headers["X-Request-ID"]) == 32  # 요청에 없으면 생성
+
+    warnings = [p for p in records() if p["event"] == "jwt_invalid"]
+    assert len(warnings) == 2
+    assert warnings[0]["route"] == "/api/me" and warnings[0]["level"] == "WARNING"
+    assert warnings[0]["request_id"] != warnings[1]["request_id"]
+    assert "log_records_suppressed_total 3" in client.get("/metrics").text
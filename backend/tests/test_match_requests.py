@@ -0,0 +1,316 @@
+"""매칭 요청 테스트"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+import main
+from tests.conftest import auth_headers
+
+def create_request(client, mentee, mentor, message="멘토링 부탁드립니다"):
+    return client.post("/api/match-requests", headers=auth_headers(mentee), json={
+        "mentorId": mentor.id, "menteeId": mentee.id, "message": message,
+    })
+
+def test_mentee_can_have_only_one_pending_request(client, make_user):
+    mentee = make_user("mentee")
+    mentor_a = make_user("mentor")
+    mentor_b = make_user("mentor")
+    
+    first = create_request(client, mentee, mentor_a)
+    second = create_request(client, mentee, mentor_b)
+    
+    assert first.status_code == 200
+    assert first.json()["status"] == "pending"
+    assert second.status_code == 400
+    assert second.json()["detail"] == "You already have a pending request"
+
+def test_mentee_id_must_be_current_user(client, make_user):
+    mentee = make_user("mentee")
+    other_mentee = make_user("mentee")
+    mentor = make_user("mentor")
+    assert create_request(client, mentee, mentor).status_code == 200
+    
+    # 다른 menteeId로 pending 제한을 우회할 수 없음
+    bypass = client.post("/api/match-requests", headers=auth_headers(mentee), json={
+        "mentorId": mentor.id, "menteeId": 999, "message": "",
+    })
+    assert bypass.status_code == 403
+    
+    # 다른 멘티 명의로 요청을 만들어 그 멘티를 막을 수 없음
+    impersonate = client.post("/api/match-requests", headers=auth_headers(mentee), json={
+        "mentorId": mentor.id, "menteeId": other_mentee.id, "message": "",
+    })
+    assert impersonate.status_code == 403
+    assert create_request(client, other_mentee, mentor).status_code == 200
+    
+    outgoing = client.get("/api/match-requests/outgoing", headers=auth_headers(mentee)).json()
+    assert [req["menteeId"] for req in outgoing] == [mentee.id]
+
+def test_mentor_can_accept_only_one_mentee(client, make_user):
+    mentor = make_user("mentor")
+    first = create_request(client, make_user("mentee"), mentor).json()
+    second = create_request(client, make_user("mentee"), mentor).json()
+    headers = auth_headers(mentor)
+    
+    accepted = client.put(f"/api/match-requests/{first['id']}/accept", headers=headers)
+    second_accept = client.put(f"/api/match-requests/{second['id']}/accept", headers=headers)
+    
+    assert accepted.status_code == 200
+    assert accepted.json()["status"] == "accepted"
+    # 수락과 동시에 나머지 대기 요청은 자동 거절됨
+    assert second_accept.status_code == 400
+    assert second_accept.json()["detail"] == "Match request is already rejected"
+    
+    # 이후 들어온 요청도 수락할 수 없음
+    third = create_request(client, make_user("mentee"), mentor).json()
+    late = client.put(f"/api/match-requests/{third['id']}/accept", headers=headers)
+    assert late.status_code == 400
+    assert late.json()["detail"] == "You already have an accepted mentee"
+
+def test_only_pending_requests_can_transition(client, make_user):
+    mentor = make_user("mentor")
+    mentee = make_user("mentee")
+    request_id = create_request(client, mentee, mentor).json()["id"]
+    
+    cancelled = client.delete(f"/api/match-requests/{request_id}", headers=auth_headers(mentee))
+    assert cancelled.status_code == 200
+    assert cancelled.json()["status"] == "cancelled"
+    
+    for method, url in [("put", f"/api/match-requests/{request_id}/accept"),
+                        ("put", f"/api/match-requests/{request_id}/reject")]:
+        response = client.request(method, url, headers=auth_headers(mentor))
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Match request is already cancelled"
+    
+    other_mentor = make_user("mentor")
+    response = client.put(f"/api/match-requests/{request_id}/reject", headers=auth_headers(other_mentor))
+    assert response.status_code == 404
+
+def test_transitions_are_recorded(client, make_user, db):
+    mentor = make_user("mentor")
+    first_mentee = make_user("mentee")
+    second_mentee = make_user("mentee")
+    first = create_request(client, first_mentee, mentor).json()
+    second = create_request(client, second_mentee, mentor).json()
+    client.put(f"/api/match-requests/{first['id']}/accept", headers=auth_headers(mentor))
+    
+    rows = db.execute(
+        text("SELECT request_id, from_status, to_status, actor_id FROM match_request_transitions ORDER BY id")
+    ).all()
+    assert [tuple(row) for row in rows] == [
+        (first["id"], None, "pending", first_mentee.id),
+        (second["id"], None, "pending", second_mentee.id),
+        (first["id"], "pending", "accepted", mentor.id),
+        (second["id"], "pending", "rejected", mentor.id),
+    ]
+
+def test_concurrent_accepts_have_single_winner(make_user):
+    mentor = make_user("mentor")
+    mentees = [make_user("mentee") for _ in range(10)]
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            request_ids = []
+            for mentee in mentees:
+                response = await client.post("/api/match-requests", headers=auth_headers(mentee), json={
+                    "mentorId": mentor.id, "menteeId": mentee.id, "message": "",
+                })
+                request_ids.append(response.json()["id"])
+            responses = await asyncio.gather(*[
+                client.put(f"/api/match-requests/{request_id}/accept", headers=auth_headers(mentor))
+                for request_id in request_ids
+            ])
+        await main.async_engine.dispose()
+        return responses
+    
+    responses = asyncio.run(scenario())
+    assert sorted(response.status_code for response in responses) == [200] + [400] * 9
+    
+    with main.SessionLocal() as db:
+        statuses = db.execute(text("SELECT status, COUNT(*) FROM match_requests GROUP BY status")).all()
+    assert dict(statuses) == {"accepted": 1, "rejected": 9}
+
+def test_database_enforces_request_invariants(db):
+    db.add(main.MatchRequest(mentor_id=1, mentee_id=10, message="", status="pending"))
+    db.add(main.MatchRequest(mentor_id=2, mentee_id=10, message="", status="rejected"))
+    db.commit()
+    
+    db.add(main.MatchRequest(mentor_id=3, mentee_id=10, message="", status="pending"))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+    
+    db.add(main.MatchRequest(mentor_id=1, mentee_id=11, message="", status="accepted"))
+    db.add(main.MatchRequest(mentor_id=1, mentee_id=12, message="", status="accepted"))
+    with pytest.raises(IntegrityError):
+        db.commit()
+
+def test_listing_queries_use_status_indexes(db):
+    order = "ORDER BY updated_at DESC, id DESC LIMIT 21"
+    plans = {
+        "incoming": f"SELECT id FROM match_requests WHERE mentor_id = 1 AND status = 'pending' {order}",
+        "incoming_all": f"SELECT id FROM match_requests WHERE mentor_id = 1 {order}",
+        "outgoing": f"SELECT id FROM match_requests WHERE mentee_id = 1 {order}",
+        "counts": "SELECT status, count(*) FROM match_requests WHERE mentor_id = 1 GROUP BY status",
+    }
+    for name, query in plans.items():
+        plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {query}")))
+        assert "USING" in plan and "INDEX" in plan, (name, plan)
+        assert "TEMP B-TREE" not in plan, (name, plan)
+
+def test_incoming_defaults_to_pending_with_status_counts(client, make_user):
+    mentor = make_user("mentor")
+    headers = auth_headers(mentor)
+    request_ids = [create_request(client, make_user("mentee"), mentor).json()["id"] for _ in range(3)]
+    client.put(f"/api/match-requests/{request_ids[0]}/reject", headers=headers)
+    
+    pending = client.get("/api/match-requests/incoming", headers=headers)
+    assert pending.status_code == 200
+    assert [req["id"] for req in pending.json()] == [request_ids[2], request_ids[1]]
+    assert pending.headers["X-Status-Counts"] == "pending=2,accepted=0,rejected=1,cancelled=0"
+    
+    everything = client.get("/api/match-requests/incoming", headers=headers, params={"status": "all"})
+    # 최근 변경순: 방금 거절한 요청이 맨 앞
+    assert [req["id"] for req in everything.json()] == [request_ids[0], request_ids[2], request_ids[1]]
+    
+    invalid = client.get("/api/match-requests/incoming", headers=headers, params={"status": "done"})
+    assert invalid.status_code == 400
+
+def test_outgoing_pagination_and_since(client, make_user, db):
+    mentee = make_user("mentee")
+    headers = auth_headers(mentee)
+    # 멘티당 pending 1개 제한이 있으므로 과거 이력은 직접 생성
+    base = datetime(2024, 1, 1)
+    for day in range(5):
+        db.add(main.MatchRequest(mentor_id=100 + day, mentee_id=mentee.id, message="",
+                                 status="rejected", updated_at=base + timedelta(days=day)))
+    db.commit()
+    
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/match-requests/outgoing", headers=headers, params=params)
+        assert response.status_code == 200
+        seen.extend(req["mentorId"] for req in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == [104, 103, 102, 101, 100]
+    
+    recent = client.get("/api/match-requests/outgoing", headers=headers,
+                        params={"since": (base + timedelta(days=2)).isoformat()})
+    assert [req["mentorId"] for req in recent.json()] == [104, 103]
+    
+    # 다른 상태 필터의 커서는 거부
+    first_page = client.get("/api/match-requests/outgoing", headers=headers, params={"limit": 1})
+    mismatched = client.get("/api/match-requests/outgoing", headers=headers, params={
+        "status": "rejected", "cursor": first_page.headers["X-Next-Cursor"],
+    })
+    assert mismatched.status_code == 400
+
+def test_listing_embeds_counterpart_summaries(client, make_user):
+    mentor = make_user("mentor", name="김멘토", skills=["React", "Vue", "Node.js", "Go"])
+    mentee = make_user("mentee", name="이멘티")
+    create_request(client, mentee, mentor)
+    
+    outgoing = client.get("/api/match-requests/outgoing", headers=auth_headers(mentee),
+                          params={"include": "counterpart"}).json()
+    assert outgoing[0]["counterpart"] == {
+        "id": mentor.id, "name": "김멘토", "role": "mentor",
+        "imageUrl": f"/api/images/mentor/{mentor.id}", "skills": ["React", "Vue", "Node.js"],
+    }
+    
+    incoming = client.get("/api/match-requests/incoming", headers=auth_headers(mentor),
+                          params={"include": "counterpart"}).json()
+    assert incoming[0]["counterpart"]["name"] == "이멘티"
+    
+    plain = client.get("/api/match-requests/incoming", headers=auth_headers(mentor)).json()
+    assert plain[0]["counterpart"] is None
+
+def test_counterpart_summaries_use_constant_query_count(client, make_user, captured_sql):
+    mentor = make_user("mentor")
+    headers = auth_headers(mentor)
+    for _ in range(12):
+        create_request(client, make_user("mentee"), mentor)
+    
+    def count_queries(limit):
+        captured_sql.clear()
+        response = client.get("/api/match-requests/incoming", headers=headers,
+                              params={"include": "counterpart", "limit": limit})
+        assert len(response.json()) == limit
+        return sum(statement.lstrip().upper().startswith("SELECT") for statement in captured_sql)
+    
+    count_queries(1)  # 토큰 캐시 준비
+    assert count_queries(2) == count_queries(12) == 3  # 목록, 상태별 개수, 상대방 요약
+
+def bulk(client, user, action, ids, **fields):
+    return client.post("/api/match-requests/bulk", headers=auth_headers(user),
+                       json={"action": action, "ids": ids, **fields})
+
+def test_bulk_reject_reports_per_id_outcomes(client, make_user, captured_sql):
+    mentor = make_user("mentor")
+    other_mentor = make_user("mentor")
+    request_ids = [create_request(client, make_user("mentee"), mentor).json()["id"] for _ in range(4)]
+    foreign_id = create_request(client, make_user("mentee"), other_mentor).json()["id"]
+    client.put(f"/api/match-requests/{request_ids[0]}/reject", headers=auth_headers(mentor))
+    
+    captured_sql.clear()
+    response = bulk(client, mentor, "reject", request_ids + [foreign_id, 9999])
+    assert response.status_code == 200
+    body = response.json()
+    assert body["updated"] == 3
+    assert body["results"] == [
+        {"id": request_ids[0], "outcome": "not_pending", "status": "rejected"},
+        *({"id": request_id, "outcome": "updated", "status": "rejected"} for request_id in request_ids[1:]),
+        {"id": foreign_id, "outcome": "not_found", "status": None},
+        {"id": 9999, "outcome": "not_found", "status": None},
+    ]
+    # 한 번의 UPDATE로 처리 (요청 수와 무관)
+    assert sum(statement.lstrip().upper().startswith("UPDATE") for statement in captured_sql) == 1
+    
+    # 다른 멘토의 요청은 그대로
+    incoming = client.get("/api/match-requests/incoming", headers=auth_headers(other_mentor)).json()
+    assert [req["id"] for req in incoming] == [foreign_id]
+
+def test_bulk_cancel_requires_mentee_ownership(client, make_user):
+    mentor = make_user("mentor")
+    mentee = make_user("mentee")
+    other_mentee = make_user("mentee")
+    own_id = create_request(client, mentee, mentor).json()["id"]
+    other_id = create_request(client, other_mentee, mentor).json()["id"]
+    
+    assert bulk(client, mentor, "cancel", [own_id]).status_code == 403
+    results = bulk(client, mentee, "cancel", [own_id, other_id]).json()["results"]
+    assert [result["outcome"] for result in results] == ["updated", "not_found"]
+
+def test_bulk_accept_one_rejects_rest(client, make_user):
+    mentor = make_user("mentor")
+    request_ids = [create_request(client, make_user("mentee"), mentor).json()["id"] for _ in range(3)]
+    unlisted_id = create_request(client, make_user("mentee"), mentor).json()["id"]
+    
+    assert bulk(client, mentor, "accept-one-reject-rest", request_ids).status_code == 400
+    response = bulk(client, mentor, "accept-one-reject-rest", request_ids, acceptId=request_ids[1])
+    assert response.status_code == 200
+    body = response.json()
+    # ids에 없던 pending 요청도 거절되며 응답에 보고됨
+    assert [(result["id"], result["status"]) for result in body["results"]] == [
+        (request_ids[0], "rejected"), (request_ids[1], "accepted"), (request_ids[2], "rejected"),
+        (unlisted_id, "rejected"),
+    ]
+    assert body["updated"] == 4
+    incoming = client.get("/api/match-requests/incoming", headers=auth_headers(mentor),
+                          params={"status": "rejected"}).json()
+    assert unlisted_id in [req["id"] for req in incoming]
+    
+    # 이미 처리된 요청을 수락하려 하면 아무것도 바뀌지 않음
+    again = bulk(client, mentor, "accept-one-reject-rest", request_ids, acceptId=request_ids[0])
+    assert again.status_code == 400
+    
+    assert bulk(client, mentor, "archive", request_ids).status_code == 400
@@ -0,0 +1,69 @@
+"""멘토 전문 검색 테스트"""
+
+from sqlalchemy import text
+
+import main
+from tests.conftest import auth_headers
+
+def search(client, headers, q, **params):
+    response = client.get("/api/mentors", headers=headers, params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return response
+
+def test_search_matches_name_bio_and_skills(client, make_user):
+    spring = make_user("mentor", name="이백엔드", bio="Spring Boot 기반 서버 개발", skills=["Java"])
+    ml = make_user("mentor", name="박데이터", bio="머신러닝 엔지니어입니다", skills=["Python"])
+    make_user("mentor", name="김프론트", bio="", skills=["React", "TypeScript"])
+    headers = auth_headers(make_user("mentee"))
+    
+    assert [m["id"] for m in search(client, headers, "spring boot").json()] == [spring.id]
+    assert [m["id"] for m in search(client, headers, "머신러닝").json()] == [ml.id]
+    assert [m["profile"]["name"] for m in search(client, headers, "typescript").json()] == ["김프론트"]
+    # trigram 색인보다 짧은 검색어도 부분 일치로 처리
+    assert [m["id"] for m in search(client, headers, "데이").json()] == [ml.id]
+    assert search(client, headers, "존재하지않는검색어").json() == []
+
+def test_search_ranks_and_paginates(client, make_user):
+    by_name = make_user("mentor", name="Python 전문가", bio="", skills=[])
+    by_bio = make_user("mentor", name="멘토", bio="가끔 python 스크립트 작성", skills=[])
+    by_skill = make_user("mentor", name="다른멘토", bio="", skills=["Python"])
+    headers = auth_headers(make_user("mentee"))
+    
+    ranked = [m["id"] for m in search(client, headers, "python").json()]
+    assert ranked == [by_name.id, by_skill.id, by_bio.id]
+    
+    first = search(client, headers, "python", limit=2)
+    second = search(client, headers, "python", limit=2, cursor=first.headers["X-Next-Cursor"])
+    assert [m["id"] for m in first.json() + second.json()] == ranked
+    assert "X-Next-Cursor" not in second.headers
+    
+    # 검색과 정렬 커서는 섞어 쓸 수 없음
+    sorted_page = client.get("/api/mentors", headers=headers, params={"limit": 1})
+    mixed = client.get("/api/mentors", headers=headers, params={
+        "q": "python", "limit": 1, "cursor": sorted_page.headers["X-Next-Cursor"],
+    })
+    assert mixed.status_code == 400
+
+def test_search_index_follows_signup_and_profile_updates(client, make_user, db):
+    client.post("/api/signup", json={
+        "email": "rust@example.com", "password": "password123", "name": "러스트멘토", "role": "mentor",
+    })
+    mentor_id = db.execute(text("SELECT id FROM users WHERE email = 'rust@example.com'")).scalar()
+    headers = auth_headers(make_user("mentee"))
+    assert [m["id"] for m in search(client, headers, "러스트").json()] == [mentor_id]
+    
+    mentor = db.get(main.User, mentor_id)
+    client.put("/api/profile", headers=auth_headers(mentor), json={
+        "id": mentor_id, "name": "고랭멘토", "role": "mentor", "bio": "분산 시스템", "skills": ["Golang"],
+    })
+    assert search(client, headers, "러스트").json() == []
+    assert [m["id"] for m in search(client, headers, "golang 분산").json()] == [mentor_id]
+    
+    # 멘티는 색인되지 않음
+    assert db.execute(text("SELECT count(*) FROM mentor_search")).scalar() == 1
+
+def test_search_query_operators_are_escaped(client, make_user):
+    make_user("mentor", name="NEAR OR AND", bio='"quoted"', skills=[])
+    headers = auth_headers(make_user("mentee"))
+    assert len(search(client, headers, 'NEAR "quoted').json()) == 1
+    assert len(search(client, headers, "100%").json()) == 0
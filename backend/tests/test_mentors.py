@@ -0,0 +1,95 @@
+"""멘토 목록 조회 테스트"""
+
+import pytest
+from sqlalchemy import event
+
+import main
+from tests.conftest import auth_headers
+
+def list_ids(client, headers, **params):
+    response = client.get("/api/mentors", headers=headers, params=params)
+    assert response.status_code == 200
+    return [mentor["id"] for mentor in response.json()]
+
+def page_through(client, headers, **params):
+    """limit=1로 X-Next-Cursor를 끝까지 따라가며 모은 id"""
+    ids, cursor = [], None
+    while True:
+        response = client.get("/api/mentors", headers=headers,
+                              params={**params, "limit": 1, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        ids.extend(mentor["id"] for mentor in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return ids
+
+@pytest.mark.parametrize("order_by", ["id", "name", "skill"])
+def test_keyset_paging_returns_every_mentor(client, make_user, db, order_by):
+    # NULL/빈 이름, 같은 이름, 스킬 없음/같은 스킬을 섞어 정렬 키 중복과 NULL을 모두 포함
+    mentors = [
+        make_user("mentor", name="나", skills=["React"]),
+        make_user("mentor", name="가", skills=["Python"]),
+        make_user("mentor", name="가"),
+        make_user("mentor", skills=["Python"]),
+        make_user("mentor"),
+        make_user("mentor", name="다", skills=["React"]),
+    ]
+    db.query(main.User).filter(main.User.id == mentors[3].id).update({"name": None})
+    db.query(main.User).filter(main.User.id == mentors[4].id).update({"name": ""})
+    db.commit()
+    headers = auth_headers(make_user("mentee"))
+
+    unpaged = list_ids(client, headers, order_by=order_by)
+    assert sorted(unpaged) == sorted(mentor.id for mentor in mentors)
+    assert page_through(client, headers, order_by=order_by) == unpaged
+    if order_by == "name":
+        # NULL 이름은 ''와 같은 키로 정렬
+        assert unpaged[:2] == [mentors[3].id, mentors[4].id]
+
+def test_cursor_from_other_ordering_is_rejected(client, make_user):
+    for _ in range(2):
+        make_user("mentor")
+    headers = auth_headers(make_user("mentee"))
+    cursor = client.get("/api/mentors", headers=headers, params={"limit": 1}).headers["X-Next-Cursor"]
+
+    response = client.get("/api/mentors", headers=headers, params={"order_by": "name", "limit": 1, "cursor": cursor})
+    assert response.status_code == 400
+
+def test_skill_filter_ignores_case(client, make_user):
+    react = make_user("mentor", skills=["React", "TypeScript"])
+    make_user("mentor", skills=["Reactive Streams"])
+    headers = auth_headers(make_user("mentee"))
+
+    assert list_ids(client, headers, skill="react") == [react.id]
+    assert list_ids(client, headers, skill=" REACT ") == [react.id]
+
+@pytest.mark.parametrize("order_by, index", [
+    ("name", "ix_users_role_name_key_id"), ("skill", "ix_users_role_skills_key_id"),
+])
+def test_keyset_page_seeks_sort_index(client, make_user, order_by, index):
+    for i in range(3):
+        make_user("mentor", skills=[f"skill{i}"])
+    headers = auth_headers(make_user("mentee"))
+    cursor = client.get("/api/mentors", headers=headers,
+                        params={"order_by": order_by, "limit": 1}).headers["X-Next-Cursor"]
+
+    executed = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and "FROM users" in statement:
+            executed.append((statement, parameters))
+
+    engine = main.async_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.get("/api/mentors", headers=headers,
+                              params={"order_by": order_by, "limit": 1, "cursor": cursor})
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert response.status_code == 200
+
+    # 깊은 페이지도 정렬 키 범위로 인덱스를 탐색 (role만으로 탐색하면 앞쪽 행을 모두 읽음)
+    statement, parameters = executed[-1]
+    with main.engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+    assert f"USING INDEX {index} (role=? AND <expr>>?)" in plan
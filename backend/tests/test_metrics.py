@@ -0,0 +1,74 @@
+"""Prometheus 메트릭 테스트"""
+
+import re
+
+import app_logging
+import main
+import metrics
+from tests.conftest import auth_headers
+
+def sample(body: str, name: str, **labels) -> float:
+    """메트릭 본문에서 이름과 라벨이 일치하는 샘플 값"""
+    for line in body.splitlines():
+        match = re.match(r"^([a-z_]+)(?:\{(.*)\})? (\S+)$", line)
+        if not match or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'(\w+)="([^"]*)"', match.group(2) or ""))
+        if all(found.get(key) == value for key, value in labels.items()):
+            return float(match.group(3))
+    raise AssertionError(f"{name}{labels} not found")
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = metrics.Histogram("test_seconds", "test", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.labels('/a"b').observe(value)
+    lines = histogram.collect()
+    assert 'test_seconds_bucket{route="/a\\"b",le="0.1"} 2' in lines
+    assert 'test_seconds_bucket{route="/a\\"b",le="1.0"} 3' in lines
+    assert 'test_seconds_bucket{route="/a\\"b",le="+Inf"} 4' in lines
+    assert 'test_seconds_count{route="/a\\"b"} 4' in lines
+
+def test_metrics_endpoint_reports_routes_queries_and_caches(client, make_user):
+    mentee = make_user("mentee")
+    headers = auth_headers(mentee)
+    before = client.get("/metrics").text
+    for _ in range(3):
+        assert client.get("/api/me", headers=headers).status_code == 200
+    assert client.get("/api/mentors/999999/unknown").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+
+    def count(text, **labels):
+        try:
+            return sample(text, "http_request_duration_seconds_count", **labels)
+        except AssertionError:
+            return 0.0
+
+    # 경로 대신 라우트 템플릿으로 집계, 라우트가 없는 요청은 하나로 묶음
+    assert count(body, method="GET", route="/api/me", status="200") - count(
+        before, method="GET", route="/api/me", status="200") == 3
+    assert count(body, route="unmatched", status="404") >= 1
+    assert sample(body, "db_query_duration_seconds_count", operation="SELECT") > sample(
+        before, "db_query_duration_seconds_count", operation="SELECT")
+    assert sample(body, "cache_hits_total", cache="token") >= 2
+    assert 0 < sample(body, "cache_hit_ratio", cache="token") <= 1
+    assert sample(body, "http_requests_in_flight", method="GET") == 1  # /metrics 요청 자신
+
+def test_password_worker_timings(client):
+    client.post("/api/signup", json={
+        "email": "timing@example.com", "password": "password123", "name": "timing", "role": "mentee",
+    })
+    client.post("/api/login", json={"email": "timing@example.com", "password": "password123"})
+    body = client.get("/metrics").text
+    assert sample(body, "password_hash_duration_seconds_count", operation="hash") >= 1
+    assert sample(body, "password_hash_duration_seconds_count", operation="verify") >= 1
+    assert sample(body, "password_hash_duration_seconds_sum", operation="verify") > 0
+
+def test_metrics_middleware_is_outermost():
+    # add_middleware는 앞에 추가하므로 첫 항목이 가장 바깥
+    assert [middleware.cls for middleware in main.app.user_middleware[:2]] == [
+        metrics.MetricsMiddleware, app_logging.RequestContextMiddleware,
+    ]
@@ -0,0 +1,32 @@
+"""마이그레이션 스크립트 테스트"""
+
+from sqlalchemy import text
+
+import main
+import migrate
+
+def test_skills_step_backfills_baseline_database(db):
+    # 정규화 테이블이 없던 초기 스키마: 스킬은 users.skills JSON에만 있음
+    main.Base.metadata.drop_all(bind=main.engine)
+    with main.engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR NOT NULL UNIQUE, "
+            "password_hash VARCHAR NOT NULL, name VARCHAR, role VARCHAR NOT NULL, bio TEXT, "
+            "image_data BLOB, skills TEXT, created_at DATETIME)"
+        ))
+        conn.execute(text(
+            "INSERT INTO users (id, email, password_hash, name, role, skills) VALUES "
+            "(1, 'a@example.com', 'x', 'a', 'mentor', '[\"React\", \" react \", \"Vue\"]'), "
+            "(2, 'b@example.com', 'x', 'b', 'mentor', 'not json'), "
+            "(3, 'c@example.com', 'x', 'c', 'mentee', '[\"React\"]'), "
+            "(4, 'd@example.com', 'x', 'd', 'mentor', NULL)"
+        ))
+
+    migrate.migrate(["skills"])
+    # 여러 번 실행해도 같은 결과
+    migrate.migrate(["skills"])
+
+    rows = db.execute(text(
+        "SELECT user_id, skill, skill_normalized FROM mentor_skills ORDER BY user_id, skill_normalized"
+    )).all()
+    assert rows == [(1, "React", "react"), (1, "Vue", "vue")]
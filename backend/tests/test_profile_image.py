@@ -0,0 +1,180 @@
+"""프로필 이미지 저장/조회 테스트"""
+
+import base64
+import io
+import os
+
+from PIL import Image
+
+import main
+from image_store import image_store
+import thumbnails
+from tests.conftest import TEST_PASSWORD, auth_headers
+
+IMAGE_BYTES = b"\xff\xd8\xff\xe0" + b"\x00" * 2048
+
+def selects_image_blob(statements):
+    return any(stmt.lstrip().upper().startswith("SELECT") and "image_data" in stmt for stmt in statements)
+
+def test_mentor_list_does_not_load_image_blob(client, make_user, captured_sql):
+    mentee = make_user("mentee", image_data=IMAGE_BYTES)
+    for i in range(3):
+        make_user("mentor", skills=["Python"], image_data=IMAGE_BYTES)
+    
+    captured_sql.clear()
+    response = client.get("/api/mentors", headers=auth_headers(mentee))
+    
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert captured_sql
+    assert not selects_image_blob(captured_sql)
+
+def test_login_and_me_do_not_load_image_blob(client, make_user, captured_sql):
+    mentor = make_user("mentor", email="blob@example.com", image_data=IMAGE_BYTES)
+    
+    captured_sql.clear()
+    login = client.post("/api/login", json={"email": "blob@example.com", "password": TEST_PASSWORD})
+    me = client.get("/api/me", headers=auth_headers(mentor))
+    
+    assert login.status_code == 200
+    assert me.status_code == 200
+    assert not selects_image_blob(captured_sql)
+
+def make_jpeg(size=(600, 600)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (30, 120, 200)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+def test_profile_update_stores_image_by_content_hash(client, make_user, db):
+    mentor = make_user("mentor")
+    jpeg = make_jpeg()
+    
+    response = client.put("/api/profile", headers=auth_headers(mentor), json={
+        "id": mentor.id, "name": "멘토", "role": "mentor", "bio": "",
+        "image": base64.b64encode(jpeg).decode(),
+    })
+    
+    assert response.status_code == 200
+    image_hash, image_data = db.query(main.User.image_hash, main.User.image_data).filter(
+        main.User.id == mentor.id
+    ).one()
+    assert image_data is None
+    with open(image_store.path_for(image_hash), "rb") as f:
+        assert f.read() == jpeg
+
+def test_profile_image_is_served_from_store(client, make_user):
+    jpeg = make_jpeg()
+    mentee = make_user("mentee")
+    mentor = make_user("mentor", image_hash=image_store.put(jpeg))
+    
+    response = client.get(f"/api/images/mentor/{mentor.id}", headers=auth_headers(mentee))
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.content == jpeg
+
+def test_image_store_writes_identical_content_once():
+    jpeg = make_jpeg((700, 700))
+    first = image_store.put(jpeg)
+    mtime = os.stat(image_store.path_for(first)).st_mtime_ns
+    
+    assert image_store.put(jpeg) == first
+    assert os.stat(image_store.path_for(first)).st_mtime_ns == mtime
+
+def test_profile_image_falls_back_to_legacy_blob(client, make_user, captured_sql):
+    mentee = make_user("mentee")
+    mentor = make_user("mentor", image_data=IMAGE_BYTES)
+    
+    captured_sql.clear()
+    response = client.get(f"/api/images/mentor/{mentor.id}", headers=auth_headers(mentee))
+    
+    assert response.status_code == 200
+    assert response.content == IMAGE_BYTES
+    assert selects_image_blob(captured_sql)
+
+def test_profile_image_without_blob_redirects_to_default(client, make_user):
+    mentee = make_user("mentee")
+    mentor = make_user("mentor")
+    
+    response = client.get(
+        f"/api/images/mentor/{mentor.id}", headers=auth_headers(mentee), follow_redirects=False
+    )
+    
+    assert response.status_code in (302, 307)
+    assert "placehold.co" in response.headers["location"]
+
+def test_profile_image_conditional_get(client, make_user, captured_sql, monkeypatch):
+    jpeg = make_jpeg()
+    mentee = make_user("mentee")
+    mentor = make_user("mentor", image_hash=image_store.put(jpeg))
+    headers = auth_headers(mentee)
+    
+    first = client.get(f"/api/images/mentor/{mentor.id}", headers=headers)
+    etag = first.headers["etag"]
+    assert etag == f'"{mentor.image_hash}"'
+    assert first.headers["cache-control"] == main.IMAGE_CACHE_CONTROL_UNVERSIONED
+    
+    # 304 응답은 파일을 열지 않아야 함
+    def fail_get_path(digest):
+        raise AssertionError("image file must not be touched for 304")
+    monkeypatch.setattr(image_store, "get_path", fail_get_path)
+    captured_sql.clear()
+    second = client.get(f"/api/images/mentor/{mentor.id}", headers={**headers, "If-None-Match": etag})
+    
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert not any("image_data" in stmt for stmt in captured_sql)
+
+def test_profile_image_etag_changes_when_image_replaced(client, make_user):
+    mentee = make_user("mentee")
+    mentor = make_user("mentor")
+    old_etag = None
+    for color_size in [(600, 600), (700, 700)]:
+        updated = client.put("/api/profile", headers=auth_headers(mentor), json={
+            "id": mentor.id, "name": "멘토", "role": "mentor", "bio": "",
+            "image": base64.b64encode(make_jpeg(color_size)).decode(),
+        })
+        image_url = updated.json()["profile"]["imageUrl"]
+        response = client.get(image_url, headers={**auth_headers(mentee), "If-None-Match": old_etag or ""})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"] != old_etag
+        # 버전이 붙은 URL은 장기 캐시
+        assert response.headers["cache-control"] == main.IMAGE_CACHE_CONTROL_VERSIONED
+        old_etag = response.headers["etag"]
+
+def test_profile_update_generates_thumbnail_variants(client, make_user, db):
+    mentee = make_user("mentee")
+    mentor = make_user("mentor")
+    client.put("/api/profile", headers=auth_headers(mentor), json={
+        "id": mentor.id, "name": "멘토", "role": "mentor", "bio": "",
+        "image": base64.b64encode(make_jpeg((800, 600))).decode(),
+    })
+    image_hash = db.query(main.User.image_hash).filter(main.User.id == mentor.id).scalar()
+    
+    for size in thumbnails.THUMBNAIL_SIZES:
+        for extension in thumbnails.THUMBNAIL_FORMATS:
+            assert image_store.get_variant_path(image_hash, size, extension)
+    
+    webp = client.get(
+        f"/api/images/mentor/{mentor.id}?size=100",
+        headers={**auth_headers(mentee), "Accept": "image/webp,image/*"},
+    )
+    assert webp.headers["content-type"] == "image/webp"
+    assert Image.open(io.BytesIO(webp.content)).size == (128, 128)
+    
+    jpeg = client.get(f"/api/images/mentor/{mentor.id}?size=64", headers=auth_headers(mentee))
+    assert jpeg.headers["content-type"] == "image/jpeg"
+    assert Image.open(io.BytesIO(jpeg.content)).size == (64, 64)
+    assert jpeg.headers["etag"] != webp.headers["etag"]
+
+def test_missing_variant_falls_back_to_original(client, make_user):
+    jpeg = make_jpeg((650, 650))
+    mentee = make_user("mentee")
+    mentor = make_user("mentor", image_hash=image_store.put(jpeg))
+    
+    response = client.get(f"/api/images/mentor/{mentor.id}?size=64", headers=auth_headers(mentee))
+    
+    # 변형이 아직 없으면 원본으로 응답
+    assert response.content == jpeg
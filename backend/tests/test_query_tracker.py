@@ -0,0 +1,34 @@
+"""요청별 쿼리 집계 테스트"""
+
+import pytest
+
+import main
+import query_tracker
+from tests.conftest import auth_headers
+
+def test_query_headers_count_request_statements(client, make_user):
+    headers = auth_headers(make_user("mentee"))
+    response = client.get("/api/me", headers=headers)
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Query-Count"]) == 2
+    assert float(response.headers["X-DB-Time-Ms"]) > 0
+
+    body = client.get("/metrics").text
+    assert 'http_request_db_queries_count{method="GET",route="/api/me"}' in body
+
+def test_query_budget_raises_in_tests(client, make_user, monkeypatch):
+    headers = auth_headers(make_user("mentee"))
+    monkeypatch.setitem(main.QUERY_BUDGETS, "GET /api/me", 1)
+    with pytest.raises(query_tracker.QueryBudgetExceeded, match="GET /api/me: 2 queries"):
+        client.get("/api/me", headers=headers)
+
+def test_repeated_statement_is_reported_as_n_plus_one():
+    stats = query_tracker.QueryStats()
+    stats.record("SELECT id, name FROM users", 0.001)
+    for _ in range(7):
+        stats.record("SELECT id FROM users WHERE id = ?", 0.001)
+
+    reason, message = query_tracker.check_budget("GET /x", stats, {"GET /x": 10})
+    assert reason == "repeated"
+    assert "7 times" in message
+    assert query_tracker.check_budget("GET /x", stats, {"GET /x": 6})[0] == "budget"
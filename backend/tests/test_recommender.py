@@ -0,0 +1,83 @@
+"""멘토 추천 테스트"""
+
+import numpy as np
+import pytest
+
+import recommender
+from recommender import MentorIndex
+from tests.conftest import auth_headers
+
+MENTORS = [
+    (1, "스프링 부트로 백엔드 서버를 개발합니다", '["Java", "Spring Boot"]'),
+    (2, "머신러닝 모델을 서빙하고 데이터 분석을 합니다", '["Python", "PyTorch"]'),
+    (3, "React와 TypeScript로 프론트엔드를 만듭니다", '["React", "TypeScript"]'),
+]
+
+def test_top_k_ranks_by_similarity():
+    index = MentorIndex()
+    index.begin_build()
+    index.build(MENTORS)
+    
+    ranked = index.top_k("머신러닝 엔지니어가 되고 싶고 python을 공부 중입니다", 3)
+    assert [mentor_id for mentor_id, _ in ranked] == [2]
+    assert 0 < ranked[0][1] <= 1
+    
+    assert index.top_k("", 3) == []
+    assert index.top_k("완전히 관련없는 문장", 3) == []
+
+def test_incremental_updates_match_full_rebuild(monkeypatch):
+    monkeypatch.setattr(recommender, "MIN_COMPACT_ROWS", 2)
+    incremental = MentorIndex()
+    incremental.begin_build()
+    incremental.build(MENTORS)
+    
+    updates = [
+        (2, "이제는 React 프론트엔드를 가르칩니다", ["React"]),
+        (4, "Spring과 Kotlin 백엔드", ["Kotlin"]),
+        (2, "머신러닝과 React를 함께 다룹니다", ["Python", "React"]),
+        (5, "Go 분산 시스템", ["Go"]),
+    ]
+    for mentor_id, bio, skills in updates:
+        incremental.upsert(mentor_id, bio, skills)
+    assert incremental.compactions >= 1
+    
+    latest = {mentor_id: (mentor_id, bio, skills) for mentor_id, bio, skills in MENTORS}
+    for mentor_id, bio, skills in updates:
+        latest[mentor_id] = (mentor_id, bio, recommender.json.dumps(skills))
+    rebuilt = MentorIndex()
+    rebuilt.begin_build()
+    rebuilt.build(latest.values())
+    
+    for query in ["react 프론트엔드", "백엔드 kotlin spring", "머신러닝", "분산 시스템"]:
+        expected = rebuilt.top_k(query, 5)
+        actual = incremental.top_k(query, 5)
+        assert [mentor_id for mentor_id, _ in actual] == [mentor_id for mentor_id, _ in expected]
+        np.testing.assert_allclose([s for _, s in actual], [s for _, s in expected])
+
+def test_updates_during_build_are_applied():
+    index = MentorIndex()
+    index.begin_build()
+    index.upsert(1, "Rust 시스템 프로그래밍", ["Rust"])  # DB 조회 이후 변경된 멘토
+    index.build(MENTORS)
+    assert [mentor_id for mentor_id, _ in index.top_k("rust", 3)] == [1]
+
+def test_recommended_endpoint(client, make_user, db):
+    make_user("mentor", name="백엔드", bio="Spring Boot 백엔드 개발", skills=["Java"])
+    ml = make_user("mentor", name="데이터", bio="머신러닝 모델 개발", skills=["Python"])
+    mentee = make_user("mentee", bio="머신러닝을 배우고 싶습니다")
+    headers = auth_headers(mentee)
+    
+    response = client.get("/api/mentors/recommended", headers=headers, params={"k": 5})
+    assert response.status_code == 200
+    body = response.json()
+    assert [mentor["id"] for mentor in body] == [ml.id]
+    assert body[0]["profile"]["skills"] == ["Python"]
+    assert body[0]["score"] > 0
+    
+    # 멘토 프로필 수정이 추천에 바로 반영됨
+    client.put("/api/profile", headers=auth_headers(ml), json={
+        "id": ml.id, "name": "데이터", "role": "mentor", "bio": "iOS 앱 개발", "skills": ["Swift"],
+    })
+    assert client.get("/api/mentors/recommended", headers=headers).json() == []
+    
+    assert client.get("/api/mentors/recommended", headers=auth_headers(ml)).status_code == 403
@@ -0,0 +1,57 @@
+"""대량 시드 스크립트 테스트"""
+
+import random
+
+from sqlalchemy import text
+
+import main
+import seed
+from tests.conftest import TEST_PASSWORD, TEST_PASSWORD_HASH
+
+def test_generated_rows_are_deterministic():
+    def generate(value):
+        rng = random.Random(value)
+        mentors = list(seed.mentor_rows(rng, 1, 50, ["a", "b"]))
+        requests = list(seed.request_rows(rng, range(1, 51), range(51, 101), 200))
+        return mentors, requests
+
+    assert generate(7) == generate(7)
+    assert generate(7) != generate(8)
+
+def test_request_rows_respect_unique_constraints():
+    rows = [request for request, _ in seed.request_rows(random.Random(1), range(1, 4), range(4, 10), 500)]
+    pending = [r["mentee_id"] for r in rows if r["status"] == "pending"]
+    accepted = [r["mentor_id"] for r in rows if r["status"] == "accepted"]
+    assert len(pending) == len(set(pending))
+    assert len(accepted) == len(set(accepted))
+
+def test_seed_database_loads_searchable_data(client, db):
+    totals = seed.seed_database(30, 60, 200, seed=3, password=TEST_PASSWORD, batch_size=16, images=2)
+
+    assert totals["users"] == 90
+    assert totals["mentor_search"] == 30
+    assert totals["match_requests"] == 200
+    assert db.execute(text("SELECT count(*) FROM mentor_skills")).scalar() == totals["mentor_skills"]
+    assert db.execute(text("SELECT count(DISTINCT image_hash) FROM users")).scalar() == 4
+
+    # 공유 해시로 로그인되고, 검색 색인과 요청 목록이 API에서 바로 동작
+    response = client.post("/api/login", json={"email": "mentee1@example.com", "password": TEST_PASSWORD})
+    assert response.status_code == 200, response.text
+    headers = {"Authorization": f"Bearer {response.json()['token']}"}
+    mentor = db.get(main.User, 1)
+    found = client.get("/api/mentors", headers=headers, params={"q": mentor.name})
+    assert 1 in [m["id"] for m in found.json()]
+    outgoing = client.get("/api/match-requests/outgoing", headers=headers)
+    assert outgoing.status_code == 200
+    assert len(outgoing.json()) == db.query(main.MatchRequest).filter(main.MatchRequest.mentee_id == 31).count()
+
+def test_init_db_reseed_clears_search_index(make_user, db, monkeypatch):
+    import init_db
+    monkeypatch.setattr(init_db, "hash_password", lambda password: TEST_PASSWORD_HASH)
+    make_user("mentor", name="삭제될멘토", bio="Haskell 함수형 프로그래밍", id=999)
+
+    init_db.create_sample_users()
+
+    # 검색 색인에는 새로 만든 멘토 문서만 남음
+    mentor_ids = {row.id for row in db.query(main.User.id).filter(main.User.role == "mentor")}
+    assert {row[0] for row in db.execute(text("SELECT rowid FROM mentor_search"))} == mentor_ids
@@ -0,0 +1,55 @@
+"""검증된 토큰 캐시 테스트"""
+
+import time
+
+import main
+from token_cache import Principal, TokenCache
+from tests.conftest import auth_headers
+
+def user_selects(statements):
+    return [stmt for stmt in statements if stmt.lstrip().upper().startswith("SELECT") and "FROM users" in stmt]
+
+def test_repeated_requests_reuse_verified_token(client, make_user, captured_sql):
+    mentee = make_user("mentee")
+    headers = auth_headers(mentee)
+    
+    client.get("/api/mentors", headers=headers)
+    captured_sql.clear()
+    hits_before = main.token_cache.hits
+    for _ in range(3):
+        assert client.get("/api/match-requests/outgoing", headers=headers).status_code == 200
+    
+    assert main.token_cache.hits == hits_before + 3
+    assert user_selects(captured_sql) == []
+
+def test_update_profile_invalidates_cached_principal(client, make_user):
+    mentor = make_user("mentor", name="이전이름")
+    headers = auth_headers(mentor)
+    client.get("/api/me", headers=headers)
+    assert main.token_cache.stats()["size"] == 1
+    
+    client.put("/api/profile", headers=headers, json={
+        "id": mentor.id, "name": "새이름", "role": "mentor", "bio": "",
+    })
+    
+    assert main.token_cache.stats()["size"] == 0
+
+def test_invalid_token_is_not_cached(client):
+    response = client.get("/api/me", headers={"Authorization": "Bearer not-a-token"})
+    
+    assert response.status_code == 401
+    assert main.token_cache.stats()["size"] == 0
+
+def test_cache_evicts_least_recently_used_and_expired():
+    cache = TokenCache(max_size=2)
+    future = time.time() + 60
+    cache.put("a", Principal(1, "mentee", "a@example.com", "a"), future)
+    cache.put("b", Principal(2, "mentee", "b@example.com", "b"), future)
+    cache.get("a")
+    cache.put("c", Principal(3, "mentor", "c@example.com", "c"), future)
+    cache.put("d", Principal(4, "mentor", "d@example.com", "d"), time.time() - 1)
+    
+    assert cache.get("b") is None
+    assert cache.get("d") is None
+    assert cache.get("c").id == 3
+    assert cache.stats()["size"] == 1
@@ -0,0 +1,58 @@
+"""제한 워커 풀 테스트"""
+
+import asyncio
+import base64
+import threading
+
+import pytest
+
+import main
+from workers import BoundedExecutor, PoolSaturated
+from tests.conftest import auth_headers
+
+def test_bounded_executor_rejects_when_saturated():
+    release = threading.Event()
+    pool = BoundedExecutor("test", max_workers=1, max_queue=1)
+    
+    async def scenario():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(PoolSaturated):
+            await pool.run(release.wait)
+        release.set()
+        await asyncio.gather(running, queued)
+    
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        pool.shutdown()
+    
+    assert pool.stats()["rejected"] == 1
+    assert pool.stats()["calls"] == 2
+    assert pool.pending == 0
+
+def test_profile_upload_returns_503_when_image_pool_saturated(client, make_user, monkeypatch):
+    mentor = make_user("mentor")
+    monkeypatch.setattr(main.image_workers, "max_queue", 0)
+    monkeypatch.setattr(main.image_workers, "_pending", main.image_workers.max_workers)
+    
+    response = client.put("/api/profile", headers=auth_headers(mentor), json={
+        "id": mentor.id, "name": "멘토", "role": "mentor", "bio": "",
+        "image": base64.b64encode(b"\xff\xd8" * 100).decode(),
+    })
+    
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+def test_oversized_image_rejected_before_decoding(monkeypatch):
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("oversized payload must not be decoded")
+    monkeypatch.setattr(main.base64, "b64decode", fail_decode)
+    encoded = "A" * (main.MAX_IMAGE_BYTES * 4 // 3 + 8)
+    
+    _, is_valid, message = main.decode_and_validate_image(encoded)
+    
+    assert not is_valid
+    assert "1MB" in message
@@ -0,0 +1,82 @@
+"""
+프로필 이미지 썸네일 생성
+업로드된 이미지에서 고정 크기(64/128/256px) JPEG/WebP 변형을 미리 만들어 둡니다.
+Pillow 작업은 API 워커의 GIL을 잡지 않도록 별도 프로세스 풀에서 실행합니다.
+"""
+
+import asyncio
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from image_store import ImageStore
+
+THUMBNAIL_SIZES = (64, 128, 256)
+
+# 확장자 -> (Pillow 포맷, media type)
+THUMBNAIL_FORMATS = {
+    "jpg": ("JPEG", "image/jpeg"),
+    "webp": ("WEBP", "image/webp"),
+}
+
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", "2"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def render_variants(data: bytes) -> List[Tuple[int, str, bytes]]:
+    """원본 이미지에서 (크기, 확장자, 바이트) 목록을 생성"""
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        variants = []
+        for size in THUMBNAIL_SIZES:
+            # 아바타용 정사각형으로 가운데를 잘라 축소
+            thumbnail = ImageOps.fit(image, (size, size), Image.LANCZOS)
+            for extension, (pil_format, _) in THUMBNAIL_FORMATS.items():
+                buffer = io.BytesIO()
+                thumbnail.save(buffer, format=pil_format, quality=85)
+                variants.append((size, extension, buffer.getvalue()))
+        return variants
+
+def render_and_store(store_root: str, digest: str, data: Optional[bytes] = None) -> int:
+    """변형을 생성하여 저장소에 기록 (프로세스 풀 워커에서 실행, 원본은 data 또는 저장소에서 읽음)"""
+    store = ImageStore(store_root)
+    if data is None:
+        with open(store.path_for(digest), "rb") as f:
+            data = f.read()
+    variants = render_variants(data)
+    for size, extension, variant in variants:
+        store.put_variant(digest, size, extension, variant)
+    return len(variants)
+
+def get_pool() -> ProcessPoolExecutor:
+    """썸네일 프로세스 풀 (처음 사용할 때 생성)"""
+    global _pool
+    if _pool is None:
+        # fork 대신 spawn: 이벤트 루프/스레드 상태를 자식 프로세스에 복제하지 않음
+        _pool = ProcessPoolExecutor(
+            max_workers=THUMBNAIL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+async def generate_thumbnails(store: ImageStore, digest: str, data: bytes) -> int:
+    """이벤트 루프를 막지 않고 프로세스 풀에서 썸네일 생성"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_pool(), render_and_store, store.root, digest, data)
+
+def select_variant(size: int) -> Optional[int]:
+    """요청 크기 이상인 가장 작은 변형 크기 (모든 변형보다 크면 None = 원본)"""
+    for variant_size in THUMBNAIL_SIZES:
+        if size <= variant_size:
+            return variant_size
+    return None
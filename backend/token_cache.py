@@ -0,0 +1,96 @@
+"""
+검증된 JWT 캐시
+같은 토큰에 대해 매 요청마다 jwt.decode와 users 조회를 반복하지 않도록
+검증 결과(Principal)를 토큰 만료 시각까지 프로세스 메모리에 보관합니다.
+
+키는 토큰 전체의 SHA-256입니다. jti는 서명 검증 전에는 신뢰할 수 없으므로
+키로 쓰지 않습니다 (위조 토큰이 캐시된 jti를 재사용하는 것을 방지).
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자 요약 (대부분의 엔드포인트는 id와 role만 필요)"""
+    id: int
+    role: str
+    email: str
+    name: Optional[str]
+
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+class TokenCache:
+    """크기가 제한된 LRU 캐시 (스레드 안전)"""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Principal, float]]" = OrderedDict()
+        self._keys_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            principal, expires_at = entry
+            if time.time() >= expires_at:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return principal
+    
+    def put(self, key: str, principal: Principal, expires_at: float):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (principal, expires_at)
+            self._keys_by_user.setdefault(principal.id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+    
+    def invalidate_user(self, user_id: int):
+        """사용자 정보가 바뀌었을 때 해당 사용자의 모든 토큰 항목 제거"""
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+    
+    def _remove(self, key: str):
+        principal, _ = self._entries.pop(key)
+        keys = self._keys_by_user.get(principal.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[principal.id]
+    
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+token_cache = TokenCache(int(os.getenv("TOKEN_CACHE_SIZE", "10000")))
@@ -0,0 +1,114 @@
+"""
+CPU 작업용 제한 워커 풀
+이미지 디코딩/검증처럼 이벤트 루프를 막는 작업을 별도 실행기에서 처리합니다.
+동시 실행 수와 대기열 길이에 상한을 두고, 가득 차면 즉시 PoolSaturated를 발생시켜
+호출자가 503으로 빠르게 응답할 수 있게 합니다.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+class PoolSaturated(Exception):
+    """워커 풀의 실행 슬롯과 대기열이 모두 찬 경우"""
+
+def _timed_call(func: Callable, args: tuple, kwargs: dict):
+    """워커 안에서 실제 실행 시간을 측정 (프로세스 풀에서도 pickle 가능하도록 모듈 함수)"""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+class BoundedExecutor:
+    """동시 실행 수와 대기열 길이가 제한된 비동기 실행기 (kind: "thread" 또는 "process")"""
+    
+    def __init__(self, name: str, max_workers: int, max_queue: int, kind: str = "thread"):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.kind = kind
+        self._executor: Optional[Executor] = None
+        self._pending = 0  # 실행 중 + 대기 중
+        self.on_complete: Optional[Callable[[Callable, float], None]] = None  # (func, 실행 시간) 관찰자 (metrics)
+        
+        # 통계 (run: 워커에서 실행된 시간, wait: 대기열에서 기다린 시간)
+        self.calls = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.total_wait_seconds = 0.0
+    
+    def _create_executor(self) -> Executor:
+        if self.kind == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+    
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+    
+    @property
+    def pending(self) -> int:
+        return self._pending
+    
+    async def run(self, func: Callable, *args, **kwargs):
+        """func를 워커에서 실행하고 결과를 기다림 (포화 상태면 PoolSaturated)"""
+        if self._pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PoolSaturated(f"{self.name} pool is saturated")
+        
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, run_seconds = await loop.run_in_executor(self.executor, _timed_call, func, args, kwargs)
+        finally:
+            self._pending -= 1
+        
+        self.calls += 1
+        self.total_seconds += run_seconds
+        self.max_seconds = max(self.max_seconds, run_seconds)
+        self.total_wait_seconds += max(0.0, time.perf_counter() - started - run_seconds)
+        if self.on_complete is not None:
+            self.on_complete(func, run_seconds)
+        return result
+    
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "pending": self._pending,
+            "avg_ms": (self.total_seconds / self.calls * 1000) if self.calls else 0.0,
+            "max_ms": self.max_seconds * 1000,
+            "avg_wait_ms": (self.total_wait_seconds / self.calls * 1000) if self.calls else 0.0,
+        }
+    
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# 이미지 디코딩/검증 풀
+image_workers = BoundedExecutor(
+    "image",
+    max_workers=int(os.getenv("IMAGE_WORKERS", "2")),
+    max_queue=int(os.getenv("IMAGE_QUEUE_LIMIT", "8")),
+)
+
+# 비밀번호 해싱/검증 전용 풀 (로그인 폭주가 다른 엔드포인트에 영향을 주지 않도록 분리)
+password_workers = BoundedExecutor(
+    "password",
+    max_workers=int(os.getenv("PASSWORD_WORKERS", "4")),
+    max_queue=int(os.getenv("PASSWORD_QUEUE_LIMIT", "64")),
+    kind=os.getenv("PASSWORD_EXECUTOR", "thread"),
+)
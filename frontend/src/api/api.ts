@@ -49,12 +49,21 @@ export interface User {
   };
 }
 
+export interface CounterpartSummary {
+  id: number;
+  name: string;
+  role: 'mentor' | 'mentee';
+  imageUrl: string;
+  skills: string[];
+}
+
 export interface MatchRequest {
   id: number;
   mentorId: number;
   menteeId: number;
   message: string;
   status: 'pending' | 'accepted' | 'rejected' | 'cancelled';
+  counterpart?: CounterpartSummary | null;
 }
 
 export interface SignupRequest {
@@ -91,6 +100,14 @@ export const userAPI = {
     api.get(`/images/${role}/${id}`, { responseType: 'blob' }),
 };
 
+// 목록용 작은 프로필 이미지 URL (서버가 size 이상인 가장 작은 썸네일을 선택)
+export const thumbnailUrl = (imageUrl: string, displaySize: number) => {
+  if (!imageUrl) return imageUrl;
+  const size = Math.ceil(displaySize * (window.devicePixelRatio || 1));
+  const separator = imageUrl.includes('?') ? '&' : '?';
+  return `${imageUrl}${separator}size=${size}`;
+};
+
 export const mentorAPI = {
   getMentors: (skill?: string, orderBy?: string) => {
     const params = new URLSearchParams();
@@ -100,14 +117,89 @@ export const mentorAPI = {
   },
 };
 
+// 목록 API는 limit개씩 나뉘어 오며, 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 줍니다.
+export const nextCursor = (response: { headers: Record<string, any> }): string | null =>
+  response.headers['x-next-cursor'] || null;
+
 export const matchRequestAPI = {
   createRequest: (data: { mentorId: number; menteeId: number; message: string }) =>
     api.post<MatchRequest>('/match-requests', data),
-  getIncomingRequests: () => api.get<MatchRequest[]>('/match-requests/incoming'),
-  getOutgoingRequests: () => api.get<MatchRequest[]>('/match-requests/outgoing'),
+  getIncomingRequests: (status: string = 'all', limit: number = 100, include?: 'counterpart', cursor?: string) =>
+    api.get<MatchRequest[]>('/match-requests/incoming', { params: { status, limit, include, cursor } }),
+  getOutgoingRequests: (status: string = 'all', limit: number = 100, include?: 'counterpart', cursor?: string) =>
+    api.get<MatchRequest[]>('/match-requests/outgoing', { params: { status, limit, include, cursor } }),
+  // 보낸 요청을 커서를 따라 끝까지 모두 조회
+  getAllOutgoingRequests: async (status: string = 'all'): Promise<MatchRequest[]> => {
+    const all: MatchRequest[] = [];
+    let cursor: string | undefined;
+    do {
+      const response = await api.get<MatchRequest[]>('/match-requests/outgoing', { params: { status, limit: 100, cursor } });
+      all.push(...response.data);
+      cursor = nextCursor(response) ?? undefined;
+    } while (cursor);
+    return all;
+  },
   acceptRequest: (id: number) => api.put<MatchRequest>(`/match-requests/${id}/accept`),
   rejectRequest: (id: number) => api.put<MatchRequest>(`/match-requests/${id}/reject`),
   cancelRequest: (id: number) => api.delete<MatchRequest>(`/match-requests/${id}`),
 };
 
+// 매칭 요청 변경 이벤트 (SSE)
+// EventSource는 Authorization 헤더를 보낼 수 없으므로 fetch 스트림으로 읽고,
+// 연결이 끊기면 마지막 이벤트 id부터 이어 받습니다.
+export type MatchRequestEventType = 'created' | 'accepted' | 'rejected' | 'cancelled' | 'reset';
+
+export const subscribeMatchRequestEvents = (
+  onEvent: (type: MatchRequestEventType, request: MatchRequest | null) => void,
+): (() => void) => {
+  const controller = new AbortController();
+  let lastEventId: string | null = null;
+  let retryMs = 3000;
+
+  const handleBlock = (block: string) => {
+    let type = '';
+    let data = '';
+    block.split('\n').forEach((line) => {
+      if (line.startsWith('id: ')) lastEventId = line.slice(4);
+      else if (line.startsWith('event: ')) type = line.slice(7);
+      else if (line.startsWith('data: ')) data += line.slice(6);
+      else if (line.startsWith('retry: ')) retryMs = Number(line.slice(7)) || retryMs;
+    });
+    if (type) {
+      onEvent(type as MatchRequestEventType, type === 'reset' ? null : JSON.parse(data));
+    }
+  };
+
+  const connect = async () => {
+    while (!controller.signal.aborted) {
+      try {
+        const headers: Record<string, string> = {};
+        const token = localStorage.getItem('token');
+        if (token) headers.Authorization = `Bearer ${token}`;
+        if (lastEventId) headers['Last-Event-ID'] = lastEventId;
+        const response = await fetch(`${API_BASE_URL}/match-requests/stream`, { headers, signal: controller.signal });
+        if (response.status === 401 || !response.body) return;
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        for (;;) {
+          const { done, value } = await reader.read();
+          if (done) break;
+          buffer += decoder.decode(value, { stream: true });
+          const blocks = buffer.split('\n\n');
+          buffer = blocks.pop() || '';
+          blocks.forEach(handleBlock);
+        }
+      } catch (error) {
+        if (controller.signal.aborted) return;
+      }
+      await new Promise((resolve) => setTimeout(resolve, retryMs));
+    }
+  };
+
+  connect();
+  return () => controller.abort();
+};
+
 export default api;
@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import { useAuth } from '../contexts/AuthContext';
-import { mentorAPI, matchRequestAPI, User } from '../api/api';
+import { mentorAPI, matchRequestAPI, User, subscribeMatchRequestEvents, thumbnailUrl } from '../api/api';
 import Navbar from '../components/Navbar';
 import {
   Container,
@@ -19,6 +19,9 @@ import {
 } from '@mui/material';
 import { Search } from '@mui/icons-material';
 
+// 멘토 카드 프로필 이미지 크기 (px)
+const AVATAR_SIZE = 80;
+
 const Mentors: React.FC = () => {
   const { user } = useAuth();
   const [mentors, setMentors] = useState<User[]>([]);
@@ -42,11 +45,11 @@ const Mentors: React.FC = () => {
 
   const fetchMyRequests = useCallback(async () => {
     try {
-      const response = await matchRequestAPI.getOutgoingRequests();
+      const outgoing = await matchRequestAPI.getAllOutgoingRequests();
       const requestMap: { [key: number]: { message: string; status: string } } = {};
       let pendingMentorId: number | null = null;
       
-      response.data.forEach(request => {
+      outgoing.forEach(request => {
         requestMap[request.mentorId] = {
           message: request.message,
           status: request.status,
@@ -69,6 +72,25 @@ const Mentors: React.FC = () => {
     fetchMyRequests();
   }, [fetchMentors, fetchMyRequests]);
 
+  // 보낸 요청의 상태 변경(수락/거절)을 바로 반영
+  useEffect(() => {
+    if (!user) return;
+    return subscribeMatchRequestEvents((type, changed) => {
+      if (type === 'reset' || !changed) {
+        fetchMyRequests();
+        return;
+      }
+      setRequests((current) => ({
+        ...current,
+        [changed.mentorId]: { message: changed.message, status: changed.status },
+      }));
+      setPendingRequest((current) => {
+        if (changed.status === 'pending') return changed.mentorId;
+        return current === changed.mentorId ? null : current;
+      });
+    });
+  }, [user, fetchMyRequests]);
+
   const handleSearch = (e: React.FormEvent) => {
     e.preventDefault();
     fetchMentors();
@@ -260,9 +282,9 @@ const MentorCard: React.FC<MentorCardProps> = ({
       <CardContent sx={{ flexGrow: 1 }}>
         <Box textAlign="center" mb={2}>
           <Avatar
-            src={mentor.profile.imageUrl}
+            src={thumbnailUrl(mentor.profile.imageUrl, AVATAR_SIZE)}
             alt={`${mentor.profile.name} 프로필`}
-            sx={{ width: 80, height: 80, margin: '0 auto', mb: 1 }}
+            sx={{ width: AVATAR_SIZE, height: AVATAR_SIZE, margin: '0 auto', mb: 1 }}
           />
           <Typography variant="h6" component="h3" gutterBottom>
             {mentor.profile.name}
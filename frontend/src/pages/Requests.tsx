@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import { useAuth } from '../contexts/AuthContext';
-import { matchRequestAPI, MatchRequest } from '../api/api';
+import { matchRequestAPI, MatchRequest, nextCursor as readNextCursor, subscribeMatchRequestEvents } from '../api/api';
 import Navbar from '../components/Navbar';
 import {
   Container,
@@ -19,27 +19,70 @@ const Requests: React.FC = () => {
   const { user } = useAuth();
   const [requests, setRequests] = useState<MatchRequest[]>([]);
   const [isLoading, setIsLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+
+  const fetchPage = useCallback((cursor?: string) => (
+    user?.role === 'mentor'
+      ? matchRequestAPI.getIncomingRequests('all', 100, 'counterpart', cursor)
+      : matchRequestAPI.getOutgoingRequests('all', 100, 'counterpart', cursor)
+  ), [user]);
 
   const fetchRequests = useCallback(async () => {
     if (!user) return;
     
     setIsLoading(true);
     try {
-      const response = user.role === 'mentor'
-        ? await matchRequestAPI.getIncomingRequests()
-        : await matchRequestAPI.getOutgoingRequests();
+      const response = await fetchPage();
       setRequests(response.data);
+      setNextCursor(readNextCursor(response));
     } catch (error) {
       console.error('요청 목록 조회 실패:', error);
     } finally {
       setIsLoading(false);
     }
-  }, [user]);
+  }, [user, fetchPage]);
+
+  // 다음 페이지(더 오래된 요청)를 이어 붙임 (SSE로 이미 받은 요청은 중복 제외)
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const response = await fetchPage(nextCursor);
+      setRequests((current) => {
+        const loaded = new Set(current.map((request) => request.id));
+        return [...current, ...response.data.filter((request) => !loaded.has(request.id))];
+      });
+      setNextCursor(readNextCursor(response));
+    } catch (error) {
+      console.error('요청 목록 조회 실패:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
 
   useEffect(() => {
     fetchRequests();
   }, [fetchRequests]);
 
+  // 요청 변경 이벤트를 받아 목록에 바로 반영 (reset이면 다시 조회)
+  useEffect(() => {
+    if (!user) return;
+    return subscribeMatchRequestEvents((type, changed) => {
+      if (type === 'reset' || !changed) {
+        fetchRequests();
+        return;
+      }
+      setRequests((current) => {
+        const rest = current.filter((request) => request.id !== changed.id);
+        const existing = current.find((request) => request.id === changed.id);
+        return existing
+          ? current.map((request) => (request.id === changed.id ? { ...existing, ...changed, counterpart: existing.counterpart } : request))
+          : [changed, ...rest];
+      });
+    });
+  }, [user, fetchRequests]);
+
   const handleAccept = async (requestId: number) => {
     try {
       await matchRequestAPI.acceptRequest(requestId);
@@ -130,6 +173,11 @@ const Requests: React.FC = () => {
                 getStatusText={getStatusText}
               />
             ))}
+            {nextCursor && (
+              <Button onClick={loadMore} variant="outlined" disabled={isLoadingMore}>
+                {isLoadingMore ? <CircularProgress size={24} /> : '더 보기'}
+              </Button>
+            )}
           </Box>
         )}
       </Container>
@@ -173,6 +221,12 @@ const RequestCard: React.FC<RequestCardProps> = ({
             <Typography variant="h6" component="h3" gutterBottom>
               {userRole === 'mentor' ? `멘티 ID: ${request.menteeId}` : `멘토 ID: ${request.mentorId}`}
             </Typography>
+            {request.counterpart && (
+              <Typography variant="body2" color="text.secondary" gutterBottom>
+                {request.counterpart.name}
+                {request.counterpart.skills.length > 0 && ` · ${request.counterpart.skills.join(', ')}`}
+              </Typography>
+            )}
             <Chip
               label={getStatusText(request.status)}
               color={getStatusSeverity(request.status)}